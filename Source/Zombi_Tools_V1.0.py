@@ -7,7 +7,7 @@ import time
 # AUTO-INSTALL DEPENDENCIES FIRST
 # ==============================================================================
 print("Checking dependencies...")
-PACKAGES = ['pymem', 'keyboard', 'psutil', 'pyautogui', 'pillow', 'pynput']
+PACKAGES = ['pymem', 'keyboard', 'psutil', 'pyautogui', 'pillow', 'pynput', 'numpy']
 for package in PACKAGES:
     try:
         if package == 'pillow':
@@ -47,10 +47,22 @@ elevate_to_admin()
 # Now import everything
 import tkinter as tk
 from tkinter import ttk
-from threading import Thread
+import threading
+from threading import Thread, Lock, Condition
 import itertools
 import math
 import io
+import struct
+import re
+import hashlib
+import bisect
+import heapq
+import mmap
+import zlib
+import base64
+from array import array
+from collections import deque, Counter
+from concurrent.futures import ThreadPoolExecutor
 
 # ==============================================================================
 # FINAL DEPENDENCY CHECK
@@ -62,12 +74,2141 @@ try:
     import keyboard
     import psutil
     import pyautogui
-    from PIL import Image, ImageDraw, ImageTk
+    from PIL import Image, ImageDraw, ImageTk, ImageGrab
     from pynput import mouse
+    import numpy as np
 except ImportError as e:
     print(f"Error: {e}")
     sys.exit()
 
+# ==============================================================================
+# KEYPAD RESUME JOURNAL
+# ==============================================================================
+class KeypadJournal:
+    """Append-only attempt log next to keypad_resume.txt - one "code|location" line per attempt"""
+    # append() only buffers - the persistence worker commit()s, save_keypad_resume compacts and truncates
+    def __init__(self, path):
+        self.path = path
+        self.handle = None
+        self.buffer = []
+        self.records = 0
+        self.lock = Lock()  # Guards buffer/records (taken by the clicker)
+        self.io_lock = Lock()  # Guards the file handle (taken by the writer)
+
+    def append(self, code, location):
+        """Buffer one attempt record and return the number of uncompacted records"""
+        with self.lock:
+            self.buffer.append(f"{code}|{location}\n")
+            self.records += 1
+            return self.records
+
+    def commit(self):
+        """Write all buffered records with a single write + flush"""
+        with self.lock:
+            lines, self.buffer = self.buffer, []
+        if not lines:
+            return
+        with self.io_lock:
+            if self.handle is None:
+                self.handle = open(self.path, 'a', encoding='utf-8')
+            self.handle.write(''.join(lines))
+            # Flush to the OS only - a crash of this app loses nothing, and
+            # compaction does the fsync so the hot loop never waits on disk
+            self.handle.flush()
+
+    def replay(self):
+        """Return all complete (code, location) records in write order"""
+        entries = []
+        with self.io_lock:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    lines = f.readlines()
+            else:
+                lines = []
+        with self.lock:
+            lines += self.buffer
+            for line in lines:
+                # Skip a torn last line left behind by a crash mid-write
+                if not line.endswith('\n') or '|' not in line:
+                    continue
+                code, location = line.strip().split('|', 1)
+                if code:
+                    entries.append((code, location))
+            self.records = len(entries)
+        return entries
+
+    def truncate(self):
+        """Drop committed records once they are compacted - buffered ones are kept"""
+        with self.io_lock:
+            self._close_handle()
+            with open(self.path, 'w', encoding='utf-8'):
+                pass
+        with self.lock:
+            self.records = len(self.buffer)
+
+    def remove(self):
+        with self.io_lock:
+            self._close_handle()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        with self.lock:
+            self.buffer = []
+            self.records = 0
+
+    def close(self):
+        with self.io_lock:
+            self._close_handle()
+
+    def _close_handle(self):
+        if self.handle is not None:
+            try:
+                self.handle.close()
+            except:
+                pass
+            self.handle = None
+
+# ==============================================================================
+# PERSISTENCE WORKER
+# ==============================================================================
+class PersistenceWorker:
+    """Write-behind thread that owns every settings/resume file write"""
+    # Writers with the same key are merged, so each file is written at most once per commit;
+    # flush() returns once everything submitted before it is on disk
+    def __init__(self, interval=1.0, max_pending=32):
+        self.interval = interval
+        self.max_pending = max_pending
+        self.pending = {}  # key -> writer, latest wins until the next commit
+        self.cond = Condition()
+        self.flush_requested = 0
+        self.flush_done = 0
+        self.running = True
+        self.thread = Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, key, writer):
+        with self.cond:
+            if not self.running:
+                run_now = True
+            else:
+                run_now = False
+                # Bounded queue - block the producer until the writer drains
+                while (len(self.pending) >= self.max_pending and key not in self.pending
+                       and self.running):
+                    self.cond.wait(0.05)
+                self.pending[key] = writer
+                self.cond.notify_all()
+        if run_now:
+            self._commit({key: writer})
+
+    def flush(self, timeout=5.0):
+        """Commit everything pending now and wait for it - returns False on timeout"""
+        with self.cond:
+            if not self.thread.is_alive():
+                batch, self.pending = self.pending, {}
+            else:
+                self.flush_requested += 1
+                target = self.flush_requested
+                self.cond.notify_all()
+                deadline = time.monotonic() + timeout
+                while self.flush_done < target:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self.cond.wait(remaining)
+                return True
+        self._commit(batch)
+        return True
+
+    def stop(self):
+        """Commit whatever is pending and end the worker thread"""
+        with self.cond:
+            self.running = False
+            self.cond.notify_all()
+        self.thread.join(timeout=5.0)
+
+    def _run(self):
+        last_commit = time.monotonic()
+        while True:
+            with self.cond:
+                while self.running and self.flush_requested == self.flush_done:
+                    if self.pending:
+                        wait_for = self.interval - (time.monotonic() - last_commit)
+                        if wait_for <= 0:
+                            break
+                        self.cond.wait(wait_for)
+                    else:
+                        self.cond.wait()
+                batch, self.pending = self.pending, {}
+                target = self.flush_requested
+                stopping = not self.running
+                self.cond.notify_all()  # Wake producers blocked on a full queue
+            
+            self._commit(batch)
+            last_commit = time.monotonic()
+            
+            with self.cond:
+                self.flush_done = target
+                self.cond.notify_all()
+            if stopping:
+                return
+
+    def _commit(self, batch):
+        for key, writer in batch.items():
+            try:
+                writer()
+            except Exception as e:
+                print(f"DEBUG: Persistence write '{key}' failed: {e}")
+
+# ==============================================================================
+# TRIED-CODE INDEX
+# ==============================================================================
+class CodeSpace:
+    """Every keypad code of `length` characters from `alphabet`, ranked like base len(alphabet) numbers"""
+    # Iteration is lazy - 10^8 codes never exist in memory at once
+    MIN_LENGTH = 3
+    MAX_LENGTH = 8
+    DIGITS = '0123456789'
+
+    def __init__(self, length=4, alphabet=DIGITS):
+        alphabet = ''.join(dict.fromkeys(alphabet))  # Unique, order kept
+        if not self.MIN_LENGTH <= length <= self.MAX_LENGTH:
+            raise ValueError(f"Code length must be {self.MIN_LENGTH}-{self.MAX_LENGTH}")
+        if len(alphabet) < 2:
+            raise ValueError("Alphabet needs at least 2 characters")
+        self.length = length
+        self.alphabet = alphabet
+        self.base = len(alphabet)
+        self.size = self.base ** length
+        self.decimal = alphabet == self.DIGITS
+        self.ranks = {ch: i for i, ch in enumerate(alphabet)}
+
+    def index(self, code):
+        """Rank of code, or -1 if it is not in this space"""
+        if not code or len(code) != self.length:
+            return -1
+        if self.decimal:
+            return int(code) if code.isascii() and code.isdigit() else -1
+        index = 0
+        for ch in code:
+            rank = self.ranks.get(ch)
+            if rank is None:
+                return -1
+            index = index * self.base + rank
+        return index
+
+    def code(self, index):
+        if self.decimal:
+            return f"{index:0{self.length}d}"
+        chars = []
+        for _ in range(self.length):
+            index, rank = divmod(index, self.base)
+            chars.append(self.alphabet[rank])
+        return ''.join(reversed(chars))
+
+    def __contains__(self, code):
+        return self.index(code) >= 0
+
+    def __iter__(self):
+        if self.decimal:
+            return (f"{n:0{self.length}d}" for n in range(self.size))
+        return (''.join(chars) for chars in itertools.product(self.alphabet, repeat=self.length))
+
+    def __len__(self):
+        return self.size
+
+    def __eq__(self, other):
+        return isinstance(other, CodeSpace) and self.key() == other.key()
+
+    def key(self):
+        """Identity saved with resume data as length|alphabet"""
+        return f"{self.length}|{self.alphabet}"
+
+    def describe(self):
+        if self.decimal:
+            return f"{self.length} digits: 0-9"
+        return f"{self.length} of {self.alphabet}"
+
+POPCOUNT = bytes(bin(i).count('1') for i in range(256))
+
+class TriedCodeIndex:
+    """Bitmap with one bit per code in a CodeSpace - saved as the TRIED: line in keypad_resume.txt"""
+    # 8 digits is 10^8 bits, 12.5 MB
+    def __init__(self, space=None):
+        self.space = space or CodeSpace()
+        self.size = self.space.size
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _slot(self, code):
+        return self.space.index(code)
+
+    def add(self, code):
+        """Mark code as tried - returns True if it was not tried before"""
+        slot = self._slot(code)
+        if slot < 0:
+            return False
+        mask = 1 << (slot & 7)
+        if self.bits[slot >> 3] & mask:
+            return False
+        self.bits[slot >> 3] |= mask
+        self.count += 1
+        return True
+
+    def __contains__(self, code):
+        slot = self._slot(code)
+        return slot >= 0 and bool(self.bits[slot >> 3] & (1 << (slot & 7)))
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.bits = bytearray(len(self.bits))
+        self.count = 0
+
+    def dump(self):
+        """zlib-compressed bitmap as "z" + base64 - mostly-empty bitmaps shrink to almost nothing"""
+        return 'z' + base64.b64encode(zlib.compress(bytes(self.bits))).decode('ascii')
+
+    def load(self, text):
+        """Restore from dump() output (or the older plain hex) - ignored if the length does not match"""
+        text = text.strip()
+        try:
+            if text.startswith('z'):
+                bits = bytearray(zlib.decompress(base64.b64decode(text[1:])))
+            else:
+                bits = bytearray.fromhex(text)
+        except (zlib.error, ValueError):
+            return False
+        if len(bits) != len(self.bits):
+            return False
+        self.bits = bits
+        self.count = sum(bits.translate(POPCOUNT))
+        return True
+
+# ==============================================================================
+# CANDIDATE ORDERING
+# ==============================================================================
+class CandidateStrategy:
+    """Base class for lazy keypad candidate generators - codes outside the CodeSpace are dropped by CandidateEngine"""
+    name = 'base'
+
+    def __init__(self, space=None):
+        self.space = space or CodeSpace()
+
+    def candidates(self):
+        return iter(())
+
+class CommonCodeStrategy(CandidateStrategy):
+    """Classic game keypad codes the solver always tried first"""
+    name = 'common'
+    CODES = ['0451', '1984', '1337', '4815', '1234', '0000', '1111', '4321']
+
+    def candidates(self):
+        return iter(self.CODES)
+
+class FrequencyStrategy(CandidateStrategy):
+    """Most frequently chosen real-world PINs, most popular first"""
+    name = 'frequency'
+    CODES = ['1234', '1111', '0000', '1212', '7777', '1004', '2000', '4444',
+             '2222', '6969', '9999', '3333', '5555', '6666', '1122', '1313',
+             '8888', '4321', '2001', '1010', '2580']
+
+    def candidates(self):
+        return iter(self.CODES)
+
+class PatternStrategy(CandidateStrategy):
+    """Repeated digits, runs, keypad lines and pairs (AAAA, 1234, 2580, ABAB...)"""
+    name = 'patterns'
+
+    def candidates(self):
+        chars = self.space.alphabet
+        length = self.space.length
+        count = len(chars)
+        for a in chars:
+            yield a * length
+        for start in range(count):
+            yield ''.join(chars[(start + i) % count] for i in range(length))
+            yield ''.join(chars[(start - i) % count] for i in range(length))
+        for line in ('2580', '0852', '1470', '0741', '3690', '0963', '1590', '9510', '3570', '7530'):
+            yield line
+        half = length // 2
+        for a, b in itertools.permutations(chars, 2):
+            yield ((a + b) * length)[:length]
+            yield a * half + b * (length - half)
+            yield a + b * (length - 2) + a
+
+class DateStrategy(CandidateStrategy):
+    """Date-shaped codes - 4: YYYY/MMDD/DDMM, 6: MMDDYY/DDMMYY, 8: YYYYMMDD/MMDDYYYY/DDMMYYYY"""
+    name = 'dates'
+    DAYS_IN_MONTH = [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+    YEARS = range(2029, 1899, -1)
+
+    def _days(self):
+        for month in range(1, 13):
+            for day in range(1, self.DAYS_IN_MONTH[month - 1] + 1):
+                yield f"{month:02d}", f"{day:02d}"
+
+    def candidates(self):
+        length = self.space.length
+        if length == 4:
+            for year in self.YEARS:
+                yield f"{year:04d}"
+            for month, day in self._days():
+                yield month + day
+            for month, day in self._days():
+                yield day + month
+        elif length == 6:
+            for year in self.YEARS:
+                for month, day in self._days():
+                    yield f"{month}{day}{year % 100:02d}"
+            for year in self.YEARS:
+                for month, day in self._days():
+                    yield f"{day}{month}{year % 100:02d}"
+        elif length == 8:
+            for template in ("{y}{m}{d}", "{m}{d}{y}", "{d}{m}{y}"):
+                for year in self.YEARS:
+                    for month, day in self._days():
+                        yield template.format(y=f"{year:04d}", m=month, d=day)
+
+class WeightedListStrategy(CandidateStrategy):
+    """User supplied list from candidates.txt - one "code,weight" per line, heaviest first"""
+    name = 'weighted'
+
+    def __init__(self, path, space=None):
+        super().__init__(space)
+        self.path = path
+
+    def candidates(self):
+        entries = []
+        try:
+            with open(self.path, 'r') as f:
+                for order, line in enumerate(f):
+                    line = line.strip()
+                    if not line or line.startswith('#'):
+                        continue
+                    code, _, weight = line.partition(',')
+                    try:
+                        weight = float(weight) if weight.strip() else 1.0
+                    except ValueError:
+                        weight = 1.0
+                    entries.append((-weight, order, code.strip()))
+        except OSError:
+            return iter(())
+        entries.sort()
+        return (code for _, _, code in entries)
+
+class NumericStrategy(CandidateStrategy):
+    """Every code in rank order (0000 -> 9999 for 4 digits), generated lazily"""
+    name = 'numeric'
+
+    def candidates(self):
+        return iter(self.space)
+
+class CodeConstraints:
+    """What is already known about the code, e.g. "1??7 -0 unique", compiled into a pruned enumeration"""
+    # Terms: 1??7 pattern (? unknown), +1237 only these characters, -05 never these,
+    # =137 contains these (repeats count), unique no repeats.
+    # Enumeration cuts branches that can no longer fit the required characters and
+    # yields codes in CodeSpace rank order
+    def __init__(self, space, text=''):
+        self.space = space
+        self.text = ' '.join(text.split())
+        pattern = None
+        allowed = set(space.alphabet)
+        required = Counter()
+        self.distinct = False
+        for term in self.text.split():
+            if term.lower() in ('unique', 'distinct', 'norepeat'):
+                self.distinct = True
+            elif term[0] in '+-=' and len(term) > 1:
+                chars = term[1:]
+                unknown = [ch for ch in chars if ch not in space.ranks]
+                if unknown:
+                    raise ValueError(f"'{''.join(unknown)}' not on the keypad")
+                if term[0] == '+':
+                    allowed &= set(chars)
+                elif term[0] == '-':
+                    allowed -= set(chars)
+                else:
+                    required.update(chars)
+            elif len(term) == space.length and all(ch == '?' or ch in space.ranks for ch in term):
+                pattern = term
+            else:
+                raise ValueError(f"Unknown constraint: {term}")
+        self.positions = []
+        for i in range(space.length):
+            if pattern and pattern[i] != '?':
+                self.positions.append([pattern[i]] if pattern[i] in allowed else [])
+            else:
+                self.positions.append([ch for ch in space.alphabet if ch in allowed])
+        self.required = list(required.items())
+        self.position_sets = [set(chars) for chars in self.positions]
+        self.active = bool(self.text)
+
+    def matches(self, code):
+        if not self.active:
+            return code in self.space
+        if len(code) != self.space.length:
+            return False
+        for ch, chars in zip(code, self.position_sets):
+            if ch not in chars:
+                return False
+        if self.distinct and len(set(code)) != len(code):
+            return False
+        counts = Counter(code)
+        return all(counts[ch] >= needed for ch, needed in self.required)
+
+    def _simple(self):
+        return not self.distinct and not self.required
+
+    def enumerate(self):
+        """Every matching code, lazily, in rank order"""
+        if not self.active:
+            return iter(self.space)
+        if self._simple():
+            return (''.join(chars) for chars in itertools.product(*self.positions))
+        return self._walk(0, [], tuple(needed for _, needed in self.required), frozenset())
+
+    def _walk(self, position, prefix, missing, used):
+        if sum(missing) > self.space.length - position:
+            return
+        if position == self.space.length:
+            yield ''.join(prefix)
+            return
+        required = [ch for ch, _ in self.required]
+        for ch in self.positions[position]:
+            if self.distinct and ch in used:
+                continue
+            left = missing
+            if ch in required:
+                index = required.index(ch)
+                if missing[index]:
+                    left = missing[:index] + (missing[index] - 1,) + missing[index + 1:]
+            prefix.append(ch)
+            yield from self._walk(position + 1, prefix, left, used | {ch} if self.distinct else used)
+            prefix.pop()
+
+    def count(self):
+        """Number of matching codes - counted without enumerating them"""
+        if not self.active:
+            return self.space.size
+        if self._simple():
+            return math.prod(len(chars) for chars in self.positions)
+        required = [ch for ch, _ in self.required]
+        memo = {}
+
+        def walk(position, missing, used):
+            if sum(missing) > self.space.length - position:
+                return 0
+            if position == self.space.length:
+                return 1
+            state = (position, missing, used)
+            if state in memo:
+                return memo[state]
+            total = 0
+            for ch in self.positions[position]:
+                if self.distinct and ch in used:
+                    continue
+                left = missing
+                if ch in required:
+                    index = required.index(ch)
+                    if missing[index]:
+                        left = missing[:index] + (missing[index] - 1,) + missing[index + 1:]
+                total += walk(position + 1, left, used | {ch} if self.distinct else used)
+            memo[state] = total
+            return total
+        return walk(0, tuple(needed for _, needed in self.required), frozenset())
+
+class CodePrior:
+    """Per-position character model (Laplace-smoothed) learned from codes that opened doors before"""
+    # best() walks the per-position rankings best-first, so it never scores the whole space
+    def __init__(self, space, codes=()):
+        self.space = space
+        counts = [Counter() for _ in range(space.length)]
+        self.samples = 0
+        for code in codes:
+            if code in space:
+                self.samples += 1
+                for position, ch in enumerate(code):
+                    counts[position][ch] += 1
+        self.ranked = []  # Per position: [(probability, ch), ...] most likely first
+        for position in range(space.length):
+            total = self.samples + space.base
+            probs = [((counts[position][ch] + 1) / total, ch) for ch in space.alphabet]
+            probs.sort(key=lambda item: -item[0])
+            self.ranked.append(probs)
+
+    def best(self, limit):
+        """Up to limit codes, most probable first"""
+        if not self.samples:
+            return
+        start = (0,) * self.space.length
+        heap = [(-self._score(start), start)]
+        seen = {start}
+        produced = 0
+        while heap and produced < limit:
+            _, ranks = heapq.heappop(heap)
+            yield ''.join(self.ranked[position][rank][1] for position, rank in enumerate(ranks))
+            produced += 1
+            for position in range(self.space.length):
+                if ranks[position] + 1 < self.space.base:
+                    following = ranks[:position] + (ranks[position] + 1,) + ranks[position + 1:]
+                    if following not in seen:
+                        seen.add(following)
+                        heapq.heappush(heap, (-self._score(following), following))
+
+    def _score(self, ranks):
+        result = 1.0
+        for position, rank in enumerate(ranks):
+            result *= self.ranked[position][rank][0]
+        return result
+
+class LearnedStrategy(CandidateStrategy):
+    """Codes that worked before - this location's first, then other successes, known codes and the CodePrior top"""
+    name = 'learned'
+    MODEL_LIMIT = 500
+
+    def __init__(self, space=None, successes=(), known=(), location=''):
+        super().__init__(space)
+        self.successes = list(successes)  # (code, location)
+        self.known = list(known)  # (location, code)
+        self.location = location.strip().lower()
+
+    def has_data(self):
+        return bool(self.successes or self.known)
+
+    def candidates(self):
+        here = self.location
+        for location, code in self.known:
+            if here and location.lower() == here:
+                yield code
+        for code, location in reversed(self.successes):
+            if here and location.lower() == here:
+                yield code
+        frequency = Counter(code for code, _ in self.successes)
+        recency = {code: i for i, (code, _) in enumerate(self.successes)}
+        for code in sorted(frequency, key=lambda c: (-frequency[c], -recency[c])):
+            yield code
+        for _, code in self.known:
+            yield code
+        prior = CodePrior(self.space, [code for code, _ in self.successes] + [code for _, code in self.known])
+        yield from prior.best(self.MODEL_LIMIT)
+
+class KnownCodeIndex:
+    """Sorted prefix index over (location, code) entries - a search is two bisects plus the matches"""
+    def __init__(self, entries=()):
+        self.entries = list(dict.fromkeys(entries))
+        keys = []
+        for index, (location, code) in enumerate(self.entries):
+            words = set(re.findall(r'\w+', location.lower()))
+            words.add(location.lower())
+            words.add(code.lower())
+            keys.extend((word, index) for word in words if word)
+        keys.sort()
+        self.keys = [key for key, _ in keys]
+        self.owners = [index for _, index in keys]
+
+    def __len__(self):
+        return len(self.entries)
+
+    def search(self, prefix, limit=8):
+        """(location, code) entries with a location word, location or code starting with prefix"""
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        start = bisect.bisect_left(self.keys, prefix)
+        found = []
+        for position in range(start, len(self.keys)):
+            if not self.keys[position].startswith(prefix):
+                break
+            index = self.owners[position]
+            if index not in found:
+                found.append(index)
+                if len(found) >= limit:
+                    break
+        return [self.entries[index] for index in sorted(found)]
+
+class CandidateEngine:
+    """Merges strategies in priority order into one duplicate-free candidate stream"""
+    STRATEGIES = {
+        'common': CommonCodeStrategy,
+        'frequency': FrequencyStrategy,
+        'patterns': PatternStrategy,
+        'dates': DateStrategy,
+        'numeric': NumericStrategy,
+    }
+    DEFAULT_SPEC = 'common,weighted,frequency,patterns,dates,numeric'
+
+    def __init__(self, spec, app_folder, space=None, constraints=None, learned=None):
+        self.space = space or CodeSpace()
+        self.constraints = constraints or CodeConstraints(self.space)
+        names = [n.strip().lower() for n in spec.split(',') if n.strip()]
+        names = [n for n in names if n in self.STRATEGIES or n == 'weighted']
+        # numeric always runs last so every code is still covered
+        names = [n for n in names if n != 'numeric'] + ['numeric']
+        self.strategies = []
+        if learned is not None and learned.has_data():
+            self.strategies.append(learned)  # Known doors open on the first attempt
+        for name in dict.fromkeys(names):
+            if name == 'weighted':
+                self.strategies.append(WeightedListStrategy(os.path.join(app_folder, 'candidates.txt'), self.space))
+            else:
+                self.strategies.append(self.STRATEGIES[name](self.space))
+
+    def candidates(self):
+        """Yield each code once, in strategy order"""
+        # With constraints, strategy codes that break them are dropped and the
+        # final numeric pass becomes the pruned enumeration
+        seen = TriedCodeIndex(self.space)
+        constraints = self.constraints
+        for strategy in self.strategies:
+            if isinstance(strategy, NumericStrategy):
+                codes = constraints.enumerate()
+            elif constraints.active:
+                codes = (code for code in strategy.candidates() if constraints.matches(code))
+            else:
+                codes = strategy.candidates()
+            for code in codes:
+                if seen.add(code):
+                    yield code
+
+# ==============================================================================
+# CLICK PLAN
+# ==============================================================================
+class ClickPlan:
+    """The 12 calibrated circles compiled once into flat (x, y, action, delay) click events"""
+    # Positions are validated here, so the clicker walks the tuples without per-click checks
+    MOVE, DOWN, UP = 0, 1, 2
+    ENTER = 10  # Circle order: 1-9, 0, ENTER, CLEAR
+    CLEAR = 11
+    MOVE_SETTLE = 0.005  # Pause after moving onto a button
+    PRESS_HOLD = 0.02  # How long the button is held down
+
+    def __init__(self, positions, click_delay, enter_delay, settle=MOVE_SETTLE, hold=PRESS_HOLD):
+        if not positions or len(positions) < 12:
+            raise ValueError(f"⚠ Place 12 circles first! Current: {len(positions) if positions else 0}")
+        invalid_positions = []
+        for i, pos in enumerate(positions[:12]):
+            if pos is None or len(pos) < 2 or pos[0] is None or pos[1] is None:
+                invalid_positions.append(i)
+        if invalid_positions:
+            raise ValueError(f"⚠ Invalid circle positions: {invalid_positions}. Place circles again!")
+        
+        self.positions = [(int(pos[0]), int(pos[1])) for pos in positions[:12]]
+        self.click_delay = click_delay
+        self.enter_delay = enter_delay
+        self.settle = settle
+        self.hold = hold
+        # Index = digit value, circle 9 is the 0 button
+        self.digit_events = [self._press(self.positions[(d - 1) % 10], click_delay) for d in range(10)]
+        self.enter_events = self._press(self.positions[self.ENTER], enter_delay)
+        self.clear_events = self._press(self.positions[self.CLEAR], click_delay)
+
+    def _press(self, pos, delay):
+        x, y = pos
+        return ((x, y, self.MOVE, self.settle),
+                (x, y, self.DOWN, self.hold),
+                (x, y, self.UP, delay))
+
+    def compile(self, code):
+        """Flat event tuple for one code followed by ENTER"""
+        digit_events = self.digit_events
+        events = []
+        for ch in code:
+            events.extend(digit_events[ord(ch) - 48])
+        events.extend(self.enter_events)
+        return tuple(events)
+
+    def compile_clear(self, shown):
+        """Events that empty the display - one CLEAR press whatever it shows"""
+        return self.clear_events
+
+    def compile_digits(self, code):
+        """Events for the digits only - input verification reads the display before ENTER"""
+        digit_events = self.digit_events
+        events = []
+        for ch in code:
+            events.extend(digit_events[ord(ch) - 48])
+        return tuple(events)
+
+    def with_delays(self, click_delay, enter_delay):
+        """Same calibrated positions, new pacing"""
+        return ClickPlan(self.positions, click_delay, enter_delay, self.settle, self.hold)
+
+class KeyPlan:
+    """Keyboard counterpart of ClickPlan - (key, 0, action, delay) events for KeyboardBackend"""
+    # click_delay/enter_delay keep ClickPlan's names so the adaptive pacer drives either plan.
+    # A bad entry is cleared with one Backspace per character shown, never by submitting it
+    KEY_DOWN, KEY_UP = 3, 4
+    KEY_HOLD = 0.01  # How long a key is held down
+
+    def __init__(self, key_delay, enter_delay, hold=KEY_HOLD, enter_key='enter', clear_key='backspace'):
+        self.click_delay = key_delay
+        self.enter_delay = enter_delay
+        self.hold = hold
+        self.enter_key = enter_key
+        self.clear_key = clear_key
+        self.key_events = {}  # char -> (down, up), built on first use
+        self.enter_events = self._press(enter_key, enter_delay)
+        self.erase_events = self._press(clear_key, key_delay)
+
+    def _press(self, key, delay):
+        return ((key, 0, self.KEY_DOWN, self.hold),
+                (key, 0, self.KEY_UP, delay))
+
+    def compile(self, code):
+        """Flat event tuple for one code followed by ENTER"""
+        return self.compile_digits(code) + self.enter_events
+
+    def compile_digits(self, code):
+        """Events for the characters only - input verification reads the display before ENTER"""
+        key_events = self.key_events
+        events = []
+        for ch in code:
+            pressed = key_events.get(ch)
+            if pressed is None:
+                pressed = key_events[ch] = self._press(ch.lower(), self.click_delay)
+            events.extend(pressed)
+        return tuple(events)
+
+    def with_delays(self, click_delay, enter_delay):
+        """Same keys, new pacing"""
+        return KeyPlan(click_delay, enter_delay, self.hold, self.enter_key, self.clear_key)
+
+    def compile_clear(self, shown):
+        """Events that empty the display - one Backspace per character it shows"""
+        return self.erase_events * len(shown)
+
+# ==============================================================================
+# DEADLINE SCHEDULER
+# ==============================================================================
+class DeadlineScheduler:
+    """Absolute perf_counter deadlines for input events so sleep overshoot never adds up"""
+    # Each deadline moves on from the previous one, not from now, so send time and oversleep
+    # come out of the next gap. Waits sleep until `spin` before the deadline and busy-wait the rest.
+    # Falling more than `resync` behind restarts the schedule instead of bursting catch-up events
+    SPIN = 0.002
+    RESYNC = 0.05
+    SLICE = 0.001  # Sleep step while a cancel event is watched
+
+    def __init__(self, spin=SPIN, resync=RESYNC, samples=4096, cancel=None):
+        self.spin = spin
+        self.resync = resync
+        self.cancel = cancel  # threading.Event
+        self.deadline = None
+        self.lateness = deque(maxlen=samples)  # Seconds woken past each deadline
+        self.resyncs = 0
+
+    def reset(self):
+        """Start a fresh schedule from the next wait"""
+        self.deadline = None
+
+    def wait(self, delay):
+        """Wait for the next deadline - False if the cancel event fired first"""
+        now = time.perf_counter()
+        deadline = self.deadline
+        if deadline is None or now - deadline > self.resync:
+            if deadline is not None:
+                self.resyncs += 1
+            deadline = now
+        deadline += delay
+        self.deadline = deadline
+        remaining = deadline - now
+        cancel = self.cancel
+        if cancel is None:
+            if remaining > self.spin:
+                time.sleep(remaining - self.spin)
+            while time.perf_counter() < deadline:
+                pass
+        else:
+            # Event.wait timeouts follow the ~15.6 ms Windows tick, time.sleep is high-resolution
+            # (3.11+) - so sleep in short slices and look at the event between them
+            sleep_until = deadline - self.spin
+            while True:
+                if cancel.is_set():
+                    return False
+                left = sleep_until - time.perf_counter()
+                if left <= 0:
+                    break
+                time.sleep(min(left, self.SLICE))
+            while time.perf_counter() < deadline:
+                if cancel.is_set():
+                    return False
+        self.lateness.append(time.perf_counter() - deadline)
+        return True
+
+    def stats(self):
+        """Jitter in milliseconds - count, mean, p50, p99, max - plus the resync count"""
+        samples = sorted(self.lateness)
+        n = len(samples)
+        if not n:
+            return {'count': 0, 'resyncs': self.resyncs}
+        return {'count': n, 'mean': sum(samples) / n * 1000, 'p50': samples[n // 2] * 1000,
+                'p99': samples[min(n - 1, int(n * 0.99))] * 1000, 'max': samples[-1] * 1000,
+                'resyncs': self.resyncs}
+
+    def report(self):
+        s = self.stats()
+        if not s['count']:
+            return "no timed events"
+        return (f"jitter mean {s['mean']:.3f} ms, p99 {s['p99']:.3f} ms, max {s['max']:.3f} ms "
+                f"over {s['count']} waits ({s['resyncs']} resyncs)")
+
+# ==============================================================================
+# INPUT BACKENDS
+# ==============================================================================
+ULONG_PTR = ctypes.c_size_t
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [("dx", ctypes.c_long), ("dy", ctypes.c_long), ("mouseData", ctypes.c_ulong),
+                ("dwFlags", ctypes.c_ulong), ("time", ctypes.c_ulong), ("dwExtraInfo", ULONG_PTR)]
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [("wVk", ctypes.c_ushort), ("wScan", ctypes.c_ushort), ("dwFlags", ctypes.c_ulong),
+                ("time", ctypes.c_ulong), ("dwExtraInfo", ULONG_PTR)]
+
+class _HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [("uMsg", ctypes.c_ulong), ("wParamL", ctypes.c_ushort), ("wParamH", ctypes.c_ushort)]
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT), ("hi", _HARDWAREINPUT)]
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong), ("u", _INPUTUNION)]
+
+class InputBackend:
+    """Injects ClickPlan events - (x, y, action, delay) tuples - into the game"""
+    name = 'base'
+    scheduler = None  # DeadlineScheduler, created on the first wait
+
+    def wait(self, delay):
+        """Hold an event's delay on the deadline schedule - False if cancelled"""
+        scheduler = self.scheduler
+        if scheduler is None:
+            scheduler = self.scheduler = DeadlineScheduler()
+        return scheduler.wait(delay)
+
+    def restart(self):
+        """Schedule the following events from now, not from the previous run"""
+        if self.scheduler is not None:
+            self.scheduler.reset()
+
+    def run(self, events, should_continue):
+        """Send events in order, waiting out each event's delay afterwards - returns False if stopped"""
+        # A stop is checked before every press and a cancelled wait releases the button at once
+        raise NotImplementedError
+
+class PyAutoGuiBackend(InputBackend):
+    """One pyautogui call per event - the process-wide PAUSE is disabled for the run and restored after"""
+    name = 'pyautogui'
+
+    def __init__(self, pause=0.0):
+        self.pause = pause  # None keeps pyautogui.PAUSE as it is (0.1s after every call)
+
+    def run(self, events, should_continue):
+        self.restart()
+        if self.pause is None:
+            return self._run(events, should_continue)
+        previous = pyautogui.PAUSE
+        pyautogui.PAUSE = self.pause
+        try:
+            return self._run(events, should_continue)
+        finally:
+            pyautogui.PAUSE = previous
+
+    def _run(self, events, should_continue):
+        for x, y, action, delay in events:
+            if action == ClickPlan.MOVE:
+                if not should_continue():
+                    return False
+                pyautogui.moveTo(x, y, duration=0)
+            elif action == ClickPlan.DOWN:
+                pyautogui.mouseDown(x, y)
+            else:
+                pyautogui.mouseUp(x, y)
+            if delay > 0 and not self.wait(delay):
+                if action == ClickPlan.DOWN:
+                    pyautogui.mouseUp(x, y)
+                return False
+        return True
+
+class SendInputBackend(InputBackend):
+    """Native user32.SendInput injection - each run of zero-delay events goes out in one call"""
+    name = 'sendinput'
+    INPUT_MOUSE = 0
+    MOUSEEVENTF_MOVE = 0x0001
+    MOUSEEVENTF_LEFTDOWN = 0x0002
+    MOUSEEVENTF_LEFTUP = 0x0004
+    MOUSEEVENTF_ABSOLUTE = 0x8000
+
+    def __init__(self):
+        self.user32 = ctypes.windll.user32  # AttributeError off Windows
+        self.screen_w = max(2, self.user32.GetSystemMetrics(0))
+        self.screen_h = max(2, self.user32.GetSystemMetrics(1))
+        self.input_size = ctypes.sizeof(_INPUT)
+        self.cache = {}  # (x, y, action) -> prebuilt _INPUT
+
+    def _input(self, x, y, action):
+        key = (x, y, action)
+        item = self.cache.get(key)
+        if item is None:
+            flags = self.MOUSEEVENTF_ABSOLUTE | (
+                self.MOUSEEVENTF_MOVE if action == ClickPlan.MOVE else
+                self.MOUSEEVENTF_LEFTDOWN if action == ClickPlan.DOWN else
+                self.MOUSEEVENTF_LEFTUP)
+            item = _INPUT(type=self.INPUT_MOUSE)
+            # Absolute coordinates are normalized to 0-65535 over the primary screen
+            item.u.mi = _MOUSEINPUT(x * 65535 // (self.screen_w - 1), y * 65535 // (self.screen_h - 1),
+                                    0, flags, 0, 0)
+            self.cache[key] = item
+        return item
+
+    def _send(self, batch):
+        """Inject batch - False when SendInput took fewer events than given (blocked input, UIPI)"""
+        if not batch:
+            return True
+        sent = self.user32.SendInput(len(batch), (_INPUT * len(batch))(*batch), self.input_size)
+        if sent != len(batch):
+            print(f"[ERROR] SendInput injected {sent} of {len(batch)} events")
+            return False
+        return True
+
+    def _abort(self, x, y):
+        """A batch went in short - release the button in case its UP was the part dropped"""
+        self._send([self._input(x, y, ClickPlan.UP)])
+        return False
+
+    def run(self, events, should_continue):
+        self.restart()
+        batch = []
+        for x, y, action, delay in events:
+            if action == ClickPlan.MOVE and not should_continue():
+                self._send(batch)  # Finish the press already in flight
+                return False
+            batch.append(self._input(x, y, action))
+            if delay > 0:
+                if not self._send(batch):
+                    return self._abort(x, y)
+                batch = []
+                if not self.wait(delay):
+                    if action == ClickPlan.DOWN:
+                        self._send([self._input(x, y, ClickPlan.UP)])
+                    return False
+        if not self._send(batch):
+            return self._abort(x, y)
+        return True
+
+class RecordingInputBackend(InputBackend):
+    """Stand-in backend that only records events - for tests and benchmarks off Windows"""
+    name = 'recording'
+
+    def __init__(self, sleep=False):
+        self.sleep = sleep
+        self.events = []  # (perf_counter, x, y, action)
+
+    def run(self, events, should_continue):
+        self.restart()
+        for x, y, action, delay in events:
+            if action in (ClickPlan.MOVE, KeyPlan.KEY_DOWN) and not should_continue():
+                return False
+            self.events.append((time.perf_counter(), x, y, action))
+            if self.sleep and delay > 0 and not self.wait(delay):
+                if action in (ClickPlan.DOWN, KeyPlan.KEY_DOWN):
+                    release = ClickPlan.UP if action == ClickPlan.DOWN else KeyPlan.KEY_UP
+                    self.events.append((time.perf_counter(), x, y, release))
+                return False
+        return True
+
+class KeyboardBackend(InputBackend):
+    """Types KeyPlan events with the keyboard module - no calibration, no mouse moves"""
+    name = 'keyboard'
+
+    def run(self, events, should_continue):
+        self.restart()
+        for key, _, action, delay in events:
+            if action == KeyPlan.KEY_DOWN:
+                if not should_continue():
+                    return False
+                keyboard.press(key)
+            else:
+                keyboard.release(key)
+            if delay > 0 and not self.wait(delay):
+                if action == KeyPlan.KEY_DOWN:
+                    keyboard.release(key)
+                return False
+        return True
+
+def make_input_backend(name):
+    """Build the backend named in settings.txt, falling back to pyautogui off Windows"""
+    # RecordingInputBackend is never offered here - it injects nothing, so a sweep would mark every code tried
+    if name == 'sendinput':
+        try:
+            return SendInputBackend()
+        except (AttributeError, OSError) as e:
+            print(f"DEBUG: SendInput unavailable ({e}), using pyautogui")
+    return PyAutoGuiBackend()
+
+def benchmark_input_backends(positions, click_delay, enter_delay, settle, hold, codes=20):
+    """Measure achieved codes/second for every available backend - presses become plain moves, nothing is clicked"""
+    plan = ClickPlan(positions, click_delay, enter_delay, settle, hold)
+    sweep = [tuple((x, y, ClickPlan.MOVE, delay) for x, y, _, delay in plan.compile(f"{n:04d}"))
+             for n in range(codes)]
+    backends = [('recording', RecordingInputBackend(sleep=True)),
+                ('pyautogui (PAUSE=0.1)', PyAutoGuiBackend(pause=None)),
+                ('pyautogui (PAUSE=0)', PyAutoGuiBackend(pause=0.0))]
+    try:
+        backends.append(('sendinput', SendInputBackend()))
+    except (AttributeError, OSError):
+        pass
+    
+    results = {}
+    code_time = sum(delay for _, _, _, delay in sweep[0])
+    nominal = 1 / code_time if code_time > 0 else float('inf')
+    print(f"[BENCH] {'nominal':<24} {nominal:8.2f} codes/s")
+    original_pause = pyautogui.PAUSE
+    try:
+        for label, backend in backends:
+            start = time.perf_counter()
+            for events in sweep:
+                backend.run(events, lambda: True)
+            elapsed = time.perf_counter() - start
+            results[label] = codes / elapsed if elapsed > 0 else float('inf')
+            timing = backend.scheduler.report() if backend.scheduler else "no timed events"
+            print(f"[BENCH] {label:<24} {results[label]:8.2f} codes/s - {timing}")
+    finally:
+        pyautogui.PAUSE = original_pause
+    return results
+
+# ==============================================================================
+# ADAPTIVE PACING
+# ==============================================================================
+class AdaptivePacer:
+    """AIMD controller for click_delay/enter_delay"""
+    # A clean `window` of attempts shrinks the delays by `step`, a drop multiplies them by `backoff`.
+    # The last values that survived a full window are written back to settings.txt. Without input
+    # verification or a feedback source it is never fed, so the delays stay fixed
+    def __init__(self, click_delay, enter_delay, min_delay=0.005, max_delay=0.25,
+                 step=0.002, backoff=1.5, window=20):
+        self.click_delay = click_delay
+        self.enter_delay = enter_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.step = step
+        self.backoff = backoff
+        self.window = window
+        self.streak = 0
+        self.accepted = 0
+        self.dropped = 0
+        self.converged = None  # (click_delay, enter_delay) that survived a clean window
+
+    def _clamp(self, value):
+        return min(self.max_delay, max(self.min_delay, value))
+
+    def record(self, accepted):
+        """Feed one attempt result - returns True when the delays changed"""
+        if accepted:
+            self.accepted += 1
+            self.streak += 1
+            if self.streak < self.window:
+                return False
+            self.streak = 0
+            self.converged = (self.click_delay, self.enter_delay)
+            click_delay = self._clamp(self.click_delay - self.step)
+            enter_delay = self._clamp(self.enter_delay - self.step)
+        else:
+            self.dropped += 1
+            self.streak = 0
+            click_delay = self._clamp(self.click_delay * self.backoff)
+            enter_delay = self._clamp(self.enter_delay * self.backoff)
+        changed = (click_delay, enter_delay) != (self.click_delay, self.enter_delay)
+        self.click_delay, self.enter_delay = click_delay, enter_delay
+        return changed
+
+# ==============================================================================
+# PROCESS MEMORY
+# ==============================================================================
+VALUE_TYPES = {
+    'byte': ('<B', 1),
+    'short': ('<h', 2),
+    'int': ('<i', 4),
+    'uint': ('<I', 4),
+    'float': ('<f', 4),
+    'double': ('<d', 8),
+}
+
+MEM_COMMIT = 0x1000
+PAGE_NOACCESS = 0x01
+PAGE_GUARD = 0x100
+
+class _MEMORY_BASIC_INFORMATION(ctypes.Structure):
+    _fields_ = [("BaseAddress", ctypes.c_void_p), ("AllocationBase", ctypes.c_void_p),
+                ("AllocationProtect", ctypes.c_ulong), ("RegionSize", ctypes.c_size_t),
+                ("State", ctypes.c_ulong), ("Protect", ctypes.c_ulong), ("Type", ctypes.c_ulong)]
+
+class ProcessMemory:
+    """Thin reader over a pymem.Pymem handle - memory features only talk to this"""
+    MODULE_RECHECK = 2.0  # Seconds a module lookup is trusted before asking Windows again
+
+    def __init__(self, pm):
+        self.pm = pm
+        self.module_cache = {}  # lower name -> (base, size, checked_at)
+        # ZombiU is a 32-bit game - pymem flags it as WoW64 on 64-bit Windows
+        self.pointer_size = 4 if getattr(pm, 'is_WoW64', False) else 8
+        self.kernel32 = None
+        if hasattr(ctypes, 'WinDLL'):
+            # Own handle so the argtypes below don't leak into other ctypes users
+            self.kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            self.kernel32.VirtualQueryEx.argtypes = [ctypes.c_void_p, ctypes.c_void_p,
+                                                     ctypes.POINTER(_MEMORY_BASIC_INFORMATION), ctypes.c_size_t]
+            self.kernel32.VirtualQueryEx.restype = ctypes.c_size_t
+            self.kernel32.ReadProcessMemory.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p,
+                                                        ctypes.c_size_t, ctypes.POINTER(ctypes.c_size_t)]
+            self.kernel32.ReadProcessMemory.restype = ctypes.c_int
+
+    @property
+    def base_address(self):
+        return self.pm.base_address
+
+    def read(self, address, size):
+        return self.pm.read_bytes(address, size)
+
+    def read_into(self, address, buffer, size):
+        """Read size bytes straight into a writable buffer (no intermediate bytes object)"""
+        if not self.kernel32:
+            buffer[:size] = self.read(address, size)
+            return size
+        done = ctypes.c_size_t(0)
+        target = (ctypes.c_char * size).from_buffer(buffer)
+        if not self.kernel32.ReadProcessMemory(self.pm.process_handle, address, target, size, ctypes.byref(done)):
+            raise OSError(f"Could not read memory at: {address:#x}, length: {size}")
+        return done.value
+
+    def regions(self):
+        """(base, size) of every committed, readable region - walked with VirtualQueryEx"""
+        if not self.kernel32:
+            raise OSError("Region listing needs Windows")
+        limit = 0xFFFFFFFF if self.pointer_size == 4 else 0x7FFFFFFEFFFF
+        info = _MEMORY_BASIC_INFORMATION()
+        regions = []
+        address = 0
+        while address < limit:
+            if not self.kernel32.VirtualQueryEx(self.pm.process_handle, address,
+                                                ctypes.byref(info), ctypes.sizeof(info)):
+                break
+            base = info.BaseAddress or 0
+            if (info.State == MEM_COMMIT and not info.Protect & (PAGE_NOACCESS | PAGE_GUARD)
+                    and info.Protect):
+                regions.append((base, info.RegionSize))
+            address = base + info.RegionSize
+        return regions
+
+    def read_pointer(self, address):
+        return int.from_bytes(self.read(address, self.pointer_size), 'little')
+
+    def module_info(self, name):
+        """(base, size) of a loaded module, reused for MODULE_RECHECK seconds"""
+        # Enumerating modules is slow; a reloaded module shows up as a new base
+        now = time.monotonic()
+        cached = self.module_cache.get(name.lower())
+        if cached and now - cached[2] < self.MODULE_RECHECK:
+            return cached[0], cached[1]
+        module = pymem.process.module_from_name(self.pm.process_handle, name)
+        if not module:
+            self.module_cache.pop(name.lower(), None)
+            raise KeyError(f"Module not loaded: {name}")
+        self.module_cache[name.lower()] = (module.lpBaseOfDll, module.SizeOfImage, now)
+        return module.lpBaseOfDll, module.SizeOfImage
+
+    def module_base(self, name=None):
+        if not name:
+            return self.base_address
+        return self.module_info(name)[0]
+
+def read_value(memory, address, value_type):
+    fmt, size = VALUE_TYPES[value_type]
+    return struct.unpack(fmt, memory.read(address, size))[0]
+
+class PointerChain:
+    """module+offset -> [offsets] pointer path, written like "ZombiU.exe+0x1A2B3C,0x10,0x4" in settings"""
+    # Each offset dereferences the current address and adds itself (Cheat Engine style).
+    # The resolved address is cached until the base module moves; refresh=True forces a re-walk
+    def __init__(self, module, base_offset, offsets=()):
+        self.module = module
+        self.base_offset = base_offset
+        self.offsets = tuple(offsets)
+        self.address = None  # Resolved address, valid for resolved_memory/resolved_base
+        self.resolved_memory = None
+        self.resolved_base = None
+        self.walks = 0  # Full re-walks so far
+
+    @classmethod
+    def parse(cls, text):
+        parts = [p.strip() for p in text.split(',') if p.strip()]
+        if not parts:
+            raise ValueError("Empty pointer chain")
+        head = parts[0]
+        module = None
+        if '+' in head:
+            module, head = head.rsplit('+', 1)
+            module = module.strip()
+        base_offset = int(head.strip(), 0)
+        return cls(module, base_offset, [int(p, 0) for p in parts[1:]])
+
+    def resolve(self, memory, refresh=False):
+        base = memory.module_base(self.module) if self.module else 0
+        if self.address is not None and not refresh and memory is self.resolved_memory and base == self.resolved_base:
+            return self.address
+        address = base + self.base_offset
+        for offset in self.offsets:
+            address = memory.read_pointer(address) + offset
+        self.address, self.resolved_memory, self.resolved_base = address, memory, base
+        self.walks += 1
+        return address
+
+    def __str__(self):
+        head = f"{self.module}+{self.base_offset:#x}" if self.module else f"{self.base_offset:#x}"
+        return ','.join([head] + [f"{offset:#x}" for offset in self.offsets])
+
+# ==============================================================================
+# MEMORY SCANNING
+# ==============================================================================
+class Signature:
+    """IDA-style byte pattern such as "8B 0D ?? ?? ?? ?? 85 C9" - ?? matches any byte"""
+    def __init__(self, text):
+        self.text = ' '.join(text.split())
+        parts = self.text.split(' ')
+        if not parts or parts == ['']:
+            raise ValueError("Empty signature")
+        self.length = len(parts)
+        regex = b''
+        for part in parts:
+            if part in ('?', '??'):
+                regex += b'.'
+            else:
+                regex += re.escape(bytes([int(part, 16)]))
+        self.regex = re.compile(regex, re.DOTALL)
+
+    def find_all(self, data, end=None):
+        """Offsets of every match in a bytes-like buffer (up to end)"""
+        return [m.start() for m in self.regex.finditer(data, 0, len(data) if end is None else end)]
+
+class MemoryScanner:
+    """Chunked, multithreaded scanner over committed memory regions"""
+    # Chunks overlap by the pattern length so nothing is missed at borders. Each worker reads
+    # into one reusable bytearray; ReadProcessMemory and NumPy compares release the GIL
+    def __init__(self, memory, workers=None, chunk_size=0x100000):
+        self.memory = memory
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+        self.bytes_scanned = 0
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self):
+        """MB/s of the last scan"""
+        return self.bytes_scanned / (1024 * 1024) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def report(self):
+        return f"{self.bytes_scanned / (1024 * 1024):.1f} MB in {self.elapsed * 1000:.0f} ms ({self.throughput:.0f} MB/s)"
+
+    def map_chunks(self, search, regions=None, overlap=0):
+        """Run search(buffer, length) over every chunk - returns sorted addresses as array('Q')"""
+        # Offsets inside the overlap belong to the next chunk and are dropped
+        if regions is None:
+            regions = self.memory.regions()
+        tasks = []
+        for base, size in sorted(regions):
+            for offset in range(0, size, self.chunk_size):
+                step = min(self.chunk_size, size - offset)
+                tasks.append((base + offset, step, min(step + overlap, size - offset)))
+        buffers = threading.local()
+        scanned = [0] * len(tasks)
+
+        def run(index):
+            address, step, length = tasks[index]
+            buffer = getattr(buffers, 'buffer', None)
+            if buffer is None:
+                buffer = buffers.buffer = bytearray(self.chunk_size + overlap)
+            try:
+                length = self.memory.read_into(address, buffer, length)
+            except Exception:
+                return []  # Region changed or became unreadable since listing
+            scanned[index] = min(step, length)
+            hits = search(buffer, length)
+            if isinstance(hits, np.ndarray):
+                return (hits[hits < step].astype(np.uint64) + np.uint64(address)).tobytes()
+            return array('Q', [address + hit for hit in hits if hit < step]).tobytes()
+
+        # Tasks are in address order and chunks never share a hit, so
+        # appending results in task order keeps the output sorted
+        start = time.perf_counter()
+        matches = array('Q')
+        if self.workers > 1 and len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for hits in pool.map(run, range(len(tasks))):
+                    matches.frombytes(hits)
+        else:
+            for index in range(len(tasks)):
+                matches.frombytes(run(index))
+        self.elapsed = time.perf_counter() - start
+        self.bytes_scanned = sum(scanned)
+        return matches
+
+    def find(self, pattern, regions=None):
+        """Addresses of a bytes pattern or Signature"""
+        if isinstance(pattern, Signature):
+            return self.map_chunks(lambda buffer, length: pattern.find_all(buffer, length),
+                                   regions, pattern.length - 1)
+        pattern = bytes(pattern)
+
+        def search(buffer, length):
+            hits = []
+            hit = buffer.find(pattern, 0, length)
+            while hit != -1:
+                hits.append(hit)
+                hit = buffer.find(pattern, hit + 1, length)
+            return hits
+        return self.map_chunks(search, regions, len(pattern) - 1)
+
+    def find_value(self, value, value_type, regions=None, aligned=True):
+        """Addresses holding value as a VALUE_TYPES type - NumPy compare per chunk"""
+        fmt, size = VALUE_TYPES[value_type]
+        dtype = np.dtype(fmt)
+        target = dtype.type(value)
+
+        def search(buffer, length):
+            hits = []
+            for shift in range(1 if aligned else size):
+                count = (length - shift) // size
+                if count <= 0:
+                    continue
+                values = np.frombuffer(buffer, dtype=dtype, count=count, offset=shift)
+                hits.append(np.flatnonzero(values == target) * size + shift)
+            return np.sort(np.concatenate(hits)) if hits else []
+        return self.map_chunks(search, regions, 0 if aligned else size - 1)
+
+class ValueSearch:
+    """Cheat Engine style value search with incremental narrowing"""
+    # Survivors are an array('Q') of addresses plus a NumPy array of their last values;
+    # rescans read nearby survivors as one span and gather them with one fancy index
+    MODES = ('equals', 'changed', 'unchanged', 'increased', 'decreased')
+    SPAN_GAP = 0x1000  # Addresses closer than this share one read
+    SPAN_SHIFT = 20  # Spans never cross a 1 MB boundary
+
+    def __init__(self, memory, value_type='int', scanner=None):
+        if value_type not in VALUE_TYPES:
+            raise ValueError(f"Unknown value type: {value_type}")
+        self.memory = memory
+        self.value_type = value_type
+        self.dtype = np.dtype(VALUE_TYPES[value_type][0])
+        self.size = VALUE_TYPES[value_type][1]
+        self.scanner = scanner or MemoryScanner(memory)
+        self.addresses = array('Q')
+        self.values = np.empty(0, dtype=self.dtype)
+        self.elapsed = 0.0
+
+    def __len__(self):
+        return len(self.addresses)
+
+    def first_scan(self, value, regions=None, aligned=True):
+        self.addresses = self.scanner.find_value(value, self.value_type, regions, aligned)
+        self.values = np.full(len(self.addresses), value, dtype=self.dtype)
+        self.elapsed = self.scanner.elapsed
+        return len(self.addresses)
+
+    def read_current(self, addresses):
+        """Current values at addresses - returns (values, readable mask)"""
+        count = len(addresses)
+        values = np.zeros(count, dtype=self.dtype)
+        readable = np.ones(count, dtype=bool)
+        if not count:
+            return values, readable
+        addrs = np.frombuffer(addresses, dtype=np.uint64).view(np.int64)  # User-space addresses fit
+        breaks = np.flatnonzero((np.diff(addrs) > self.SPAN_GAP) |
+                                (np.diff(addrs >> self.SPAN_SHIFT) != 0)) + 1
+        starts = np.concatenate(([0], breaks))
+        ends = np.concatenate((breaks, [count]))
+        buffer = bytearray((1 << self.SPAN_SHIFT) + self.size)
+        raw = np.frombuffer(buffer, dtype=np.uint8)
+        lanes = np.arange(self.size, dtype=np.int64)
+        size_shift = self.size.bit_length() - 1  # Value sizes are powers of two
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            low = int(addrs[start])
+            length = int(addrs[end - 1]) - low + self.size
+            try:
+                self.memory.read_into(low, buffer, length)
+            except Exception:
+                readable[start:end] = False
+                continue
+            offsets = addrs[start:end] - low
+            if not (low | int(np.bitwise_or.reduce(offsets))) & (self.size - 1):
+                # Aligned span - one gather on a typed view instead of per-byte lanes
+                typed = np.frombuffer(buffer, dtype=self.dtype, count=length >> size_shift)
+                values[start:end] = typed[offsets >> size_shift]
+            else:
+                values[start:end] = raw[offsets[:, None] + lanes].view(self.dtype).ravel()
+        return values, readable
+
+    def next_scan(self, mode, value=None):
+        """Narrow the survivors - returns how many are left"""
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown scan mode: {mode}")
+        start = time.perf_counter()
+        current, keep = self.read_current(self.addresses)
+        if mode == 'equals':
+            if self.dtype.kind == 'f':
+                keep &= np.isclose(current, value, rtol=0, atol=1e-3)
+            else:
+                keep &= current == self.dtype.type(value)
+        elif mode == 'changed':
+            keep &= current != self.values
+        elif mode == 'unchanged':
+            keep &= current == self.values
+        elif mode == 'increased':
+            keep &= current > self.values
+        else:
+            keep &= current < self.values
+        survivors = np.frombuffer(self.addresses, dtype=np.uint64)[keep]
+        self.addresses = array('Q', survivors.tobytes())
+        self.values = current[keep]
+        self.elapsed = time.perf_counter() - start
+        return len(self.addresses)
+
+    def results(self, limit=20):
+        """First survivors as (address, last value)"""
+        return [(address, value) for address, value in zip(self.addresses[:limit], self.values[:limit].tolist())]
+
+def scan_module(memory, module, signature):
+    """Addresses where signature matches inside a module image"""
+    return MemoryScanner(memory).find(signature, [memory.module_info(module)])
+
+def module_fingerprint(memory, module):
+    """Identifies an executable build - module name, image size and a hash of stable PE header fields"""
+    # Only fields the loader never rewrites are hashed, so ASLR patching ImageBase does not change it
+    base, size = memory.module_info(module)
+    header = memory.read(base, min(size, 0x1000))
+    stable = header
+    pe = int.from_bytes(header[0x3C:0x40], 'little')
+    if header[:2] == b'MZ' and header[pe:pe + 4] == b'PE\0\0':
+        coff = pe + 4
+        sections = int.from_bytes(header[coff + 2:coff + 4], 'little')
+        optional_size = int.from_bytes(header[coff + 16:coff + 18], 'little')
+        optional = coff + 20
+        stable = header[coff:coff + 8]
+        if optional_size >= 68:
+            # AddressOfEntryPoint, SizeOfImage and CheckSum sit at the same offsets in PE32 and PE32+
+            stable += header[optional + 16:optional + 20] + header[optional + 56:optional + 60]
+            stable += header[optional + 64:optional + 68]
+        table = optional + optional_size
+        for i in range(sections):
+            # Name, VirtualSize, VirtualAddress, SizeOfRawData, PointerToRawData
+            stable += header[table + i * 40:table + i * 40 + 24]
+    return f"{module.lower()}:{size:x}:{hashlib.sha1(stable).hexdigest()[:16]}"
+
+class OffsetCache:
+    """On-disk cache of resolved offsets and pointer chains per game build - fingerprint|key|value lines"""
+    # Only one build is kept per module - offsets from another build are meaningless
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}  # (fingerprint, key) -> value string
+        self.lock = Lock()
+        try:
+            with open(path, 'r') as f:
+                for line in f:
+                    parts = line.rstrip('\n').split('|')
+                    if len(parts) == 3:
+                        self.entries[(parts[0], parts[1])] = parts[2]
+        except OSError:
+            pass
+
+    def attach(self, fingerprint):
+        """Validate the cache for a freshly attached build - returns (kept, dropped) entry counts"""
+        with self.lock:
+            dropped = self._invalidate(fingerprint)
+            kept = sum(1 for fp, _ in self.entries if fp == fingerprint)
+        return kept, dropped
+
+    def _invalidate(self, fingerprint):
+        module = fingerprint.split(':', 1)[0]
+        stale = [entry for entry in self.entries
+                 if entry[0] != fingerprint and entry[0].split(':', 1)[0] == module]
+        for entry in stale:
+            del self.entries[entry]
+        return len(stale)
+
+    def get(self, fingerprint, key):
+        return self.entries.get((fingerprint, key))
+
+    def put(self, fingerprint, key, value):
+        with self.lock:
+            self._invalidate(fingerprint)
+            self.entries[(fingerprint, key)] = str(value)
+
+    def write(self):
+        with self.lock:
+            lines = [f"{fp}|{key}|{value}\n" for (fp, key), value in self.entries.items()]
+        temp_file = self.path + '.tmp'
+        with open(temp_file, 'w') as f:
+            f.writelines(lines)
+        os.replace(temp_file, self.path)
+
+class KeypadCodeExtractor:
+    """Reads the active keypad code straight out of game memory"""
+    # The signature finds an instruction referencing the keypad global; the operand at
+    # `operand_offset` gives its address (absolute on 32-bit, RIP-relative on 64-bit)
+    FORMATS = ('ascii', 'digits', 'int')
+
+    def __init__(self, signature, module, operand_offset=0, chain=(), code_format='ascii', code_length=4):
+        self.signature = signature if isinstance(signature, Signature) else Signature(signature)
+        self.module = module
+        self.operand_offset = operand_offset
+        self.chain = tuple(chain)
+        self.code_format = code_format if code_format in self.FORMATS else 'ascii'
+        self.code_length = code_length
+
+    def find_global(self, memory):
+        """Module offset of the keypad global, from a fresh signature scan"""
+        matches = scan_module(memory, self.module, self.signature)
+        if not matches:
+            raise LookupError("Keypad signature not found")
+        operand = matches[0] + self.operand_offset
+        if memory.pointer_size == 8:
+            displacement = struct.unpack('<i', memory.read(operand, 4))[0]
+            address = operand + 4 + displacement
+        else:
+            address = int.from_bytes(memory.read(operand, 4), 'little')
+        return address - memory.module_base(self.module)
+
+    def code_chain(self, global_offset):
+        return PointerChain(self.module, global_offset, self.chain)
+
+    def read_code(self, memory, global_offset):
+        address = self.code_chain(global_offset).resolve(memory)
+        if self.code_format == 'int':
+            code = f"{struct.unpack('<I', memory.read(address, 4))[0]:0{self.code_length}d}"
+        elif self.code_format == 'digits':
+            code = ''.join(str(b) if b < 10 else '?' for b in memory.read(address, self.code_length))
+        else:
+            code = memory.read(address, self.code_length).decode('ascii', 'replace')
+        if len(code) != self.code_length or not code.isdigit():
+            raise ValueError(f"Keypad code not readable (got {code!r})")
+        return code
+
+    def cache_key(self):
+        return f"sig:{self.signature.text}"
+
+    def extract(self, memory, cache=None, fingerprint=None):
+        """Return (code, from_cache) - cached global offsets are re-scanned if they go stale"""
+        if cache and fingerprint is None:
+            fingerprint = module_fingerprint(memory, self.module)
+        key = self.cache_key()
+        cached = cache.get(fingerprint, key) if cache else None
+        if cached is not None:
+            try:
+                return self.read_code(memory, int(cached, 16)), True
+            except Exception:
+                pass
+        global_offset = self.find_global(memory)
+        code = self.read_code(memory, global_offset)
+        if cache:
+            cache.put(fingerprint, key, f"{global_offset:x}")
+        return code, False
+
+# ==============================================================================
+# SUCCESS DETECTION
+# ==============================================================================
+class FrameSource:
+    """Supplies RGB frames of a screen region as (H, W, 3) uint8 arrays"""
+    def grab(self, region):
+        raise NotImplementedError
+
+class ScreenFrameSource(FrameSource):
+    """Real screen capture through PIL.ImageGrab"""
+    def grab(self, region):
+        return np.asarray(ImageGrab.grab(bbox=region).convert('RGB'))
+
+class ScreenSuccessDetector:
+    """Flags success when a screen region stops looking like its reference"""
+    # A second sample confirms the change so a one-frame flash does not count
+    def __init__(self, source, region, changed_fraction=0.2, pixel_threshold=40, confirm_delay=0.05):
+        self.source = source
+        self.region = region
+        self.changed_fraction = changed_fraction
+        self.pixel_threshold = pixel_threshold
+        self.confirm_delay = confirm_delay
+        self.reference = None
+
+    def capture_reference(self):
+        self.reference = self.source.grab(self.region).astype(np.int16)
+
+    def difference(self):
+        """Fraction of pixels whose largest channel change exceeds pixel_threshold"""
+        frame = self.source.grab(self.region).astype(np.int16)
+        if self.reference is None or frame.shape != self.reference.shape:
+            return 0.0
+        changed = np.abs(frame - self.reference).max(axis=2) > self.pixel_threshold
+        return float(changed.mean())
+
+    def check(self):
+        if self.reference is None:
+            return False
+        if self.difference() < self.changed_fraction:
+            return False
+        if self.confirm_delay > 0:
+            time.sleep(self.confirm_delay)
+        return self.difference() >= self.changed_fraction
+
+class Watch:
+    """One named value sampled by a WatchEngine"""
+    def __init__(self, name, chain, value_type='int', interval=0.01, hud=False):
+        if value_type not in VALUE_TYPES:
+            raise ValueError(f"Unknown value type: {value_type}")
+        self.name = name
+        self.chain = chain if isinstance(chain, PointerChain) else PointerChain.parse(chain)
+        self.value_type = value_type
+        self.fmt, self.size = VALUE_TYPES[value_type]
+        self.interval = interval
+        self.hud = hud
+        self.next_due = 0.0
+
+def parse_watches(path):
+    """Read watches.txt - lines of name=pointer chain|type|samples per second[|hud]"""
+    watches = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+    except OSError:
+        return watches
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        name, spec = line.split('=', 1)
+        parts = [p.strip() for p in spec.split('|')]
+        try:
+            value_type = parts[1].lower() if len(parts) > 1 and parts[1] else 'int'
+            rate = float(parts[2]) if len(parts) > 2 and parts[2] else 100.0
+            hud = len(parts) > 3 and parts[3].lower() == 'hud'
+            watches.append(Watch(name.strip(), parts[0], value_type, 1.0 / max(0.1, rate), hud))
+        except Exception as e:
+            print(f"[ERROR] watches.txt line '{line}': {e}")
+    return watches
+
+class WatchEngine:
+    """Single sampler thread for every memory watch - one read pass, change events out"""
+    # Due watches are sorted by address and read in merged spans; subscribers get
+    # callback(name, old, new, timestamp) on the sampler thread, new is None while unreadable
+    SPAN_GAP = 64  # Watches closer than this share one read
+
+    def __init__(self, memory, watches=()):
+        self.memory = memory
+        self.watches = {}
+        self.values = {}
+        self.subscribers = []  # (callback, names or None)
+        self.lock = Lock()
+        self.wake = Condition(self.lock)
+        self.running = False
+        self.thread = None
+        self.reads = 0
+        self.recorder = None  # callable(timestamp, values) after every tick, e.g. TelemetryRing.record_values
+        for watch in watches:
+            self.add_watch(watch)
+
+    def add_watch(self, watch):
+        """Add or replace a watch - it is read once right away so values[] is primed"""
+        value = self._read_single(watch)
+        with self.lock:
+            self.watches[watch.name] = watch
+            self.values[watch.name] = value
+            watch.next_due = time.perf_counter() + watch.interval
+            self.wake.notify()
+
+    def remove_watch(self, name):
+        with self.lock:
+            self.watches.pop(name, None)
+            self.values.pop(name, None)
+
+    def subscribe(self, callback, names=None):
+        """Register for change events - returns the current values, so nothing falls between"""
+        with self.lock:
+            self.subscribers.append((callback, set(names) if names else None))
+            return dict(self.values)
+
+    def unsubscribe(self, callback):
+        with self.lock:
+            # ==, not is - every self._on_change access builds a new bound method
+            self.subscribers = [s for s in self.subscribers if s[0] != callback]
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.thread = Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        with self.lock:
+            self.running = False
+            self.wake.notify()
+
+    def _read_single(self, watch):
+        for refresh in (False, True):
+            try:
+                address = watch.chain.resolve(self.memory, refresh)
+                self.reads += 1
+                return struct.unpack(watch.fmt, self.memory.read(address, watch.size))[0]
+            except Exception:
+                continue
+        return None
+
+    def sample(self, due):
+        """Read every watch in due - returns {name: value}"""
+        located = []
+        values = {}
+        for watch in due:
+            try:
+                located.append((watch.chain.resolve(self.memory), watch))
+            except Exception:
+                values[watch.name] = self._read_single(watch)
+        located.sort(key=lambda item: item[0])
+        index = 0
+        while index < len(located):
+            low = located[index][0]
+            end = index + 1
+            high = low + located[index][1].size
+            while end < len(located) and located[end][0] - high <= self.SPAN_GAP:
+                high = max(high, located[end][0] + located[end][1].size)
+                end += 1
+            try:
+                data = self.memory.read(low, high - low)
+                self.reads += 1
+                for address, watch in located[index:end]:
+                    values[watch.name] = struct.unpack_from(watch.fmt, data, address - low)[0]
+            except Exception:
+                # Span went unreadable - a cached address is stale, re-walk each chain
+                for address, watch in located[index:end]:
+                    values[watch.name] = self._read_single(watch)
+            index = end
+        return values
+
+    def _run(self):
+        while True:
+            with self.lock:
+                if not self.running:
+                    return
+                now = time.perf_counter()
+                due = [w for w in self.watches.values() if w.next_due <= now]
+                if not due:
+                    next_due = min((w.next_due for w in self.watches.values()), default=now + 1.0)
+                    self.wake.wait(max(0.0, next_due - now))
+                    continue
+            timestamp = time.perf_counter()
+            values = self.sample(due)
+            events = []
+            with self.lock:
+                for watch in due:
+                    watch.next_due = max(watch.next_due + watch.interval, timestamp)
+                    if watch.name not in self.watches:
+                        continue
+                    new = values.get(watch.name)
+                    old = self.values.get(watch.name)
+                    if new != old:
+                        self.values[watch.name] = new
+                        events.append((watch.name, old, new))
+                subscribers = list(self.subscribers)
+                if self.recorder:
+                    try:
+                        self.recorder(timestamp, self.values)
+                    except Exception as e:
+                        print(f"[ERROR] watch recorder: {e}")
+            for name, old, new in events:
+                for callback, names in subscribers:
+                    if names is None or name in names:
+                        try:
+                            callback(name, old, new, timestamp)
+                        except Exception as e:
+                            print(f"[ERROR] watch subscriber for {name}: {e}")
+
+class MemoryWatchDetector:
+    """Flags success the instant a watched game value flips"""
+    # on_flip runs on the sampler thread so the sweep can stop at once; flip_time names the ENTER
+    def __init__(self, engine, name, target=None, on_flip=None):
+        self.engine = engine
+        self.name = name
+        self.target = target
+        self.on_flip = on_flip
+        self.baseline = None
+        self.value = None
+        self.flip_time = None
+
+    def flipped(self, value):
+        if self.target is not None:
+            return value == self.target
+        return value != self.baseline
+
+    def start(self):
+        self.flip_time = None
+        self.baseline = self.engine.subscribe(self._on_change, [self.name]).get(self.name)
+
+    def stop(self):
+        self.engine.unsubscribe(self._on_change)
+
+    def _on_change(self, name, old, new, timestamp):
+        if new is None or self.flip_time is not None:
+            return  # Pointer chain broken mid-load - wait for the next good read
+        if self.baseline is None and self.target is None:
+            self.baseline = new
+            return
+        if self.flipped(new):
+            self.value = new
+            self.flip_time = timestamp
+            self.stop()
+            if self.on_flip:
+                self.on_flip()
+
+    def check(self):
+        return self.flip_time is not None
+
+def parse_region(text):
+    """"left,top,right,bottom" -> tuple, or None when empty/invalid"""
+    try:
+        left, top, right, bottom = (int(float(v)) for v in text.split(','))
+    except ValueError:
+        return None
+    if right <= left or bottom <= top:
+        return None
+    return (left, top, right, bottom)
+
+# ==============================================================================
+# INPUT VERIFICATION
+# ==============================================================================
+# Attempt outcome when the readback found ENTER dropped and it was sent again -
+# the code went in, but the pacer should still hear about the drop
+ENTER_RESENT = 'enter_resent'
+
+class DisplayReader:
+    """Reads what the game's keypad display currently shows"""
+    def read(self):
+        """Displayed text, or None when it cannot be read"""
+        raise NotImplementedError
+
+class ScreenDisplayReader(DisplayReader):
+    """Grabs the display region and hands the frame to recognize(frame) -> text or None"""
+    def __init__(self, source, region, recognize):
+        self.source = source
+        self.region = region
+        self.recognize = recognize
+
+    def read(self):
+        return self.recognize(self.source.grab(self.region))
+
+class KeypadOCR:
+    """Template-matching reader for the digits on the keypad display"""
+    # Ink columns split into glyphs at blank columns; each glyph is scaled to SIZE and matched
+    # against every template in one NumPy comparison
+    SIZE = (16, 12)  # Template rows, columns
+    SETTLE = 0.15  # Wait for the display to redraw while learning
+
+    def __init__(self, blank, region=None, pixel_threshold=40, max_distance=0.2):
+        self.blank = np.asarray(blank, dtype=np.int16)
+        self.region = tuple(region) if region else None
+        self.pixel_threshold = pixel_threshold
+        self.max_distance = max_distance
+        self.labels = []
+        self.templates = np.zeros((0, self.SIZE[0] * self.SIZE[1]), dtype=bool)
+        self.heights = []  # Ink height of every learned glyph
+
+    def ink(self, frame):
+        """Boolean (H, W) mask of pixels that changed from the blank display"""
+        frame = np.asarray(frame, dtype=np.int16)
+        if frame.shape != self.blank.shape:
+            raise ValueError(f"frame {frame.shape} does not match the learned display {self.blank.shape}")
+        return np.abs(frame - self.blank).max(axis=2) > self.pixel_threshold
+
+    @staticmethod
+    def segments(mask):
+        """(start, end) column runs that contain ink"""
+        columns = np.concatenate(([0], mask.any(axis=0).astype(np.int8), [0]))
+        return np.flatnonzero(np.diff(columns)).reshape(-1, 2)
+
+    def _glyph(self, mask, start, end):
+        """Crop one column run to its ink rows and scale it into a flat SIZE template"""
+        cell = mask[:, start:end]
+        rows = np.flatnonzero(cell.any(axis=1))
+        cell = cell[rows[0]:rows[-1] + 1]
+        rows_out, cols_out = self.SIZE
+        height, width = cell.shape
+        scaled = min(cols_out, max(1, round(width * rows_out / height)))
+        glyph = np.zeros(self.SIZE, dtype=bool)
+        left = (cols_out - scaled) // 2
+        glyph[:, left:left + scaled] = cell[(np.arange(rows_out) * height // rows_out)[:, None],
+                                            np.arange(scaled) * width // scaled]
+        return glyph.ravel(), height
+
+    def learn(self, label, frame):
+        """Learn label's template from a frame that shows only that glyph"""
+        mask = self.ink(frame)
+        runs = self.segments(mask)
+        if not len(runs):
+            raise ValueError(f"nothing on the display for {label}")
+        start, end = max(runs, key=lambda run: mask[:, run[0]:run[1]].sum())
+        glyph, height = self._glyph(mask, start, end)
+        if label in self.labels:
+            index = self.labels.index(label)
+            self.templates[index] = glyph
+            self.heights[index] = height
+        else:
+            self.labels.append(label)
+            self.templates = np.vstack([self.templates, glyph])
+            self.heights.append(height)
+
+    def read(self, frame):
+        """Text on the display - '' when it is empty, None when a glyph matches no template"""
+        # Ink runs much shorter than the learned digits (a blinking cursor) are ignored
+        if not self.labels:
+            return None
+        mask = self.ink(frame)
+        min_height = min(self.heights) // 2
+        glyphs = []
+        for start, end in self.segments(mask):
+            glyph, height = self._glyph(mask, start, end)
+            if height > min_height:
+                glyphs.append(glyph)
+        if not glyphs:
+            return ''
+        distance = (np.array(glyphs)[:, None, :] != self.templates[None]).mean(axis=2)
+        best = distance.argmin(axis=1)
+        if (distance[np.arange(len(best)), best] > self.max_distance).any():
+            return None
+        return ''.join(self.labels[i] for i in best)
+
+    __call__ = read  # A KeypadOCR is a recognizer for ScreenDisplayReader
+
+    def save(self, path):
+        np.savez(path, blank=self.blank, templates=self.templates, labels=np.array(self.labels),
+                 heights=np.array(self.heights), region=np.array(self.region or (), dtype=np.int64))
+
+    @classmethod
+    def load(cls, path, region=None):
+        """Cached templates from path - None if missing, or learned for another region"""
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as data:
+            cached = tuple(int(v) for v in data['region'])
+            if region is not None and cached != tuple(region):
+                return None
+            ocr = cls(data['blank'], cached)
+            ocr.templates = data['templates'].astype(bool)
+            ocr.labels = [str(label) for label in data['labels']]
+            ocr.heights = [int(h) for h in data['heights']]
+        return ocr
+
+# ==============================================================================
+# TELEMETRY
+# ==============================================================================
+class TelemetryRing:
+    """Preallocated memory-mapped ring of watch samples, read back with read_telemetry"""
+    # Header (magic, version, capacity, fields, total written, names) then fixed float64 records;
+    # missing values are NaN. An existing ring is rotated to <name>.prev<ext>, not overwritten
+    MAGIC = b'ZTRB'
+    VERSION = 1
+    HEADER = struct.Struct('<4sIIIQ')
+    NAME_SIZE = 32
+
+    def __init__(self, path, fields, capacity=100000):
+        self.path = path
+        self.fields = list(fields)
+        self.capacity = capacity
+        self.record = struct.Struct('<d' + 'd' * len(self.fields))
+        self.value = struct.Struct('<d')
+        self.count_struct = struct.Struct('<Q')
+        self.data_offset = self._data_offset(len(self.fields))
+        # (byte offset inside a record, field name) - walked per sample without building anything
+        self.slots = tuple((self.value.size * (index + 1), name) for index, name in enumerate(self.fields))
+        self.count = 0
+        size = self.data_offset + self.record.size * capacity
+        if os.path.exists(path):
+            base, ext = os.path.splitext(path)
+            os.replace(path, f"{base}.prev{ext}")
+        with open(path, 'wb') as f:
+            f.truncate(size)
+        self.file = open(path, 'r+b')
+        self.mm = mmap.mmap(self.file.fileno(), size)
+        self.HEADER.pack_into(self.mm, 0, self.MAGIC, self.VERSION, capacity, len(self.fields), 0)
+        for index, name in enumerate(self.fields):
+            offset = self.HEADER.size + index * self.NAME_SIZE
+            self.mm[offset:offset + self.NAME_SIZE] = name.encode('utf-8')[:self.NAME_SIZE].ljust(self.NAME_SIZE, b'\0')
+        self.lock = Lock()
+
+    @classmethod
+    def _data_offset(cls, field_count):
+        header = cls.HEADER.size + field_count * cls.NAME_SIZE
+        return (header + 63) // 64 * 64
+
+    def _next_record(self):
+        """Byte offset of the record the next sample overwrites"""
+        return self.data_offset + (self.count % self.capacity) * self.record.size
+
+    def _commit(self):
+        self.count += 1
+        self.count_struct.pack_into(self.mm, 16, self.count)
+
+    def write(self, timestamp, *values):
+        """Append one sample - values in field order, None allowed"""
+        with self.lock:
+            if self.mm is None:
+                return
+            offset = self._next_record()
+            self.value.pack_into(self.mm, offset, timestamp)
+            for (field_offset, _), v in zip(self.slots, values):
+                self.value.pack_into(self.mm, offset + field_offset, math.nan if v is None else v)
+            self._commit()
+
+    def record_values(self, timestamp, values):
+        """Append a sample from a {field: value} dict (WatchEngine recorder hook)"""
+        with self.lock:
+            if self.mm is None:
+                return
+            offset = self._next_record()
+            self.value.pack_into(self.mm, offset, timestamp)
+            for field_offset, name in self.slots:
+                v = values.get(name)
+                self.value.pack_into(self.mm, offset + field_offset, math.nan if v is None else v)
+            self._commit()
+
+    def close(self):
+        with self.lock:
+            if self.mm is not None:
+                self.mm.flush()
+                self.mm.close()
+                self.file.close()
+                self.mm = None
+
+def read_telemetry(path, chunk=65536):
+    """Yield a TelemetryRing's samples oldest first as (n, 1 + fields) arrays - column 0 is the timestamp"""
+    with open(path, 'rb') as f:
+        header = f.read(TelemetryRing.HEADER.size)
+        magic, version, capacity, field_count, count = TelemetryRing.HEADER.unpack(header)
+        if magic != TelemetryRing.MAGIC or version != TelemetryRing.VERSION:
+            raise ValueError(f"Not a telemetry ring: {path}")
+    width = 1 + field_count
+    records = np.memmap(path, dtype='<f8', mode='r', offset=TelemetryRing._data_offset(field_count),
+                        shape=(capacity, width))
+    stored = min(count, capacity)
+    first = count % capacity if count > capacity else 0
+    for start in range(0, stored, chunk):
+        indices = (np.arange(start, min(start + chunk, stored)) + first) % capacity
+        yield np.array(records[indices])
+
+def telemetry_fields(path):
+    """Field names stored in a TelemetryRing file"""
+    with open(path, 'rb') as f:
+        header = f.read(TelemetryRing.HEADER.size)
+        field_count = TelemetryRing.HEADER.unpack(header)[3]
+        names = f.read(field_count * TelemetryRing.NAME_SIZE)
+    return [names[i:i + TelemetryRing.NAME_SIZE].rstrip(b'\0').decode('utf-8')
+            for i in range(0, len(names), TelemetryRing.NAME_SIZE)]
+
 # ==============================================================================
 # MAIN LOGIC ENGINE
 # ==============================================================================
@@ -84,6 +2225,12 @@ class ZombiUTrainer:
         # FIX FOLDER PERMISSIONS - Make folder writable
         self.fix_folder_permissions()
         
+        # All file writes go through this write-behind worker
+        self.persist_interval = 1.0  # Seconds between group commits
+        self.persistence = PersistenceWorker(self.persist_interval)
+        self.pending_settings = {}  # settings.txt updates waiting for the worker
+        self.settings_lock = Lock()
+        
         self.pm = None
         self.process_found = False
         self.running = True
@@ -102,14 +2249,38 @@ class ZombiUTrainer:
         self.keypad_solving = False
         self.keypad_code = ""
         self.keypad_method = "auto"
-        self.found_codes = []
+        self.found_codes = []  # Bounded view for the GUI (last 10 codes)
+        self.code_length = 4  # Keypad digits, 3-8
+        self.code_alphabet = CodeSpace.DIGITS
+        self.code_space = CodeSpace()
+        self.code_constraints = ""  # CodeConstraints terms like "1??7 -0 unique"
+        self.tried_index = TriedCodeIndex(self.code_space)  # Every code ever tried, saved with resume data
         self.manual_code_entry = ""
         self.last_successful_code = ""
+        self.current_location = ""  # In-game location, for known codes and success history
+        self.success_history = []  # (code, location, time) of every code that worked, all sessions
+        self.success_history_file = os.path.join(self.app_folder, "success_history.txt")
+        self.known_codes = []  # (location, code) from known_codes.txt
+        self.known_codes_file = os.path.join(self.app_folder, "known_codes.txt")
+        self.known_index = KnownCodeIndex()  # known_codes.txt entries, for manual lookup
+        self.load_success_history()
+        self.load_known_codes()
         self.keypad_save_file = os.path.join(self.app_folder, "keypad_resume.txt")  # App folder
+        self.other_space_lines = {}  # Space key -> LAST:/TRIED: lines kept for other code lengths/alphabets
+        self.keypad_journal = KeypadJournal(os.path.join(self.app_folder, "keypad_resume.log"))
+        self.resume_journal = True  # Append attempts to keypad_resume.log instead of rewriting
+        self.resume_compact_every = 500  # Journal records before compacting into keypad_resume.txt
+        self.candidate_strategy = CandidateEngine.DEFAULT_SPEC  # Sweep order, see CandidateEngine
         self.load_keypad_resume()
         self.circle_positions = []
         self.circle_ready = False
+        self.click_cancel = threading.Event()  # Fired whenever auto_clicking goes False
+        self.click_lock = Lock()  # Guards swapping click_cancel against the sampler thread
+        self._auto_clicking = False
         self.auto_clicking = False
+        self.countdown_cancel = threading.Event()
+        self.learning_digits = False  # capture_keypad_glyphs is clicking the keypad
+        self.learn_cancel = threading.Event()
         
         # F2: Key Blocker
         self.key_blocker_active = False
@@ -142,6 +2313,64 @@ class ZombiUTrainer:
         # Speed settings (adjustable)
         self.click_delay = 0.02  # 20ms - ULTRA ULTRA FAST clicking
         self.enter_delay = 0.02  # 20ms - ULTRA ULTRA FAST enter key
+        self.click_settle = ClickPlan.MOVE_SETTLE  # Pause after moving onto a button
+        self.click_hold = ClickPlan.PRESS_HOLD  # How long a button is held down
+        self.input_backend = 'sendinput'  # sendinput or pyautogui
+        self.schedule_spin = DeadlineScheduler.SPIN  # Busy-wait this long before each input deadline
+        self.click_scheduler = None
+        self.solver_input = 'mouse'  # mouse (calibrated circles) or keyboard (typed digits)
+        self.key_delay = 0.03  # Pause after each typed key
+        self.key_enter_delay = 0.3  # Pause after the typed ENTER
+        self.key_hold = KeyPlan.KEY_HOLD  # How long a typed key is held down
+        
+        # Adaptive pacing - tunes click/enter delays from accepted vs dropped feedback
+        self.adaptive_pacing = False
+        self.pacing_min_delay = 0.005
+        self.pacing_max_delay = 0.25
+        self.feedback_sources = []  # callables(code) -> True accepted / False dropped / None unknown
+        
+        # Input verification - read the keypad display back before ENTER
+        self.display_reader = None  # DisplayReader, overrides the OCR reader below
+        self.display_region = None  # Keypad display (left, top, right, bottom) read by KeypadOCR
+        self.keypad_ocr = None
+        self.keypad_glyphs_file = os.path.join(self.app_folder, "keypad_glyphs.npz")  # Learned digit templates
+        self.verify_delay = 0.03  # Wait for the display to catch up before reading it
+        self.verify_retries = 3  # Attempts before a code is set aside as suspect
+        self.suspect_codes = []  # Never read back correctly - kept out of tried_index
+        self.retry_queue = deque()  # (code, tries) waiting to be entered again
+        self.verify_stats = Counter()
+        
+        # Success detection - screen region that changes once the door opens
+        self.success_region = None  # (left, top, right, bottom) or None = off
+        self.success_threshold = 0.2  # Fraction of region pixels that must change
+        self.success_detectors = []  # objects with check() -> True once the code worked
+        self.success_watch = ""  # Pointer chain to a door/keypad state value - empty = off
+        self.success_watch_type = 'byte'
+        self.success_watch_value = ""  # Value meaning "open" - empty = any change
+        self.success_watch_interval = 0.002
+        self.entered_codes = deque(maxlen=8)  # (perf_counter, code) after each ENTER
+        
+        # Memory watches - watches.txt sampled by one WatchEngine while the game is attached
+        self.watch_engine = None
+        self.watch_values = {}  # name -> latest value, for the HUD
+        self.hud_watches = []  # Watch names flagged |hud in watches.txt
+        self.timer_pause_watch = ""  # Watch that pauses the timer while non-zero (loads)
+        self.timer_auto_paused = False
+        self.gui_calls = deque()  # Callables from worker threads, run by the GUI update loop
+        self.telemetry = False  # Record watch samples into telemetry.ring
+        self.telemetry_capacity = 100000
+        self.telemetry_ring = None
+        
+        # Direct code extraction - signature scan for the active keypad's code
+        self.keypad_signature = ""  # IDA-style pattern, empty = off
+        self.keypad_signature_module = ""  # Module to scan, empty = game executable
+        self.keypad_signature_operand = 2  # Offset of the keypad global operand in the match
+        self.keypad_code_chain = ""  # Comma separated offsets from the global to the code
+        self.keypad_code_format = 'ascii'  # ascii, digits or int
+        self.offset_cache = OffsetCache(os.path.join(self.app_folder, "offset_cache.txt"))
+        self.game_fingerprint = None  # module_fingerprint of the attached build
+        self.keypad_global_offset = None  # Cached keypad global for the attached build
+        self.value_search = None  # ValueSearch narrowed from the Dev Tools tab
         
         # HUD customization settings
         self.hud_bg_color = '#000000'
@@ -247,6 +2476,8 @@ class ZombiUTrainer:
                 return  # Load defaults, don't try to read
             
             # File exists and has content - try to load it
+            with self.settings_lock:
+                pending = dict(self.pending_settings)
             try:
                 with open(settings_path, 'r') as f:
                     for line in f:
@@ -255,12 +2486,85 @@ class ZombiUTrainer:
                             if '=' in line:
                                 key, value = line.split('=', 1)
                                 key = key.strip()
-                                value = value.strip()
+                                value = pending.get(key, value.strip())  # Queued writes are newer than the file
                                 
                                 if key == 'click_delay':
                                     self.click_delay = float(value)
                                 elif key == 'enter_delay':
                                     self.enter_delay = float(value)
+                                elif key == 'click_settle':
+                                    self.click_settle = float(value)
+                                elif key == 'click_hold':
+                                    self.click_hold = float(value)
+                                elif key == 'input_backend':
+                                    self.input_backend = value.lower()
+                                elif key == 'schedule_spin':
+                                    self.schedule_spin = float(value)
+                                elif key == 'solver_input':
+                                    self.solver_input = value.lower()
+                                elif key == 'key_delay':
+                                    self.key_delay = float(value)
+                                elif key == 'key_enter_delay':
+                                    self.key_enter_delay = float(value)
+                                elif key == 'key_hold':
+                                    self.key_hold = float(value)
+                                elif key == 'display_region':
+                                    self.display_region = parse_region(value)
+                                elif key == 'verify_delay':
+                                    self.verify_delay = float(value)
+                                elif key == 'verify_retries':
+                                    self.verify_retries = max(1, int(value))
+                                elif key == 'success_region':
+                                    self.success_region = parse_region(value)
+                                elif key == 'success_threshold':
+                                    self.success_threshold = float(value)
+                                elif key == 'success_watch':
+                                    self.success_watch = value
+                                elif key == 'success_watch_type':
+                                    self.success_watch_type = value.lower() if value.lower() in VALUE_TYPES else 'byte'
+                                elif key == 'success_watch_value':
+                                    self.success_watch_value = value
+                                elif key == 'success_watch_interval':
+                                    self.success_watch_interval = max(0.0005, float(value))
+                                elif key == 'timer_pause_watch':
+                                    self.timer_pause_watch = value
+                                elif key == 'telemetry':
+                                    self.telemetry = value.lower() == 'true'
+                                elif key == 'telemetry_capacity':
+                                    self.telemetry_capacity = max(1000, int(value))
+                                elif key == 'keypad_signature':
+                                    self.keypad_signature = value
+                                elif key == 'keypad_signature_module':
+                                    self.keypad_signature_module = value
+                                elif key == 'keypad_signature_operand':
+                                    self.keypad_signature_operand = int(value, 0)
+                                elif key == 'keypad_code_chain':
+                                    self.keypad_code_chain = value
+                                elif key == 'keypad_code_format':
+                                    self.keypad_code_format = value.lower()
+                                elif key == 'adaptive_pacing':
+                                    self.adaptive_pacing = value.lower() == 'true'
+                                elif key == 'pacing_min_delay':
+                                    self.pacing_min_delay = float(value)
+                                elif key == 'pacing_max_delay':
+                                    self.pacing_max_delay = float(value)
+                                elif key == 'resume_journal':
+                                    self.resume_journal = value.lower() == 'true'
+                                elif key == 'resume_compact_every':
+                                    self.resume_compact_every = max(1, int(value))
+                                elif key == 'candidate_strategy':
+                                    self.candidate_strategy = value
+                                elif key == 'code_length':
+                                    self.code_length = int(value)
+                                elif key == 'code_alphabet':
+                                    self.code_alphabet = value or CodeSpace.DIGITS
+                                elif key == 'code_constraints':
+                                    self.code_constraints = value
+                                elif key == 'current_location':
+                                    self.current_location = value
+                                elif key == 'persist_interval':
+                                    self.persist_interval = max(0.0, float(value))
+                                    self.persistence.interval = self.persist_interval
                                 elif key == 'hud_bg_color':
                                     self.hud_bg_color = value
                                 elif key == 'hud_text_color':
@@ -309,6 +2613,7 @@ class ZombiUTrainer:
                                     self.taskbar_visible = value.lower() == 'true'
                 
                 self.apply_hud_theme()
+                self._sync_code_space()
             except Exception as e:
                 # If file corrupted, recreate it
                 self.create_default_settings()
@@ -316,6 +2621,28 @@ class ZombiUTrainer:
             self.status = f"Error loading settings: {e}"
             self.create_default_settings()
     
+    def _sync_code_space(self):
+        """Switch to a new code length/alphabet from settings - reloads tried codes for it"""
+        if (self.code_length, ''.join(dict.fromkeys(self.code_alphabet))) == \
+                (self.code_space.length, self.code_space.alphabet):
+            return
+        if self.auto_clicking:
+            return  # Applied once the running sweep stops
+        try:
+            space = CodeSpace(self.code_length, self.code_alphabet)
+        except ValueError as e:
+            self.status = f"Invalid keypad settings: {e}"
+            self.code_length, self.code_alphabet = self.code_space.length, self.code_space.alphabet
+            return
+        # Snapshot the old space first - its journal records are dropped at the next compaction
+        self.save_keypad_resume()
+        self.persistence.flush()
+        self.code_space = space
+        self.tried_index = TriedCodeIndex(space)
+        self.keypad_code = ""
+        self.load_keypad_resume()
+        self.status = f"Keypad: {space.describe()} ({space.size:,} codes)"
+    
     def apply_hud_theme(self):
         if self.hud_theme == 'military':
             self.hud_bg_color = '#1a1a00'
@@ -369,7 +2696,63 @@ class ZombiUTrainer:
                     
                     f.write("# SPEED SETTINGS\n")
                     f.write("click_delay=0.02\n")
-                    f.write("enter_delay=0.02\n\n")
+                    f.write("enter_delay=0.02\n")
+                    f.write("click_settle=0.005\n")
+                    f.write("click_hold=0.02\n")
+                    f.write("# INPUT BACKEND (sendinput, pyautogui)\n")
+                    f.write("input_backend=sendinput\n")
+                    f.write("schedule_spin=0.002\n")
+                    f.write("# SOLVER INPUT (mouse = click calibrated circles, keyboard = type digits + enter)\n")
+                    f.write("solver_input=mouse\n")
+                    f.write("key_delay=0.03\n")
+                    f.write("key_enter_delay=0.3\n")
+                    f.write("key_hold=0.01\n")
+                    f.write("# ADAPTIVE PACING (tunes the delays above, saved when a sweep ends - needs display_region digits learned)\n")
+                    f.write("adaptive_pacing=false\n")
+                    f.write("pacing_min_delay=0.005\n")
+                    f.write("pacing_max_delay=0.25\n")
+                    f.write("# INPUT VERIFICATION (display read back before ENTER, dropped codes are retried)\n")
+                    f.write("# Keypad display left,top,right,bottom - learn its digits with L after placing the circles (empty = off)\n")
+                    f.write("display_region=\n")
+                    f.write("verify_delay=0.03\n")
+                    f.write("verify_retries=3\n\n")
+                    
+                    f.write("# SUCCESS DETECTION (screen region left,top,right,bottom - empty = off)\n")
+                    f.write("success_region=\n")
+                    f.write("success_threshold=0.2\n")
+                    f.write("# Memory watch: pointer chain like ZombiU.exe+0x1A2B3C,0x10 (empty = off)\n")
+                    f.write("success_watch=\n")
+                    f.write("success_watch_type=byte\n")
+                    f.write("success_watch_value=\n")
+                    f.write("success_watch_interval=0.002\n\n")
+                    
+                    f.write("# CODE EXTRACTION (signature like 8B 0D ?? ?? ?? ?? 85 C9 - empty = off)\n")
+                    f.write("keypad_signature=\n")
+                    f.write("keypad_signature_module=\n")
+                    f.write("keypad_signature_operand=2\n")
+                    f.write("keypad_code_chain=\n")
+                    f.write("keypad_code_format=ascii\n\n")
+                    
+                    f.write("# MEMORY WATCHES (listed in watches.txt)\n")
+                    f.write("timer_pause_watch=\n")
+                    f.write("telemetry=false\n")
+                    f.write("telemetry_capacity=100000\n\n")
+                    
+                    f.write("# KEYPAD RESUME (journal appends each attempt, compacts every N attempts)\n")
+                    f.write("resume_journal=true\n")
+                    f.write("resume_compact_every=500\n")
+                    f.write("persist_interval=1.0\n\n")
+                    
+                    f.write("# SOLVER ORDER (common, weighted, frequency, patterns, dates, numeric)\n")
+                    f.write("# weighted reads candidates.txt lines: code,weight\n")
+                    f.write(f"candidate_strategy={CandidateEngine.DEFAULT_SPEC}\n")
+                    f.write("# Keypad code length (3-8) and characters in keypad order\n")
+                    f.write("code_length=4\n")
+                    f.write(f"code_alphabet={CodeSpace.DIGITS}\n")
+                    f.write("# Known facts: 1??7 pattern, +123 only, -05 never, =137 contains, unique\n")
+                    f.write("code_constraints=\n")
+                    f.write("# Where you are in the game - its known_codes.txt codes are tried first\n")
+                    f.write("current_location=\n\n")
                     
                     f.write("# HUD THEME (default, military, alpha, rounded, minimal, modern2026)\n")
                     f.write("hud_theme=default\n")
@@ -442,26 +2825,52 @@ class ZombiUTrainer:
             self.status = f"Error creating settings: {e}"
     
     def load_keypad_resume(self):
-        """Load last codes from notepad file"""
+        """Load last codes from notepad file, then replay the attempt journal on top"""
         try:
             if os.path.exists(self.keypad_save_file):
                 with open(self.keypad_save_file, 'r') as f:
                     data = f.read().strip()
-                    if data:
-                        lines = data.split('\n')
-                        self.found_codes = []
-                        loaded_count = 0
-                        for line in lines:
-                            line = line.strip()
-                            if line.startswith('LAST:'):
-                                # Load last tried code
-                                self.keypad_code = line.replace('LAST:', '')
-                            elif line:
-                                # Load found codes (only last 10)
+                self.found_codes = []
+                self.tried_index.clear()
+                other_space_lines = {}
+                if data:
+                    lines = data.split('\n')
+                    # One SPACE: section per code space - only ours is loaded, the rest are kept as-is
+                    same_space = True
+                    for line in lines:
+                        line = line.strip()
+                        if line.startswith('SPACE:'):
+                            space_key = line.replace('SPACE:', '', 1)
+                            same_space = space_key == self.code_space.key()
+                        elif not same_space:
+                            if line.startswith('LAST:') or line.startswith('TRIED:'):
+                                other_space_lines.setdefault(space_key, []).append(line)
+                        elif line.startswith('LAST:'):
+                            # Load last tried code
+                            self.keypad_code = line.replace('LAST:', '')
+                        elif line.startswith('TRIED:'):
+                            # Load the full tried-code bitmap
+                            try:
+                                self.tried_index.load(line.replace('TRIED:', ''))
+                            except ValueError:
+                                pass
+                        elif line and not line.startswith('#'):
+                            # Load found codes (only last 10)
+                            if line in self.code_space:
                                 self.found_codes.append((line, "Resumed"))
-                                loaded_count += 1
-                        if loaded_count > 0:
-                            self.status = f"Loaded {loaded_count} recent codes"
+                                self.tried_index.add(line)
+                self.other_space_lines = other_space_lines
+                
+                # Replay attempts appended since the last compaction
+                for code, location in self.keypad_journal.replay():
+                    if self.tried_index.add(code):
+                        self.found_codes.append((code, location))
+                    if location == "Tried" and code in self.code_space:
+                        self.keypad_code = code
+                self._trim_found_codes()
+                
+                if len(self.tried_index) > 0:
+                    self.status = f"Loaded {len(self.tried_index)} tried codes"
             else:
                 # Create empty file if it doesn't exist
                 with open(self.keypad_save_file, 'w') as f:
@@ -490,6 +2899,11 @@ class ZombiUTrainer:
             pass  # Silent fail
     
     def save_blocked_keys(self):
+        """Queue a keys.txt write on the persistence worker"""
+        data = ','.join(sorted(self.blocked_keys))
+        self.persistence.submit('keys', lambda: self._write_blocked_keys(data))
+    
+    def _write_blocked_keys(self, data):
         """Save blocked keys to keys.txt file with verification"""
         try:
             keys_path = os.path.join(self.app_folder, self.keys_save_file)
@@ -507,7 +2921,7 @@ class ZombiUTrainer:
             temp_file = keys_path + '.tmp'
             
             with open(temp_file, 'w') as f:
-                f.write(','.join(sorted(self.blocked_keys)))
+                f.write(data)
                 f.flush()
                 try:
                     os.fsync(f.fileno())
@@ -538,7 +2952,28 @@ class ZombiUTrainer:
             print(f"DEBUG: Failed to save blocked keys: {e}")
     
     def save_taskbar_state(self):
-        """Save taskbar visibility state to settings.txt"""
+        """Queue a settings.txt taskbar update on the persistence worker"""
+        self.save_settings_values(taskbar_visible='true' if self.taskbar_visible else 'false')
+    
+    def save_settings_values(self, **values):
+        """Queue key=value updates to settings.txt - updates queued together are merged"""
+        with self.settings_lock:
+            self.pending_settings.update({key: str(value) for key, value in values.items()})
+        self.persistence.submit('settings', self._write_pending_settings)
+    
+    def _write_pending_settings(self):
+        # Updates stay pending until they are on disk - load_settings reads them over the file
+        with self.settings_lock:
+            updates = dict(self.pending_settings)
+        if updates:
+            self._write_settings(updates)
+        with self.settings_lock:
+            for key, value in updates.items():
+                if self.pending_settings.get(key) == value:
+                    del self.pending_settings[key]
+    
+    def _write_settings(self, updates):
+        """Rewrite settings.txt with the given key=value updates applied"""
         try:
             settings_path = os.path.join(self.app_folder, 'settings.txt')
             # Read current settings
@@ -552,17 +2987,74 @@ class ZombiUTrainer:
                                 key, value = line.split('=', 1)
                                 settings[key.strip()] = value.strip()
             
-            # Update taskbar state
-            settings['taskbar_visible'] = 'true' if self.taskbar_visible else 'false'
+            # Apply the queued updates
+            settings.update(updates)
             
-            # Write back to settings
-            with open(settings_path, 'w') as f:
+            # Write back to settings - via a temp file, the GUI re-reads settings.txt constantly
+            temp_file = settings_path + '.tmp'
+            with open(temp_file, 'w') as f:
                 f.write("# Zombi Tools Settings v1.0\n")
                 f.write("# Updated: 2026\n\n")
                 
                 f.write("# SPEED SETTINGS\n")
                 f.write(f"click_delay={settings.get('click_delay', '0.02')}\n")
-                f.write(f"enter_delay={settings.get('enter_delay', '0.02')}\n\n")
+                f.write(f"enter_delay={settings.get('enter_delay', '0.02')}\n")
+                f.write(f"click_settle={settings.get('click_settle', '0.005')}\n")
+                f.write(f"click_hold={settings.get('click_hold', '0.02')}\n")
+                f.write("# INPUT BACKEND (sendinput, pyautogui)\n")
+                f.write(f"input_backend={settings.get('input_backend', 'sendinput')}\n")
+                f.write(f"schedule_spin={settings.get('schedule_spin', '0.002')}\n")
+                f.write("# SOLVER INPUT (mouse = click calibrated circles, keyboard = type digits + enter)\n")
+                f.write(f"solver_input={settings.get('solver_input', 'mouse')}\n")
+                f.write(f"key_delay={settings.get('key_delay', '0.03')}\n")
+                f.write(f"key_enter_delay={settings.get('key_enter_delay', '0.3')}\n")
+                f.write(f"key_hold={settings.get('key_hold', '0.01')}\n")
+                f.write("# ADAPTIVE PACING (tunes the delays above, saved when a sweep ends - needs display_region digits learned)\n")
+                f.write(f"adaptive_pacing={settings.get('adaptive_pacing', 'false')}\n")
+                f.write(f"pacing_min_delay={settings.get('pacing_min_delay', '0.005')}\n")
+                f.write(f"pacing_max_delay={settings.get('pacing_max_delay', '0.25')}\n")
+                f.write("# INPUT VERIFICATION (display read back before ENTER, dropped codes are retried)\n")
+                f.write("# Keypad display left,top,right,bottom - learn its digits with L after placing the circles (empty = off)\n")
+                f.write(f"display_region={settings.get('display_region', '')}\n")
+                f.write(f"verify_delay={settings.get('verify_delay', '0.03')}\n")
+                f.write(f"verify_retries={settings.get('verify_retries', '3')}\n\n")
+                
+                f.write("# SUCCESS DETECTION (screen region left,top,right,bottom - empty = off)\n")
+                f.write(f"success_region={settings.get('success_region', '')}\n")
+                f.write(f"success_threshold={settings.get('success_threshold', '0.2')}\n")
+                f.write("# Memory watch: pointer chain like ZombiU.exe+0x1A2B3C,0x10 (empty = off)\n")
+                f.write(f"success_watch={settings.get('success_watch', '')}\n")
+                f.write(f"success_watch_type={settings.get('success_watch_type', 'byte')}\n")
+                f.write(f"success_watch_value={settings.get('success_watch_value', '')}\n")
+                f.write(f"success_watch_interval={settings.get('success_watch_interval', '0.002')}\n\n")
+                
+                f.write("# CODE EXTRACTION (signature like 8B 0D ?? ?? ?? ?? 85 C9 - empty = off)\n")
+                f.write(f"keypad_signature={settings.get('keypad_signature', '')}\n")
+                f.write(f"keypad_signature_module={settings.get('keypad_signature_module', '')}\n")
+                f.write(f"keypad_signature_operand={settings.get('keypad_signature_operand', '2')}\n")
+                f.write(f"keypad_code_chain={settings.get('keypad_code_chain', '')}\n")
+                f.write(f"keypad_code_format={settings.get('keypad_code_format', 'ascii')}\n\n")
+                
+                f.write("# MEMORY WATCHES (listed in watches.txt)\n")
+                f.write(f"timer_pause_watch={settings.get('timer_pause_watch', '')}\n")
+                f.write(f"telemetry={settings.get('telemetry', 'false')}\n")
+                f.write(f"telemetry_capacity={settings.get('telemetry_capacity', '100000')}\n\n")
+                
+                f.write("# KEYPAD RESUME (journal appends each attempt, compacts every N attempts)\n")
+                f.write(f"resume_journal={settings.get('resume_journal', 'true')}\n")
+                f.write(f"resume_compact_every={settings.get('resume_compact_every', '500')}\n")
+                f.write(f"persist_interval={settings.get('persist_interval', '1.0')}\n\n")
+                
+                f.write("# SOLVER ORDER (common, weighted, frequency, patterns, dates, numeric)\n")
+                f.write("# weighted reads candidates.txt lines: code,weight\n")
+                f.write(f"candidate_strategy={settings.get('candidate_strategy', CandidateEngine.DEFAULT_SPEC)}\n")
+                f.write("# Keypad code length (3-8) and characters in keypad order\n")
+                f.write(f"code_length={settings.get('code_length', '4')}\n")
+                f.write(f"code_alphabet={settings.get('code_alphabet', CodeSpace.DIGITS)}\n")
+                f.write("# Known facts: 1??7 pattern, +123 only, -05 never, =137 contains, unique\n")
+                f.write(f"code_constraints={settings.get('code_constraints', '')}\n")
+                f.write("# Where you are in the game - its known_codes.txt codes are tried first\n")
+                f.write(f"current_location={settings.get('current_location', '')}\n\n")
                 
                 f.write("# HUD THEME (default, military, alpha, rounded, minimal, modern2026)\n")
                 f.write(f"hud_theme={settings.get('hud_theme', 'default')}\n")
@@ -590,7 +3082,7 @@ class ZombiUTrainer:
                 
                 f.write("# WINDOW SETTINGS\n")
                 f.write(f"fullscreen_enabled={settings.get('fullscreen_enabled', 'false')}\n")
-                f.write(f"taskbar_visible={settings['taskbar_visible']}\n\n")
+                f.write(f"taskbar_visible={settings.get('taskbar_visible', 'true')}\n\n")
                 
                 f.write("# DEVELOPER SETTINGS (DEFAULT: ALL OFF)\n")
                 f.write(f"dev_mode={settings.get('dev_mode', 'false')}\n")
@@ -598,11 +3090,27 @@ class ZombiUTrainer:
                 f.write(f"dev_show_fps={settings.get('dev_show_fps', 'false')}\n")
                 f.write(f"dev_show_mouse_pos={settings.get('dev_show_mouse_pos', 'false')}\n")
                 f.write(f"dev_show_hotkey_debug={settings.get('dev_show_hotkey_debug', 'false')}\n")
+                f.write(f"dev_always_on_top={settings.get('dev_always_on_top', 'true')}\n")
+                f.write(f"dev_window_transparency={settings.get('dev_window_transparency', '0.95')}\n\n")
+            
+            # Windows refuses to replace a file the GUI is reading right now - retry briefly
+            for attempt in range(5):
+                try:
+                    os.replace(temp_file, settings_path)
+                    break
+                except PermissionError:
+                    time.sleep(0.02)
         except Exception as e:
-            pass
+            print(f"DEBUG: Failed to save settings: {e}")
     
     def save_keypad_resume(self):
+        """Queue a resume snapshot (journal compaction) on the persistence worker"""
+        self.persistence.submit('keypad_resume', self._write_keypad_resume)
+    
+    def _write_keypad_resume(self):
         """Save ALL codes to notepad file but keep memory optimized"""
+        # Also the journal compaction step - runs on the persistence worker, the only journal committer,
+        # so the snapshot always covers everything already in the log
         try:
             # Create backup before overwriting
             backup_file = self.keypad_save_file + '.bak'
@@ -617,8 +3125,11 @@ class ZombiUTrainer:
             temp_file = self.keypad_save_file + '.tmp'
             
             with open(temp_file, 'w') as f:
+                # Code length/alphabet the bitmap below belongs to
+                f.write(f"SPACE:{self.code_space.key()}\n")
+                
                 # Save ALL found codes to notepad
-                for code_tuple in self.found_codes:
+                for code_tuple in list(self.found_codes):
                     if code_tuple and code_tuple[0]:
                         f.write(code_tuple[0] + '\n')
                 
@@ -626,6 +3137,16 @@ class ZombiUTrainer:
                 if self.keypad_code:
                     f.write(f"LAST:{self.keypad_code}\n")
                 
+                # Save every tried code as one bitmap line
+                if len(self.tried_index) > 0:
+                    f.write(f"TRIED:{self.tried_index.dump()}\n")
+                
+                # Progress saved under other code lengths/alphabets survives a settings change
+                for space_key, lines in list(self.other_space_lines.items()):
+                    if space_key != self.code_space.key():
+                        f.write(f"SPACE:{space_key}\n")
+                        f.writelines(line + '\n' for line in lines)
+                
                 # Force flush before close
                 f.flush()
                 try:
@@ -655,17 +3176,33 @@ class ZombiUTrainer:
             except:
                 pass
             
-            # Keep found_codes limited in memory to prevent crash (but ALL saved to file)
-            # Keep only last 10 codes in memory for GUI display
-            if len(self.found_codes) > 10:
-                self.found_codes = self.found_codes[-10:]
+            # Snapshot now holds everything the journal recorded
+            self.keypad_journal.truncate()
         except Exception as e:
             self.status = f"ERROR saving resume: {e}"
             print(f"DEBUG: Failed to save keypad resume: {e}")
     
+    def _trim_found_codes(self):
+        # Keep found_codes limited in memory to prevent crash (but ALL saved to file)
+        # Keep only last 10 codes in memory for GUI display
+        if len(self.found_codes) > 10:
+            self.found_codes = self.found_codes[-10:]
+    
+    def _record_attempt(self, code, location):
+        """Persist one attempt - journal append in the hot loop, full save otherwise"""
+        if not self.resume_journal:
+            self.save_keypad_resume()
+            return
+        pending = self.keypad_journal.append(code, location)
+        self.persistence.submit('keypad_journal', self.keypad_journal.commit)
+        if pending >= self.resume_compact_every:
+            self.save_keypad_resume()
+    
     def reset_keypad_resume(self):
         """Delete the resume file"""
         try:
+            # Let queued writes land first so they cannot recreate the file
+            self.persistence.flush()
             if os.path.exists(self.keypad_save_file):
                 # Make file writable before deleting
                 try:
@@ -673,7 +3210,10 @@ class ZombiUTrainer:
                 except:
                     pass
                 os.remove(self.keypad_save_file)
+            self.keypad_journal.remove()
+            self.other_space_lines = {}
             self.found_codes = []
+            self.tried_index.clear()
             self.keypad_code = ""
             self.last_successful_code = ""
             self.status = "Keypad solver reset - all data cleared"
@@ -696,6 +3236,9 @@ class ZombiUTrainer:
     def reset_all_data(self):
         """Reset ALL saved application data"""
         try:
+            # Let queued writes land first so they cannot recreate the files
+            self.persistence.flush()
+            
             # Delete settings.txt
             if os.path.exists('settings.txt'):
                 try:
@@ -711,6 +3254,7 @@ class ZombiUTrainer:
                 except:
                     pass
                 os.remove(self.keypad_save_file)
+            self.keypad_journal.remove()
             
             # Delete keys.txt
             if os.path.exists(self.keys_save_file):
@@ -722,6 +3266,7 @@ class ZombiUTrainer:
             
             # Reset all variables
             self.found_codes = []
+            self.tried_index.clear()
             self.keypad_code = ""
             self.last_successful_code = ""
             self.blocked_keys.clear()
@@ -755,6 +3300,8 @@ class ZombiUTrainer:
                             self.process_found = True
                             self.process_name = found_process
                             self.status = f"✓ GAME DETECTED ({found_process})"
+                            self._attach_offset_cache()
+                            self._start_watch_engine()
                         except:
                             self.status = f"Found: {found_process} (Access Denied)"
                             self.pm = None
@@ -768,21 +3315,203 @@ class ZombiUTrainer:
                     except:
                         self.pm = None
                         self.process_found = False
+                        self.game_fingerprint = None
+                        self._stop_watch_engine()
                         self.status = "Game closed"
             except:
                 self.pm = None
                 self.process_found = False
             time.sleep(2)
 
+    def _attach_offset_cache(self, memory=None):
+        """Fingerprint the attached build, drop cached offsets from any other build and load ours"""
+        self.keypad_global_offset = None
+        try:
+            memory = memory or ProcessMemory(self.pm)
+            self.game_fingerprint = module_fingerprint(memory, self.process_name)
+            kept, dropped = self.offset_cache.attach(self.game_fingerprint)
+            if dropped:
+                self.persistence.submit('offset_cache', self.offset_cache.write)
+                print(f"DEBUG: game build changed - dropped {dropped} cached offsets")
+            if kept:
+                print(f"DEBUG: {kept} cached offsets valid for {self.game_fingerprint}")
+            if self.keypad_signature and not self.keypad_signature_module:
+                cached = self.offset_cache.get(self.game_fingerprint, f"sig:{Signature(self.keypad_signature).text}")
+                if cached is not None:
+                    self.keypad_global_offset = int(cached, 16)
+                    print(f"DEBUG: keypad code offset cached (+0x{self.keypad_global_offset:x}) - no scan needed")
+        except Exception as e:
+            self.game_fingerprint = None
+            print(f"[ERROR] _attach_offset_cache: {e}")
+    
+    def _load_watches(self):
+        """Watches from watches.txt - a commented template is created on first run"""
+        path = os.path.join(self.app_folder, "watches.txt")
+        if not os.path.exists(path):
+            try:
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write("# MEMORY WATCHES - sampled together while the game is attached\n")
+                    f.write("# name=pointer chain|type|samples per second[|hud]\n")
+                    f.write("# types: " + ', '.join(VALUE_TYPES) + "\n")
+                    f.write("# add |hud to show the value under the status line\n")
+                    f.write("# loading=ZombiU.exe+0x1A2B3C,0x10|byte|100\n")
+            except Exception as e:
+                print(f"[ERROR] Creating watches.txt: {e}")
+        return parse_watches(path)
+    
+    def _start_watch_engine(self, memory=None):
+        """Start sampling watches.txt on the attached game"""
+        self._stop_watch_engine()
+        try:
+            watches = self._load_watches()
+            self.watch_engine = WatchEngine(memory or ProcessMemory(self.pm), watches)
+            self.hud_watches = [w.name for w in watches if w.hud]
+            self.watch_values = self.watch_engine.subscribe(self._on_watch_change)
+            if self.telemetry and watches:
+                self.telemetry_ring = TelemetryRing(os.path.join(self.app_folder, "telemetry.ring"),
+                                                    [w.name for w in watches], self.telemetry_capacity)
+                self.watch_engine.recorder = self.telemetry_ring.record_values
+            self.watch_engine.start()
+        except Exception as e:
+            self.watch_engine = None
+            print(f"[ERROR] _start_watch_engine: {e}")
+    
+    def _stop_watch_engine(self):
+        if self.watch_engine:
+            self.watch_engine.stop()
+            self.watch_engine = None
+        if self.telemetry_ring:
+            self.telemetry_ring.close()
+            self.telemetry_ring = None
+        self.watch_values = {}
+    
+    def call_on_gui(self, callback):
+        """Run callback on the GUI thread at its next update - Tk and the timer state are not thread-safe"""
+        self.gui_calls.append(callback)
+    
+    def run_gui_calls(self):
+        """Called from the GUI update loop"""
+        while self.gui_calls:
+            try:
+                self.gui_calls.popleft()()
+            except Exception as e:
+                print(f"[ERROR] run_gui_calls: {e}")
+    
+    def _on_watch_change(self, name, old, new, timestamp):
+        # Runs on the watch sampler thread
+        self.watch_values[name] = new
+        if name == self.timer_pause_watch and new is not None:
+            # Time the change on this thread, apply it on the GUI thread with the other timer updates
+            now = time.time()
+            self.call_on_gui(lambda: self._auto_pause_timer(bool(new), now))
+    
+    def _auto_pause_timer(self, paused, now):
+        if not self.timer_active:
+            return
+        if paused and not self.timer_paused:
+            self.timer_paused = True
+            self.timer_auto_paused = True
+            self.timer_elapsed = now - self.timer_start
+        elif not paused and self.timer_paused and self.timer_auto_paused:
+            self.timer_paused = False
+            self.timer_auto_paused = False
+            self.timer_start = now - self.timer_elapsed
+    
     def mark_code_successful(self, code):
         self.last_successful_code = code
         self.status = f"✓ SUCCESS! Code {code} saved as last good code"
         self.add_found_code(code, "Successful")
+        self.success_history.append((code, self.current_location, time.time()))
+        self.persistence.submit('success_history', self._write_success_history)
+    
+    def load_success_history(self):
+        """Load success_history.txt - "code|location|time" per line"""
+        self.success_history = []
+        try:
+            with open(self.success_history_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    parts = line.rstrip('\n').split('|')
+                    if len(parts) == 3 and parts[0]:
+                        try:
+                            self.success_history.append((parts[0], parts[1], float(parts[2])))
+                        except ValueError:
+                            pass
+        except OSError:
+            pass
+        if self.success_history:
+            self.last_successful_code = self.success_history[-1][0]
+    
+    def _write_success_history(self):
+        lines = [f"{code}|{location}|{when:.0f}\n" for code, location, when in list(self.success_history)]
+        temp_file = self.success_history_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+        os.replace(temp_file, self.success_history_file)
+    
+    @staticmethod
+    def parse_known_codes(path):
+        """(location, code) pairs from "location,code" lines (tab or ; also work)"""
+        entries = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                parts = re.split(r'[,;\t]', line, maxsplit=1)
+                if len(parts) == 2 and parts[1].strip():
+                    entries.append((parts[0].strip(), parts[1].strip()))
+                elif len(parts) == 1:
+                    entries.append(("", parts[0]))
+        return entries
+    
+    def load_known_codes(self):
+        try:
+            self.known_codes = self.parse_known_codes(self.known_codes_file)
+        except OSError:
+            self.known_codes = []
+        self._rebuild_known_index()
+    
+    def _rebuild_known_index(self):
+        self.known_index = KnownCodeIndex(self.known_codes)
+    
+    def lookup_known_code(self, text):
+        """First indexed code for a location name (or code prefix) that fits the keypad"""
+        for location, code in self.known_index.search(text, limit=50):
+            if code in self.code_space:
+                return location, code
+        return None
+    
+    def import_known_codes(self, path):
+        """Merge a "location,code" list into known_codes.txt - returns how many were new"""
+        try:
+            entries = self.parse_known_codes(path)
+        except Exception as e:
+            self.status = f"Import failed: {str(e)[:50]}"
+            return 0
+        existing = set(self.known_codes)
+        added = [entry for entry in dict.fromkeys(entries) if entry not in existing]
+        self.known_codes.extend(added)
+        self._rebuild_known_index()
+        lines = ["# Known keypad codes - location,code per line\n"]
+        lines += [f"{location},{code}\n" for location, code in self.known_codes]
+        
+        def write_known_codes():
+            temp_file = self.known_codes_file + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+            os.replace(temp_file, self.known_codes_file)
+        self.persistence.submit('known_codes', write_known_codes)
+        self.status = f"✓ Imported {len(added)} known codes ({len(self.known_codes)} total)"
+        return len(added)
+    
+    def _learned_strategy(self):
+        successes = [(code, location) for code, location, _ in self.success_history]
+        return LearnedStrategy(self.code_space, successes, self.known_codes, self.current_location)
 
     def try_manual_code(self, code):
         try:
-            if not code or len(code) != 4 or not code.isdigit():
-                self.status = "Invalid code (need 4 digits: 0-9)"
+            if not code or code not in self.code_space:
+                self.status = f"Invalid code (need {self.code_space.describe()})"
                 return
             
             self.keypad_code = code
@@ -808,42 +3537,106 @@ class ZombiUTrainer:
             print(f"[ERROR] try_manual_code: {e}")
             self.status = f"Error: {str(e)[:50]}"
 
+    def extract_keypad_code(self, memory=None):
+        """Read the active keypad's code from game memory and try it - returns the code or None"""
+        if not self.keypad_signature:
+            self.status = "Set keypad_signature in settings.txt first"
+            return None
+        if memory is None:
+            if not self.pm:
+                self.status = "Game not attached - cannot scan memory"
+                return None
+            memory = ProcessMemory(self.pm)
+        # Computed once on attach - only valid when the signature lives in the game executable
+        fingerprint = None if self.keypad_signature_module else self.game_fingerprint
+        try:
+            chain = [int(v, 0) for v in self.keypad_code_chain.split(',') if v.strip()]
+            extractor = KeypadCodeExtractor(self.keypad_signature,
+                                            self.keypad_signature_module or self.process_name,
+                                            self.keypad_signature_operand, chain, self.keypad_code_format,
+                                            self.code_space.length)
+            code = None
+            if fingerprint and self.keypad_global_offset is not None:
+                # Offset loaded from the cache on attach - no scan at all
+                try:
+                    code = extractor.read_code(memory, self.keypad_global_offset)
+                except Exception:
+                    self.keypad_global_offset = None
+            if code is None:
+                self.status = "🔍 Scanning game memory for keypad code..."
+                code, cached = extractor.extract(memory, self.offset_cache, fingerprint)
+                if not cached:
+                    self.persistence.submit('offset_cache', self.offset_cache.write)
+                if fingerprint:
+                    self.keypad_global_offset = int(self.offset_cache.get(fingerprint, extractor.cache_key()), 16)
+        except Exception as e:
+            self.status = f"Code scan failed: {str(e)[:50]}"
+            print(f"[ERROR] extract_keypad_code: {e}")
+            return None
+        self.status = f"✓ Code found in memory: {code}"
+        self.try_manual_code(code)
+        return code
+    
     def add_found_code(self, code, location):
         try:
             if not code or not isinstance(code, str):
                 return False
             
-            # Only add valid 4-digit codes
-            if len(code) != 4 or not code.isdigit():
+            # Only add codes of the configured length/alphabet
+            if code not in self.code_space:
                 return False
             
-            if not any(c[0] == code for c in self.found_codes):
+            if self.tried_index.add(code):
                 self.found_codes.append((code, location))
-                self.save_keypad_resume()  # Auto-save when code is added
+                self._trim_found_codes()
+                self._record_attempt(code, location)  # Auto-save when code is added
                 return True
             return False
         except Exception as e:
             print(f"[ERROR] add_found_code: {e}")
             return False
 
+    def cancel_countdown(self):
+        """Stop a running autostart countdown - its waits wake immediately"""
+        self.autostart_timer_running = False
+        self.circle_ready = False
+        self.countdown_cancel.set()
+
     def start_countdown_then_clicker(self):
         """Show countdown in status, then start auto-clicker"""
+        if self.learning_digits:
+            self.status = "⚠ Keypad digits are being learned - wait or press F1"
+            return
+        cancel = self.countdown_cancel = threading.Event()
+        
         def countdown_thread():
+            try:
+                countdown()
+            finally:
+                # Over either way - releases the countdown's F1 watcher
+                self.autostart_timer_running = False
+                cancel.set()
+        
+        def countdown():
             countdown_time = self.autostart_timer_delay if self.autostart_timer_enabled else 0
             
             # Show resuming message if there are saved codes
-            if self.found_codes:
-                self.status = f"Resuming now... {len(self.found_codes)} saved codes loaded"
-                time.sleep(1)
+            if len(self.tried_index) > 0:
+                self.status = f"Resuming now... {len(self.tried_index)} saved codes loaded"
+                if cancel.wait(1):
+                    self.status = "Countdown cancelled"
+                    return
             
             if countdown_time <= 0:
                 self.status = "Starting auto-clicker NOW!"
-                time.sleep(0.5)
+                if cancel.wait(0.5):
+                    self.status = "Countdown cancelled"
+                    return
                 self.start_screen_clicker()
                 return
             
             for i in range(countdown_time, 0, -1):
-                if not self.circle_ready:
+                if cancel.is_set() or not self.circle_ready:
                     self.status = "Countdown cancelled"
                     return
                 
@@ -860,7 +3653,9 @@ class ZombiUTrainer:
                     except:
                         print('\a')
                 
-                time.sleep(1)
+                if cancel.wait(1):
+                    self.status = "Countdown cancelled"
+                    return
             
             # Final beep
             if self.sound_enabled:
@@ -871,46 +3666,99 @@ class ZombiUTrainer:
                     print('\a')
             
             self.status = "Starting auto-clicker NOW!"
-            time.sleep(0.5)
+            if cancel.wait(0.5):
+                self.status = "Countdown cancelled"
+                return
             self.start_screen_clicker()
         
         self.autostart_timer_running = True
         self.autostart_timer_start_time = time.time()
         Thread(target=countdown_thread, daemon=True).start()
+        Thread(target=self._watch_stop_key, args=(cancel, self.cancel_countdown,
+                                                  "F1 PRESSED - AUTOSTART TIMER CANCELLED!"), daemon=True).start()
+
+    def start_solver(self, placer):
+        """Keyboard input types straight into the game - only mouse input needs circles"""
+        if self.solver_input == 'keyboard':
+            self.circle_ready = True
+            self.start_countdown_then_clicker()
+        else:
+            placer.show()
 
     def start_screen_clicker(self):
-        # Safety check: ensure we have valid circle positions
-        if not self.circle_positions or len(self.circle_positions) < 12:
-            self.status = "⚠ Place 12 circles first! Current: " + str(len(self.circle_positions) if self.circle_positions else 0)
+        keyboard_input = self.solver_input == 'keyboard'
+        if keyboard_input:
+            plan = KeyPlan(self.key_delay, self.key_enter_delay, self.key_hold)
+        else:
+            # Safety check: validate the circle positions once by compiling the click plan
+            try:
+                plan = ClickPlan(self.circle_positions, self.click_delay, self.enter_delay,
+                                 self.click_settle, self.click_hold)
+            except ValueError as e:
+                self.status = str(e)
+                self.auto_clicking = False
+                return
+        
+        if self.auto_clicking:
             self.auto_clicking = False
+            self.status = "Screen clicker stopped"
             return
         
-        # Verify all positions are valid
-        invalid_positions = []
-        for i, pos in enumerate(self.circle_positions):
-            if pos is None or len(pos) < 2 or pos[0] is None or pos[1] is None:
-                invalid_positions.append(i)
-        
-        if invalid_positions:
-            self.status = f"⚠ Invalid circle positions: {invalid_positions}. Place circles again!"
-            self.auto_clicking = False
+        # The calibrated circles only cover 0-9
+        if not keyboard_input and not set(self.code_space.alphabet) <= set(CodeSpace.DIGITS):
+            self.status = "⚠ Circle clicking only types 0-9 - fix code_alphabet"
             return
         
-        if self.auto_clicking:
-            self.auto_clicking = False
-            self.status = "Screen clicker stopped"
+        try:
+            constraints = CodeConstraints(self.code_space, self.code_constraints)
+        except ValueError as e:
+            self.status = f"⚠ code_constraints: {e}"
             return
         
+        # Reload resume data to ensure fresh data from file - done here so the
+        # clicker thread itself never touches the filesystem
+        self.persistence.flush()
+        self.load_keypad_resume()
+        
         self.auto_clicking = True
-        self.status = "🖱️ Starting..."
-        Thread(target=self._screen_clicker_thread, daemon=True).start()
+        self.show_search_space(constraints, f"{'⌨️' if keyboard_input else '🖱️'} Starting... ")
+        backend = KeyboardBackend() if keyboard_input else make_input_backend(self.input_backend)
+        backend.scheduler = self.click_scheduler = DeadlineScheduler(self.schedule_spin, cancel=self.click_cancel)
+        Thread(target=self._screen_clicker_thread, args=(plan, backend, constraints), daemon=True).start()
+        Thread(target=self._watch_stop_key, args=(self.click_cancel, self._stop_clicking,
+                                                  "F1 PRESSED - AUTO-CLICKER STOPPED!"), daemon=True).start()
 
-    def _screen_clicker_thread(self):
-        # Initial wait - reduced for faster start
-        time.sleep(0.5)
-        
-        # Reload resume data to ensure fresh data from file
-        self.load_keypad_resume()
+    def show_search_space(self, constraints, prefix):
+        """Status "<prefix>N codes", then " (M untried)" once a worker has checked the tried bitmap"""
+        # M needs every matching code checked, so it never runs on the caller's (possibly Tk) thread
+        total = constraints.count()
+        summary = f"{prefix}{total:,} codes"
+        self.status = summary
+        if total > 1000000:
+            return  # Too many to check against the tried bitmap quickly
+        
+        def count_untried():
+            untried = sum(1 for code in constraints.enumerate() if code not in self.tried_index)
+            if self.status == summary:  # Leave newer messages alone
+                self.status = f"{summary} ({untried:,} untried)"
+        
+        Thread(target=count_untried, daemon=True).start()
+    
+    def set_code_constraints(self, text):
+        """Validate and save code_constraints, showing the remaining search space"""
+        try:
+            constraints = CodeConstraints(self.code_space, text)
+        except ValueError as e:
+            self.status = f"⚠ Constraints: {e}"
+            return False
+        self.code_constraints = constraints.text
+        self.save_settings_values(code_constraints=constraints.text)
+        self.show_search_space(constraints, "🔒 Search space: ")
+        return True
+
+    def _screen_clicker_thread(self, plan, backend, constraints=None):
+        # Initial wait - reduced for faster start, F1 ends it early
+        self.click_cancel.wait(0.5)
         
         # Check if resuming from previous session
         resuming = self.keypad_code  # Only check keypad_code for display
@@ -919,140 +3767,374 @@ class ZombiUTrainer:
         else:
             self.status = "Auto-clicking started!"
         
-        button_map = {
-            '1': 0, '2': 1, '3': 2, '4': 3, '5': 4, '6': 5,
-            '7': 6, '8': 7, '9': 8, '0': 9, 'enter': 10, 'clear': 11
-        }
-        
-        common_codes = ['0451', '1984', '1337', '4815', '1234', '0000', '1111', '4321']
-        
-        # Get already tried codes from found_codes
-        tried_codes = set()
-        for code_list in self.found_codes:
-            tried_codes.add(code_list[0])
-        
-        # If resuming from a common code, skip to that code
-        last_common_index = -1
-        if resuming and self.keypad_code and self.keypad_code in common_codes:
-            last_common_index = common_codes.index(self.keypad_code)
-            # Start from the next common code
-            last_common_index += 1
-        else:
-            # Not resuming from common code, do all common codes first
-            last_common_index = 0
-        
-        # Priority 1: Common Codes - Start from where we left off
-        for i in range(last_common_index, len(common_codes)):
+        # Candidate order comes from the strategies picked in settings.txt
+        engine = CandidateEngine(self.candidate_strategy, self.app_folder, self.code_space, constraints,
+                                 self._learned_strategy())
+        
+        # Already tried codes (every attempt, not just the GUI list) - the sweep
+        # always walks the whole stream and resumes by skipping these, so an
+        # edited candidates.txt or an untried suspect code is never passed over
+        tried_codes = self.tried_index
+        
+        self.entered_codes.clear()
+        detectors = self._build_success_detectors()
+        reader = self._build_display_reader()
+        retry = self.retry_queue
+        retry.clear()
+        self.verify_stats.clear()
+        
+        pacer = None
+        if self.adaptive_pacing:
+            pacer = AdaptivePacer(plan.click_delay, plan.enter_delay,
+                                  self.pacing_min_delay, self.pacing_max_delay)
+            if reader is None and not self.feedback_sources:
+                print("DEBUG: adaptive_pacing has no feedback (no display_region digits or feedback source) - delays stay fixed")
+        
+        for code in engine.candidates():
             if not self.auto_clicking:
+                # A memory watch may have flipped between attempts
+                if not self._code_succeeded(detectors, None):
+                    self.status = "Auto-clicker stopped"
+                self._finish_sweep(detectors, pacer)
                 return
-            code = common_codes[i]
-            # Skip if already tried
+            
+            # Skip already tried codes
             if code not in tried_codes:
-                self._click_code_on_screen(code, button_map)
-        
-        # Priority 2: All Combinations - Continue from last position
-        start_num = 0
-        if resuming and self.keypad_code and len(self.keypad_code) == 4 and self.keypad_code not in common_codes:
-            try:
-                # Start from NEXT code after last tried
-                start_num = int(self.keypad_code) + 1
-            except ValueError:
-                start_num = 0
-        
-        for num in range(start_num, 10000):
-            if not self.auto_clicking:
-                self.status = "Auto-clicker stopped"
-                return
+                retry.append((code, 0))
             
-            code = f"{num:04d}"
-            # Skip common codes and already tried codes
-            if code not in common_codes and code not in tried_codes:
-                self._click_code_on_screen(code, button_map)
+            # Codes whose digits were dropped go again straight away, at the
+            # slower pace the drop caused - a stop leaves them untried for the
+            # next sweep
+            while retry:
+                code, tries = retry.popleft()
+                verdict = self._click_code_on_screen(code, plan, backend, reader)
+                if verdict is False:
+                    if tries + 1 < self.verify_retries:
+                        retry.append((code, tries + 1))
+                    else:
+                        # Never read back correctly - it was never fully entered, so it
+                        # stays out of tried_index and the next sweep tries it again
+                        self.verify_stats['suspect'] += 1
+                        self.suspect_codes.append(code)
+                        print(f"DEBUG: {code} never read back correctly - left untried")
+                elif self._code_succeeded(detectors, code):
+                    self._finish_sweep(detectors, pacer)
+                    return
+                if not self.auto_clicking:
+                    # Stopped mid-code
+                    self._finish_sweep(detectors, pacer)
+                    return
+                if pacer:
+                    plan = self._pace(pacer, plan, code, False if verdict == ENTER_RESENT else verdict)
         
+        self._finish_sweep(detectors, pacer)
         self.auto_clicking = False
         self.status = "All combinations clicked"
 
-    def _click_code_on_screen(self, code, button_map):
-        # Safety check: ensure circles are placed
-        if not self.circle_positions or len(self.circle_positions) < 12:
-            self.status = "ERROR: Not enough circles placed! Need 12 circles."
-            self.auto_clicking = False
+    def load_keypad_ocr(self):
+        """KeypadOCR for display_region - from memory or keypad_glyphs.npz, None if not learned yet"""
+        region = self.display_region
+        if not region:
+            return None
+        if self.keypad_ocr is None or self.keypad_ocr.region != region:
+            try:
+                self.keypad_ocr = KeypadOCR.load(self.keypad_glyphs_file, region)
+            except Exception as e:
+                print(f"[ERROR] load_keypad_ocr: {e}")
+                self.keypad_ocr = None
+        return self.keypad_ocr
+    
+    def learn_keypad_digits(self, on_done=None):
+        """Learn Keypad Digits - runs capture_keypad_glyphs on its own thread, F1 cancels, then on_done()"""
+        # It clicks the live keypad, so it only ever starts from an explicit action
+        # and never while the solver or its countdown is running
+        if self.auto_clicking or self.autostart_timer_running or self.learning_digits:
+            self.status = "⚠ Stop the solver (F1) before learning keypad digits"
             return
+        cancel = self.learn_cancel = threading.Event()
+        self.learning_digits = True
         
-        self.keypad_code = code
-        self.status = f"Clicking: {code}"
-        
-        # Add this code to tried codes list for notepad file
-        self.add_found_code(code, "Tried")
+        def learn():
+            learned = None
+            try:
+                learned = self.capture_keypad_glyphs(cancel=cancel)
+            finally:
+                self.learning_digits = False
+                cancelled = cancel.is_set()
+                cancel.set()  # Releases the F1 watcher
+            if on_done and learned is not None and not cancelled:
+                on_done()
+        
+        Thread(target=learn, daemon=True).start()
+        Thread(target=self._watch_stop_key, args=(cancel, cancel.set,
+                                                  "F1 PRESSED - DIGIT LEARNING CANCELLED!"), daemon=True).start()
+    
+    def capture_keypad_glyphs(self, source=None, backend=None, cancel=None):
+        """Type every digit once on the calibrated circles and learn its glyph from the display"""
+        # CLEAR goes in before each digit so every frame shows one glyph; nothing is submitted
+        region = self.display_region
+        if not region:
+            self.status = "⚠ Set display_region in settings.txt first"
+            return None
+        try:
+            plan = ClickPlan(self.circle_positions, 0.0, 0.0, self.click_settle, self.click_hold)
+        except ValueError as e:
+            self.status = str(e)
+            return None
+        source = source or ScreenFrameSource()
+        if backend is None:
+            backend = make_input_backend(self.input_backend)
+            backend.scheduler = DeadlineScheduler(self.schedule_spin, cancel=cancel)
+        still_running = lambda: cancel is None or not cancel.is_set()
+        
+        def settle(events):
+            return backend.run(events, still_running) and backend.wait(KeypadOCR.SETTLE)
         
         try:
-            for digit in code:
-                if not self.auto_clicking:
-                    return
-                
-                # Safety check for button_map
-                if digit not in button_map:
-                    print(f"[ERROR] Invalid digit in code: {digit}")
-                    return
-                
-                pos_index = button_map[digit]
-                
-                # Safety check for circle_positions array
-                if pos_index >= len(self.circle_positions):
-                    print(f"[ERROR] Circle position {pos_index} out of bounds. Only {len(self.circle_positions)} circles placed.")
-                    self.status = f"ERROR: Circle {pos_index} not placed!"
-                    self.auto_clicking = False
-                    return
-                
-                x, y = self.circle_positions[pos_index]
-                
-                # Validate coordinates
-                if x is None or y is None:
-                    print(f"[ERROR] Invalid coordinates for button {digit}")
-                    self.status = f"ERROR: Invalid coordinates for {digit}"
-                    self.auto_clicking = False
-                    return
-                
-                pyautogui.moveTo(x, y, duration=0)
-                time.sleep(0.005)
-                pyautogui.mouseDown(x, y)
-                time.sleep(0.02)
-                pyautogui.mouseUp(x, y)
-                time.sleep(self.click_delay)
-            
-            if not self.auto_clicking:
-                return
-            
-            # Check ENTER button
-            if button_map['enter'] >= len(self.circle_positions):
-                print(f"[ERROR] ENTER button position out of bounds")
-                self.status = "ERROR: ENTER button not placed!"
-                self.auto_clicking = False
-                return
-            
-            enter_x, enter_y = self.circle_positions[button_map['enter']]
-            
-            # Validate ENTER coordinates
-            if enter_x is None or enter_y is None:
-                print(f"[ERROR] Invalid ENTER coordinates")
-                self.status = "ERROR: Invalid ENTER coordinates"
-                self.auto_clicking = False
+            if not settle(plan.clear_events):
+                return None
+            ocr = KeypadOCR(source.grab(region), region)
+            for digit in '1234567890':
+                self.status = f"🔢 Learning keypad digit {digit}..."
+                if not settle(plan.compile_digits(digit)):
+                    return None
+                ocr.learn(digit, source.grab(region))
+                if not settle(plan.clear_events):
+                    return None
+            ocr.save(self.keypad_glyphs_file)
+            self.keypad_ocr = ocr
+            self.status = "✓ Keypad digits learned - input verification on"
+            return ocr
+        except Exception as e:
+            print(f"[ERROR] capture_keypad_glyphs: {e}")
+            self.status = f"Digit learning failed: {str(e)[:40]}"
+            return None
+    
+    def _build_display_reader(self):
+        """The registered display_reader, or the OCR reader on display_region once digits are learned"""
+        if self.display_reader is not None:
+            return self.display_reader
+        ocr = self.load_keypad_ocr()
+        if ocr is None:
+            return None
+        return ScreenDisplayReader(ScreenFrameSource(), self.display_region, ocr)
+    
+    def read_keypad_display(self):
+        """Digits currently on the keypad display - None when there is no reader or it is unreadable"""
+        reader = self._build_display_reader()
+        if reader is None:
+            return None
+        try:
+            return reader.read()
+        except Exception as e:
+            print(f"[ERROR] read_keypad_display: {e}")
+            return None
+    
+    def _build_success_detectors(self):
+        """Detectors for this sweep - the screen region from settings plus any registered ones"""
+        detectors = list(self.success_detectors)
+        if self.success_region:
+            detector = ScreenSuccessDetector(ScreenFrameSource(), self.success_region, self.success_threshold)
+            try:
+                detector.capture_reference()
+                detectors.append(detector)
+            except Exception as e:
+                print(f"[ERROR] success region capture: {e}")
+        if self.success_watch:
+            detector = self._build_memory_watch()
+            if detector:
+                detectors.append(detector)
+        return detectors
+    
+    def _build_memory_watch(self):
+        """Start the memory-watch sampler on the attached game, or None if not possible"""
+        if not self.pm:
+            print("[ERROR] success_watch set but the game is not attached")
+            return None
+        try:
+            chain = PointerChain.parse(self.success_watch)
+            fmt = VALUE_TYPES[self.success_watch_type][0]
+            target = None
+            if self.success_watch_value:
+                target = float(self.success_watch_value) if 'f' in fmt or 'd' in fmt else int(self.success_watch_value, 0)
+            if not self.watch_engine:
+                self._start_watch_engine()
+            self.watch_engine.add_watch(Watch('success_watch', chain, self.success_watch_type,
+                                              self.success_watch_interval))
+            detector = MemoryWatchDetector(self.watch_engine, 'success_watch', target,
+                                           on_flip=self._stop_on_success)
+            detector.start()
+            return detector
+        except Exception as e:
+            print(f"[ERROR] success_watch: {e}")
+            return None
+    
+    def _stop_on_success(self):
+        # Runs on the sampler thread - stop input right away, the clicker records the code
+        self.auto_clicking = False
+    
+    def _code_succeeded(self, detectors, code):
+        """Check the detectors right after ENTER - on success record the code and stop"""
+        # code is None between attempts - only detectors that timestamp their flip can name it then
+        for detector in detectors:
+            if code is None and getattr(detector, 'flip_time', None) is None:
+                continue
+            try:
+                if not detector.check():
+                    continue
+            except Exception as e:
+                print(f"[ERROR] success detector: {e}")
+                continue
+            flip_time = getattr(detector, 'flip_time', None)
+            if flip_time is not None:
+                # Credit the last code whose ENTER landed before the value flipped
+                entered = [c for t, c in self.entered_codes if t <= flip_time]
+                code = entered[-1] if entered else code
+            if code is None:
+                continue
+            self.auto_clicking = False
+            self.mark_code_successful(code)
+            self.save_keypad_resume()
+            return True
+        return False
+    
+    def _attempt_feedback(self, code):
+        """Ask the feedback sources whether the last attempt was fully entered"""
+        for source in self.feedback_sources:
+            try:
+                verdict = source(code)
+            except Exception as e:
+                print(f"[ERROR] feedback source: {e}")
+                continue
+            if verdict is not None:
+                return verdict
+        return None
+    
+    def _pace(self, pacer, plan, code, verdict=None):
+        """Feed the attempt result to the pacer and return the plan to use next"""
+        if verdict is None:
+            verdict = self._attempt_feedback(code)
+        if verdict is None:
+            return plan
+        if pacer.record(verdict):
+            plan = plan.with_delays(pacer.click_delay, pacer.enter_delay)
+        return plan
+    
+    def _finish_sweep(self, detectors, pacer):
+        for detector in detectors:
+            if hasattr(detector, 'stop'):
+                detector.stop()
+        if self.watch_engine:
+            # Added per sweep by _build_memory_watch - stop sampling it between sweeps
+            self.watch_engine.remove_watch('success_watch')
+            self.watch_values.pop('success_watch', None)
+        self._save_paced_delays(pacer)
+        if self.click_scheduler:
+            print(f"DEBUG: Click timing {self.click_scheduler.report()}")
+        if self.verify_stats:
+            print(f"DEBUG: Input verification {dict(self.verify_stats)}")
+    
+    def _save_paced_delays(self, pacer):
+        if pacer and pacer.converged:
+            click_delay, enter_delay = pacer.converged
+            if self.solver_input == 'keyboard':
+                self.save_settings_values(key_delay=f"{click_delay:.4f}", key_enter_delay=f"{enter_delay:.4f}")
+            else:
+                self.save_settings_values(click_delay=f"{click_delay:.4f}", enter_delay=f"{enter_delay:.4f}")
+    
+    @property
+    def auto_clicking(self):
+        return self._auto_clicking
+    
+    @auto_clicking.setter
+    def auto_clicking(self, value):
+        # Clearing the flag fires click_cancel, so the sweep's waits wake at once
+        with self.click_lock:
+            if value and self.click_cancel.is_set():
+                self.click_cancel = threading.Event()
+            self._auto_clicking = value
+            if not value:
+                self.click_cancel.set()
+    
+    def _still_clicking(self):
+        return self.auto_clicking
+    
+    def _stop_clicking(self):
+        self.auto_clicking = False
+    
+    def _watch_stop_key(self, cancel, stop, message):
+        """Poll the F1 keybind about every millisecond until cancel fires - the GUI loop only checks every 50 ms"""
+        try:
+            key_state = ctypes.windll.user32.GetAsyncKeyState
+        except AttributeError:
+            return  # Not on Windows - the GUI loop still handles F1
+        # time.sleep, not cancel.wait - Event timeouts round up to the ~15.6 ms Windows tick
+        while not cancel.is_set():
+            time.sleep(0.001)
+            if key_state(self.keybind_f1) & 0x8000:
+                stop()
+                self.status = message
                 return
+    
+    def _press_enter(self, code, plan, backend):
+        """Send ENTER, timestamping the press itself for memory-watch crediting"""
+        # Stamped before the post-ENTER wait - a flip cancels that wait, so afterwards would credit the wrong code
+        self.entered_codes.append((time.perf_counter(), code))
+        return backend.run(plan.enter_events, self._still_clicking)
+    
+    def _click_code_on_screen(self, code, plan, backend, reader=None):
+        """Enter one code - with a display reader the digits are read back before ENTER"""
+        # False: digits dropped (cleared, not recorded), True: matched, ENTER_RESENT: ENTER sent twice
+        # (recorded), None: nothing verified
+        self.keypad_code = code
+        self.status = f"{'Typing' if isinstance(plan, KeyPlan) else 'Clicking'}: {code}"
+        
+        try:
+            if reader is None:
+                # Add this code to tried codes list for notepad file
+                self.add_found_code(code, "Tried")
+                if not backend.run(plan.compile_digits(code), self._still_clicking):
+                    return None
+                if not self._still_clicking() or not self._press_enter(code, plan, backend):
+                    return None
+                verdict = None
+            else:
+                if not backend.run(plan.compile_digits(code), self._still_clicking):
+                    return None
+                if not backend.wait(self.verify_delay):
+                    return None
+                shown = reader.read()
+                if shown is not None and shown != code:
+                    self.verify_stats['dropped'] += 1
+                    self.status = f"⚠ Display shows {shown or '(empty)'} for {code} - retrying"
+                    backend.run(plan.compile_clear(shown), self._still_clicking)
+                    return False
+                self.verify_stats['verified' if shown is not None else 'unreadable'] += 1
+                verdict = True if shown is not None else None
+                if not self._still_clicking():
+                    return None
+                completed = self._press_enter(code, plan, backend)
+                if completed and shown is not None and reader.read() == code:
+                    # ENTER itself was dropped - the entry is still waiting on the display
+                    self.verify_stats['enter_dropped'] += 1
+                    completed = self._press_enter(code, plan, backend)
+                    verdict = ENTER_RESENT
+                # ENTER went out - only a fully entered code counts as tried
+                self.add_found_code(code, "Tried")
+                if not completed:
+                    return None
             
-            pyautogui.moveTo(enter_x, enter_y, duration=0)
-            time.sleep(0.005)
-            pyautogui.mouseDown(enter_x, enter_y)
-            time.sleep(0.02)
-            pyautogui.mouseUp(enter_x, enter_y)
-            time.sleep(self.enter_delay)
-            
-            # Save AFTER complete code attempt (all codes saved to file)
-            self.save_keypad_resume()
+            # Attempt was already journaled by add_found_code - only the
+            # journal-less mode needs a save to record LAST
+            if not self.resume_journal:
+                self.save_keypad_resume()
+            return verdict
         
         except Exception as e:
             print(f"[ERROR] _click_code_on_screen: {e}")
             self.status = f"Error: {str(e)[:50]}"
             self.auto_clicking = False
+            return None
 
     def toggle_key_blocker(self, key=None):
         if key == 'all':
@@ -1106,6 +4188,7 @@ class ZombiUTrainer:
                     pass
 
     def toggle_timer(self):
+        self.timer_auto_paused = False  # A manual toggle overrides the load-removal pause
         if not self.timer_active:
             self.timer_active = True
             self.timer_paused = False
@@ -1140,10 +4223,77 @@ class ZombiUTrainer:
         
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
 
+    def benchmark_input_backends(self, codes=20):
+        """Run benchmark_input_backends on the calibrated circles (or a grid at screen center)"""
+        positions = self.circle_positions
+        if not positions or len(positions) < 12:
+            w, h = pyautogui.size()
+            positions = [(w // 2 + (i % 3) * 40, h // 2 + (i // 3) * 40) for i in range(12)]
+        try:
+            results = benchmark_input_backends(positions, self.click_delay, self.enter_delay,
+                                               self.click_settle, self.click_hold, codes)
+            best = max(results, key=results.get)
+            self.status = f"✓ Benchmark: {best} {results[best]:.1f} codes/s (see console)"
+            return results
+        except Exception as e:
+            self.status = f"Benchmark error: {str(e)[:50]}"
+            print(f"[ERROR] benchmark_input_backends: {e}")
+            return {}
+    
+    def value_search_scan(self, mode, value_text='', value_type='int'):
+        """First scan (mode 'first') or narrowing rescan of the game's memory - returns survivors"""
+        if not self.pm:
+            self.status = "Game not attached - cannot scan memory"
+            return None
+        try:
+            value = None
+            if value_text.strip():
+                value = float(value_text) if value_type in ('float', 'double') else int(value_text, 0)
+            if mode == 'first' or not self.value_search or self.value_search.value_type != value_type:
+                if value is None:
+                    self.status = "Enter a value for the first scan"
+                    return None
+                self.value_search = ValueSearch(ProcessMemory(self.pm), value_type)
+                count = self.value_search.first_scan(value)
+                detail = self.value_search.scanner.report()
+            else:
+                if mode == 'equals' and value is None:
+                    self.status = "Enter a value to compare against"
+                    return None
+                count = self.value_search.next_scan(mode, value)
+                detail = f"{self.value_search.elapsed * 1000:.0f} ms"
+            self.status = f"🔎 {count} addresses left ({detail})"
+            for address, current in self.value_search.results(10):
+                print(f"DEBUG: value search {address:#x} = {current}")
+            return count
+        except Exception as e:
+            self.status = f"Value search error: {str(e)[:50]}"
+            print(f"[ERROR] value_search_scan: {e}")
+            return None
+    
+    def benchmark_memory_scan(self):
+        """Scan every committed region of the game for a byte pattern and report MB/s"""
+        if not self.pm:
+            self.status = "Game not attached - cannot scan memory"
+            return None
+        try:
+            scanner = MemoryScanner(ProcessMemory(self.pm))
+            scanner.find(b'\xDE\xAD\xBE\xEF\xFE\xED')
+            self.status = f"✓ Memory scan: {scanner.report()}"
+            print(f"DEBUG: memory scan {scanner.report()} with {scanner.workers} workers")
+            return scanner.throughput
+        except Exception as e:
+            self.status = f"Memory scan error: {str(e)[:50]}"
+            print(f"[ERROR] benchmark_memory_scan: {e}")
+            return None
+    
     def stop(self):
         self.running = False
         self.keypad_solving = False
         self.auto_clicking = False
+        self._stop_watch_engine()
+        self.persistence.stop()
+        self.keypad_journal.close()
         try:
             keyboard.unhook_all()
         except:
@@ -1164,6 +4314,7 @@ class CirclePlacer:
         self.placing_mode = True
         self.current_circle = 0
         self.countdown_active = False
+        self.awaiting_learn = False  # All circles placed, waiting for L (learn digits) or ENTER (start)
         self.preview_circle = None
         self.preview_parts = []
         self.check_key_thread = None
@@ -1179,7 +4330,18 @@ class CirclePlacer:
         self.mouse_x = 0
         self.mouse_y = 0
         self.last_click_time = 0
-        self.stop_threads = False  # FIX: Signal threads to stop cleanly
+        self.stop_event = threading.Event()  # Set to stop the placer threads - their waits wake at once
+
+    @property
+    def stop_threads(self):
+        return self.stop_event.is_set()
+
+    @stop_threads.setter
+    def stop_threads(self, value):
+        if value:
+            self.stop_event.set()
+        else:
+            self.stop_event.clear()
 
     def check_mouse_clicks(self):
         """FIX: Check mouse clicks without blocking and with proper thread control"""
@@ -1206,8 +4368,8 @@ class CirclePlacer:
         try:
             with mouse.Listener(on_click=on_click) as listener:
                 # FIX: Check stop_threads flag instead of just self.active
-                while self.active and not self.stop_threads:
-                    time.sleep(0.1)
+                while self.active and not self.stop_event.wait(0.1):
+                    pass
         except:
             pass
 
@@ -1260,6 +4422,17 @@ class CirclePlacer:
                 x_pressed = keyboard.is_pressed('x')
                 current_time = time.time()
                 
+                try:
+                    if self.awaiting_learn and self.window and not self.stop_threads:
+                        if keyboard.is_pressed('l'):
+                            self.awaiting_learn = False
+                            self.window.after(10, self.learn_digits_then_start)
+                        elif keyboard.is_pressed('enter'):
+                            self.awaiting_learn = False
+                            self.window.after(10, self.start_without_learning)
+                except:
+                    pass
+                
                 # Use try-except to prevent keyboard check from blocking
                 try:
                     if keyboard.is_pressed('ctrl') and keyboard.is_pressed('z'):
@@ -1316,7 +4489,7 @@ class CirclePlacer:
                         pass
             except Exception as e:
                 pass
-            time.sleep(0.05)
+            self.stop_event.wait(0.05)
 
     def _update_see_through_mode(self):
         """FIX: Update see-through mode with better error handling and thread control"""
@@ -1449,6 +4622,7 @@ class CirclePlacer:
         self.trainer.circle_positions = []
         self.current_circle = 0
         self.placing_mode = True
+        self.awaiting_learn = False
         self.overlay_visible = True
         self.click_through_mode = True
         self.f1_pressed = False
@@ -1627,7 +4801,7 @@ class CirclePlacer:
         self.trainer.circle_positions = []
         self.current_circle = 0
         self.placing_mode = True
-        self.trainer.circle_ready = False
+        self.trainer.cancel_countdown()
         self.canvas.itemconfig(self.lbl_count, text="0/12", fill='#ffff00')
         instructions = f"Double-click X = See through!\nHOLD X + CLICK on game keypad!\nF1 = Close"
         self.canvas.itemconfig(self.instruction_text, text=instructions, fill='#ff8800')
@@ -1635,19 +4809,36 @@ class CirclePlacer:
     def close_and_start_countdown(self):
         if self.current_circle == 12:
             self.trainer.circle_ready = True
+            if self.trainer.display_region and not self.trainer.load_keypad_ocr():
+                # Learning clicks the keypad, so it is offered here rather than run unasked
+                self.awaiting_learn = True
+                self.canvas.itemconfig(self.instruction_text,
+                                       text="ALL 12 CIRCLES PLACED!\n"
+                                            "L = Learn keypad display digits (types 0-9 + CLEAR, never ENTER), then start\n"
+                                            "ENTER = Start without learning | F1 = Close",
+                                       fill='#ffff00')
+                self.trainer.status = "Circles placed - L learns the keypad digits, ENTER starts"
+                return
             self.hide()
             self.trainer.start_countdown_then_clicker()
 
+    def learn_digits_then_start(self):
+        """L after placing - hide the overlay so it can't catch the clicks, learn, then start"""
+        self.hide()
+        self.trainer.learn_keypad_digits(on_done=self.trainer.start_countdown_then_clicker)
+
+    def start_without_learning(self):
+        self.hide()
+        self.trainer.start_countdown_then_clicker()
+
     def hide(self):
         """FIX: Properly close window and stop threads + reset see-through mode"""
         self.active = False
         self.placing_mode = False
+        self.awaiting_learn = False
         self.countdown_active = False
         self.see_through_mode = False  # FIX: Reset see-through mode on close
-        self.stop_threads = True  # FIX: Signal threads to stop
-        
-        # FIX: Give threads time to finish
-        time.sleep(0.1)
+        self.stop_threads = True  # FIX: Signal threads to stop - their waits return immediately
         
         self.hide_preview_circle()
         if self.window:
@@ -1935,6 +5126,10 @@ class TrainerGUI:
                                    bg='#0d0d0d', font=('Arial', 9, 'bold'))
         self.lbl_status.pack(pady=8)
         
+        self.lbl_watches = tk.Label(self.main_frame, text="", fg='#00ccff',
+                                    bg='#0d0d0d', font=('Courier', 8))
+        self.lbl_watches.pack()
+        
         tk.Frame(self.main_frame, height=2, bg='#00ff00').pack(fill='x', pady=5)
         
         # Create tab buttons ONLY if dev mode is enabled
@@ -2023,12 +5218,39 @@ class TrainerGUI:
                                    bg='#1a1a1a', fg='#00ff00', justify='center',
                                    relief='sunken', bd=2)
         self.entry_code.pack(side='left', padx=2)
+        self.entry_code.bind('<KeyRelease>', self.update_code_suggestions)
+        self.entry_code.bind('<Return>', lambda e: self.try_manual_code())
         tk.Button(manual_frame, text="Try", command=self.try_manual_code,
                  bg='#333', fg='white', font=('Arial', 8, 'bold'),
                  cursor='hand2').pack(side='left', padx=2, ipady=2, ipadx=8)
         tk.Button(manual_frame, text="Good", command=self.mark_code_good,
                  bg='#2a5', fg='white', font=('Arial', 8, 'bold'),
                  cursor='hand2').pack(side='left', padx=2, ipady=2, ipadx=8)
+        tk.Button(manual_frame, text="Scan", command=self.scan_keypad_code,
+                 bg='#258', fg='white', font=('Arial', 8, 'bold'),
+                 cursor='hand2').pack(side='left', padx=2, ipady=2, ipadx=8)
+        
+        # Known-code matches for what is typed in the Manual box - hidden while empty
+        self.list_code_suggestions = tk.Listbox(frame, height=4, font=('Courier', 8),
+                                                bg='#1a1a1a', fg='#00ff00', selectbackground='#2a5',
+                                                relief='sunken', bd=1, activestyle='none')
+        self.list_code_suggestions.bind('<Double-Button-1>', self.pick_code_suggestion)
+        self.list_code_suggestions.bind('<Return>', self.pick_code_suggestion)
+        self.code_suggestions = []
+        self.suggestions_anchor = manual_frame
+        
+        constraint_frame = tk.Frame(frame, bg='#0d0d0d')
+        constraint_frame.pack(fill='x', pady=3)
+        tk.Label(constraint_frame, text="Known:", fg='#888', bg='#0d0d0d',
+                font=('Arial', 8)).pack(side='left', padx=2)
+        self.entry_constraints = tk.Entry(constraint_frame, width=16, font=('Courier', 9),
+                                          bg='#1a1a1a', fg='#00ff00', relief='sunken', bd=2)
+        self.entry_constraints.insert(0, self.engine.code_constraints)
+        self.entry_constraints.pack(side='left', padx=2)
+        tk.Button(constraint_frame, text="Set",
+                 command=lambda: self.engine.set_code_constraints(self.entry_constraints.get()),
+                 bg='#333', fg='white', font=('Arial', 8, 'bold'),
+                 cursor='hand2').pack(side='left', padx=2, ipady=2, ipadx=8)
         
         # Reset button frame
         reset_frame = tk.Frame(frame, bg='#0d0d0d')
@@ -2037,10 +5259,14 @@ class TrainerGUI:
                  bg='#a52', fg='white', bd=1, font=('Arial', 8, 'bold'),
                  cursor='hand2')
         self.btn_reset_keypad.pack(side='left', padx=2, ipady=2, ipadx=8)
+        tk.Button(reset_frame, text="Import Codes", command=self.import_known_codes,
+                 bg='#333', fg='white', bd=1, font=('Arial', 8, 'bold'),
+                 cursor='hand2').pack(side='left', padx=2, ipady=2, ipadx=8)
         
         btn_frame2 = tk.Frame(frame, bg='#0d0d0d')
         btn_frame2.pack(fill='x', pady=3)
-        self.btn_place_circles = tk.Button(btn_frame2, text="Place Circles & Auto-Start", command=self.circle_placer.show,
+        self.btn_place_circles = tk.Button(btn_frame2, text="Place Circles & Auto-Start",
+                 command=lambda: self.engine.start_solver(self.circle_placer),
                  bg='#2a2', fg='white', font=('Arial', 9, 'bold'), bd=1,
                  cursor='hand2')
         self.btn_place_circles.pack(pady=3, ipady=6, ipadx=10, fill='x')
@@ -2055,13 +5281,46 @@ class TrainerGUI:
                                           bg='#0d0d0d', font=('Arial', 8), justify='left')
         self.lbl_resume_status.pack(anchor='w', pady=2)
     
+    def update_code_suggestions(self, event=None):
+        """Prefix search of the known-code index as the Manual box is typed in"""
+        if event is not None and event.keysym in ('Return', 'Up', 'Down'):
+            return
+        self.code_suggestions = self.engine.known_index.search(self.entry_code.get(), limit=8)
+        self.list_code_suggestions.delete(0, tk.END)
+        for location, code in self.code_suggestions:
+            self.list_code_suggestions.insert(tk.END, f"{code}  {location}")
+        if self.code_suggestions:
+            self.list_code_suggestions.config(height=min(4, len(self.code_suggestions)))
+            self.list_code_suggestions.pack(fill='x', pady=1, after=self.suggestions_anchor)
+        else:
+            self.list_code_suggestions.pack_forget()
+    
+    def pick_code_suggestion(self, event=None):
+        selection = self.list_code_suggestions.curselection()
+        if not selection:
+            return
+        location, code = self.code_suggestions[selection[0]]
+        self.entry_code.delete(0, tk.END)
+        self.entry_code.insert(0, code)
+        self.list_code_suggestions.pack_forget()
+        self.engine.status = f"Known code for {location or 'unknown location'}: {code}"
+    
     def try_manual_code(self):
         code = self.entry_code.get().strip()
         if not code:
             self.engine.status = "Enter a code first!"
             return
-        if len(code) != 4 or not code.isdigit():
-            self.engine.status = "Code must be 4 digits (0-9)!"
+        if code not in self.engine.code_space:
+            # Not a code - treat it as a location name and try its known code
+            known = self.engine.lookup_known_code(code)
+            if known:
+                location, code = known
+                self.entry_code.delete(0, tk.END)
+                self.entry_code.insert(0, code)
+                self.list_code_suggestions.pack_forget()
+                print(f"DEBUG: known code {code} for {location}")
+        if code not in self.engine.code_space:
+            self.engine.status = f"Code must be {self.engine.code_space.describe()}!"
             return
         try:
             self.engine.try_manual_code(code)
@@ -2069,13 +5328,40 @@ class TrainerGUI:
             self.engine.status = f"Error trying code: {str(e)[:50]}"
             print(f"[ERROR] try_manual_code: {e}")
     
+    def run_value_search(self, mode):
+        """Run a value search step in the background with the Dev Tools inputs"""
+        value_text = self.entry_search_value.get()
+        value_type = self.var_search_type.get()
+        Thread(target=self.engine.value_search_scan, args=(mode, value_text, value_type), daemon=True).start()
+    
+    def scan_keypad_code(self):
+        """Read the keypad code from game memory in the background and fill the entry box"""
+        def scan_thread():
+            code = self.engine.extract_keypad_code()
+            if code:
+                # Tk is not thread-safe - the update loop fills the box
+                self.engine.call_on_gui(lambda: self.show_code_in_entry(code))
+        Thread(target=scan_thread, daemon=True).start()
+    
+    def show_code_in_entry(self, code):
+        self.entry_code.delete(0, tk.END)
+        self.entry_code.insert(0, code)
+    
+    def import_known_codes(self):
+        """Pick a "location,code" list and merge it into known_codes.txt"""
+        from tkinter import filedialog
+        path = filedialog.askopenfilename(title="Import known keypad codes",
+                                          filetypes=[("Text / CSV", "*.txt *.csv"), ("All files", "*.*")])
+        if path:
+            self.engine.import_known_codes(path)
+    
     def mark_code_good(self):
         code = self.entry_code.get().strip()
         if not code:
             self.engine.status = "Enter a code first!"
             return
-        if len(code) != 4 or not code.isdigit():
-            self.engine.status = "Code must be 4 digits (0-9)!"
+        if code not in self.engine.code_space:
+            self.engine.status = f"Code must be {self.engine.code_space.describe()}!"
             return
         try:
             self.engine.mark_code_successful(code)
@@ -2974,6 +6260,45 @@ class TrainerGUI:
                       bg='#0d0d0d', fg='#ffff00', selectcolor='#0d0d0d',
                       font=('Arial', 8), command=self.update_dev_settings).pack(anchor='w', padx=20)
         
+        tk.Button(frame, text="Benchmark Input Backends (moves mouse)",
+                 command=lambda: Thread(target=self.engine.benchmark_input_backends, daemon=True).start(),
+                 bg='#333', fg='#ffff00', font=('Arial', 8, 'bold'),
+                 cursor='hand2').pack(anchor='w', padx=20, pady=3)
+        
+        tk.Button(frame, text="Learn Keypad Digits (clicks circles)",
+                 command=self.engine.learn_keypad_digits,
+                 bg='#333', fg='#ffff00', font=('Arial', 8, 'bold'),
+                 cursor='hand2').pack(anchor='w', padx=20, pady=3)
+        
+        tk.Button(frame, text="Benchmark Memory Scan (game attached)",
+                 command=lambda: Thread(target=self.engine.benchmark_memory_scan, daemon=True).start(),
+                 bg='#333', fg='#ffff00', font=('Arial', 8, 'bold'),
+                 cursor='hand2').pack(anchor='w', padx=20, pady=3)
+        
+        tk.Frame(frame, height=1, bg='#333').pack(fill='x', pady=3)
+        
+        # Value Search Section
+        tk.Label(frame, text="🔎 VALUE SEARCH", fg='#00ccff', bg='#0d0d0d',
+                font=('Arial', 9, 'bold')).pack(anchor='w', padx=5, pady=3)
+        
+        search_frame = tk.Frame(frame, bg='#0d0d0d')
+        search_frame.pack(fill='x', padx=20, pady=2)
+        self.entry_search_value = tk.Entry(search_frame, width=10, font=('Courier', 9),
+                                           bg='#1a1a1a', fg='#00ccff', insertbackground='#00ccff')
+        self.entry_search_value.pack(side='left', padx=2)
+        self.var_search_type = tk.StringVar(value='int')
+        type_menu = tk.OptionMenu(search_frame, self.var_search_type, *VALUE_TYPES.keys())
+        type_menu.config(bg='#1a1a1a', fg='#00ccff', activebackground='#333', font=('Arial', 8))
+        type_menu.pack(side='left', padx=2)
+        
+        modes_frame = tk.Frame(frame, bg='#0d0d0d')
+        modes_frame.pack(fill='x', padx=20, pady=2)
+        for mode, label in (('first', 'First'), ('equals', '='), ('changed', 'Changed'),
+                            ('unchanged', 'Same'), ('increased', '+'), ('decreased', '-')):
+            tk.Button(modes_frame, text=label, command=lambda m=mode: self.run_value_search(m),
+                     bg='#333', fg='#00ccff', font=('Arial', 8, 'bold'),
+                     cursor='hand2').pack(side='left', padx=1)
+        
         tk.Frame(frame, height=1, bg='#333').pack(fill='x', pady=3)
         
         # Fullscreen & Overlay Section
@@ -3558,6 +6883,9 @@ to see detailed debug information.
 
     def update(self):
         try:
+            # Apply state changes posted by worker threads (timer auto-pause, scan results)
+            self.engine.run_gui_calls()
+            
             # Check if dev_mode changed in settings.txt (reload settings)
             try:
                 self.engine.load_settings()
@@ -3603,6 +6931,13 @@ to see detailed debug information.
             except:
                 pass
             
+            try:
+                values = self.engine.watch_values
+                self.lbl_watches.config(text='  '.join(f"{name}: {values.get(name)}"
+                                                       for name in self.engine.hud_watches))
+            except:
+                pass
+            
             try:
                 if self.engine.keypad_code:
                     self.lbl_keypad.config(text=f"Code: {self.engine.keypad_code}")
@@ -3665,9 +7000,12 @@ to see detailed debug information.
                     self.engine.status = "F1 PRESSED - AUTO-CLICKER STOPPED!"
                 # Stop countdown if running
                 if self.engine.autostart_timer_running:
-                    self.engine.autostart_timer_running = False
-                    self.engine.circle_ready = False
+                    self.engine.cancel_countdown()
                     self.engine.status = "F1 PRESSED - AUTOSTART TIMER CANCELLED!"
+                # Stop keypad digit learning if running
+                if self.engine.learning_digits:
+                    self.engine.learn_cancel.set()
+                    self.engine.status = "F1 PRESSED - DIGIT LEARNING CANCELLED!"
             if ctypes.windll.user32.GetAsyncKeyState(self.engine.keybind_f3) & 1: # F3
                 self.engine.toggle_timer()
         except:
@@ -3715,6 +7053,7 @@ to see detailed debug information.
         """Close app - do NOT modify taskbar"""
         self.engine.save_keypad_resume()
         self.engine.save_blocked_keys()
+        self.engine.persistence.flush()
         self.close_app()
 
 # ==============================================================================
@@ -3754,6 +7093,7 @@ if __name__ == "__main__":
     print("-" * 80)
     print("Edit settings.txt to customize:")
     print("  - Speed: click_delay, enter_delay (0.1 = ULTRA FAST)")
+    print("  - Solver input: solver_input=keyboard types codes (key_delay, key_enter_delay)")
     print("  - HUD Themes: default, military, alpha, rounded, minimal")
     print("  - HUD Colors: background, text, border (hex format)")
     print("  - HUD Style: corner_radius, border_width")
@@ -0,0 +1,88 @@
+"""Loads the app script for tests on any OS - Windows input/memory modules are stubbed, elevation is skipped"""
+import ctypes
+import importlib.util
+import shutil
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+SOURCE = Path(__file__).resolve().parent.parent / 'Source' / 'Zombi_Tools_V1.0.py'
+
+
+class _StubModule(types.ModuleType):
+    """Module whose every attribute is a do-nothing callable"""
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: None
+
+
+def _stub(name, **attrs):
+    module = _StubModule(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    parent, _, child = name.rpartition('.')
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+def _importable(name):
+    try:
+        __import__(name)
+        return True
+    except ImportError:
+        return False
+
+
+# Tests must never inject real input or open a real process, even where these are installed
+_stub('pymem', Pymem=object)
+_stub('pymem.process')
+_stub('pymem.memory')
+_stub('keyboard')
+_stub('pyautogui', PAUSE=0.1)
+_stub('pynput')
+_stub('pynput.mouse')
+# Only needed by the GUI and screen capture - stubbed where missing
+if not _importable('psutil'):
+    _stub('psutil')
+if not _importable('PIL'):
+    _stub('PIL')
+    for _name in ('Image', 'ImageDraw', 'ImageTk', 'ImageGrab'):
+        _stub(f'PIL.{_name}')
+if not _importable('tkinter'):
+    _stub('tkinter')
+    _stub('tkinter.ttk')
+    _stub('tkinter.messagebox')
+
+# The script re-launches itself through ShellExecuteW when not elevated - report admin instead
+if hasattr(ctypes, 'windll'):
+    ctypes.windll.shell = types.SimpleNamespace(IsUserAnAdmin=lambda: 1)
+
+
+@pytest.fixture
+def zt(tmp_path):
+    """The app loaded from a copy in tmp_path, so settings and resume files land there"""
+    pytest.importorskip('numpy')
+    script = tmp_path / 'zombi_tools.py'
+    shutil.copy(SOURCE, script)
+    spec = importlib.util.spec_from_file_location('zombi_tools', script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def trainer(zt):
+    trainer = zt.ZombiUTrainer()
+    yield trainer
+    trainer.stop()
+
+
+@pytest.fixture
+def fakes(zt):
+    """Game stand-ins from tests/fakes.py, built on this app instance's base classes"""
+    import fakes as module
+    return module.build(zt)
@@ -0,0 +1,183 @@
+"""Test stand-ins for the game - process memory, keypad, display and screen frames"""
+import random
+import types
+
+import numpy as np
+
+
+class FakeProcessMemory:
+    """In-memory stand-in for ProcessMemory - blocks of bytes at fixed addresses"""
+    def __init__(self, blocks=None, modules=None, base_address=0x400000, pointer_size=4):
+        self.blocks = {address: bytearray(data) for address, data in (blocks or {}).items()}
+        self.modules = dict(modules or {})  # name -> (base, size)
+        self.base_address = base_address
+        self.pointer_size = pointer_size
+
+    def _block(self, address, size):
+        for start, data in self.blocks.items():
+            if start <= address and address + size <= start + len(data):
+                return start, data
+        raise OSError(f"Could not read memory at: {address:#x}, length: {size}")
+
+    def read(self, address, size):
+        start, data = self._block(address, size)
+        return bytes(data[address - start:address - start + size])
+
+    def read_into(self, address, buffer, size):
+        start, data = self._block(address, size)
+        memoryview(buffer)[:size] = memoryview(data)[address - start:address - start + size]
+        return size
+
+    def regions(self):
+        return sorted((start, len(data)) for start, data in self.blocks.items())
+
+    def write(self, address, data):
+        start, block = self._block(address, len(data))
+        block[address - start:address - start + len(data)] = data
+
+    def read_pointer(self, address):
+        return int.from_bytes(self.read(address, self.pointer_size), 'little')
+
+    def module_info(self, name):
+        if name not in self.modules:
+            raise KeyError(f"Module not loaded: {name}")
+        return self.modules[name]
+
+    def module_base(self, name=None):
+        if not name:
+            return self.base_address
+        return self.module_info(name)[0]
+
+
+# 5x7 bitmap digits drawn by render_fake_display
+FAKE_DISPLAY_FONT = {
+    '0': ('01110', '10001', '10011', '10101', '11001', '10001', '01110'),
+    '1': ('00100', '01100', '00100', '00100', '00100', '00100', '01110'),
+    '2': ('01110', '10001', '00001', '00010', '00100', '01000', '11111'),
+    '3': ('11111', '00010', '00100', '00010', '00001', '10001', '01110'),
+    '4': ('00010', '00110', '01010', '10010', '11111', '00010', '00010'),
+    '5': ('11111', '10000', '11110', '00001', '00001', '10001', '01110'),
+    '6': ('00110', '01000', '10000', '11110', '10001', '10001', '01110'),
+    '7': ('11111', '00001', '00010', '00100', '01000', '01000', '01000'),
+    '8': ('01110', '10001', '10001', '01110', '10001', '10001', '01110'),
+    '9': ('01110', '10001', '10001', '01111', '00001', '00010', '01100'),
+}
+
+
+def render_fake_display(text, cells=8, scale=3, ink=(40, 255, 80), background=(10, 20, 10)):
+    """RGB frame of a keypad display showing text"""
+    height, width = 9 * scale, (cells * 6 + 1) * scale
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    frame[:] = background
+    for i, ch in enumerate(text[:cells]):
+        glyph = FAKE_DISPLAY_FONT.get(ch)
+        if glyph is None:
+            continue
+        bits = np.array([[c == '1' for c in row] for row in glyph])
+        bits = bits.repeat(scale, axis=0).repeat(scale, axis=1)
+        top, left = scale, (1 + i * 6) * scale
+        frame[top:top + bits.shape[0], left:left + bits.shape[1]][bits] = ink
+    return frame
+
+
+def build(zt):
+    """Stand-ins that subclass the app's own InputBackend, DisplayReader and FrameSource"""
+
+    def make_fake_keypad_image(code='0451', module='ZombiU.exe', base=0x400000):
+        """Fake 32-bit process image - returns (memory, extractor)"""
+        size = 0x4000
+        image = bytearray(size)
+        image[0:2] = b'MZ'
+        image[0x3C:0x40] = (0x80).to_bytes(4, 'little')
+        image[0x80:0x84] = b'PE\0\0'
+        image[0x88:0x8C] = (0x5E1A2B3C).to_bytes(4, 'little')  # TimeDateStamp
+        keypad_global = base + 0x3000
+        keypad_object = 0x900000
+        image[0x1230:0x1238] = bytes([0x8B, 0x0D]) + keypad_global.to_bytes(4, 'little') + bytes([0x85, 0xC9])
+        image[0x3000:0x3004] = keypad_object.to_bytes(4, 'little')
+        heap = bytearray(0x40)
+        heap[0x10:0x10 + len(code)] = code.encode('ascii')
+        memory = FakeProcessMemory({base: image, keypad_object: heap}, {module: (base, size)}, base_address=base)
+        extractor = zt.KeypadCodeExtractor("8B 0D ?? ?? ?? ?? 85 C9", module, operand_offset=2, chain=(0x10,))
+        return memory, extractor
+
+    class SyntheticFrameSource(zt.FrameSource):
+        """Returns whatever frame was last set, cropped to the region"""
+        def __init__(self, frame):
+            self.frame = frame
+
+        def grab(self, region):
+            left, top, right, bottom = region
+            return self.frame[top:bottom, left:right]
+
+    class SimulatedKeypad(zt.InputBackend, zt.DisplayReader):
+        """Stand-in game keypad - an input backend with a display that drops fast presses"""
+        # Time is a virtual clock advanced by the event delays, so nothing actually sleeps
+        name = 'simulated'
+
+        def __init__(self, min_gap=0.0, drop_rate=0.0, positions=None, seed=None):
+            self.min_gap = min_gap
+            self.drop_rate = drop_rate
+            self.random = random.Random(seed)
+            labels = [str((i + 1) % 10) for i in range(10)] + ['enter', 'clear']
+            self.buttons = {tuple(pos): label for pos, label in zip(positions or [], labels)}
+            self.clock = 0.0
+            self.last_press = None
+            self.display = ''
+            self.submitted = []  # Display contents at every ENTER
+            self.dropped = 0
+
+        def wait(self, delay):
+            self.clock += delay
+            return True
+
+        def read(self):
+            return self.display
+
+        def _press(self, key):
+            gap = self.clock - self.last_press if self.last_press is not None else float('inf')
+            self.last_press = self.clock
+            if gap < self.min_gap or (self.drop_rate and self.random.random() < self.drop_rate):
+                self.dropped += 1
+                return
+            if key == 'enter':
+                self.submitted.append(self.display)
+                self.display = ''
+            elif key == 'clear':
+                self.display = ''
+            elif key == 'backspace':
+                self.display = self.display[:-1]
+            elif key:
+                self.display += key
+
+        def run(self, events, should_continue):
+            for x, y, action, delay in events:
+                if action in (zt.ClickPlan.MOVE, zt.KeyPlan.KEY_DOWN) and not should_continue():
+                    return False
+                if action == zt.KeyPlan.KEY_DOWN:
+                    self._press(x)
+                elif action == zt.ClickPlan.DOWN:
+                    self._press(self.buttons.get((x, y)))
+                self.clock += delay
+            return True
+
+    class SimulatedDisplaySource(zt.FrameSource):
+        """Frames of a SimulatedKeypad's display, cropped to the region like a screen grab"""
+        def __init__(self, keypad, cells=8, scale=3):
+            self.keypad = keypad
+            self.cells = cells
+            self.scale = scale
+
+        def grab(self, region):
+            left, top, right, bottom = region
+            return render_fake_display(self.keypad.display, self.cells, self.scale)[top:bottom, left:right]
+
+    return types.SimpleNamespace(
+        FakeProcessMemory=FakeProcessMemory,
+        FAKE_DISPLAY_FONT=FAKE_DISPLAY_FONT,
+        render_fake_display=render_fake_display,
+        make_fake_keypad_image=make_fake_keypad_image,
+        SyntheticFrameSource=SyntheticFrameSource,
+        SimulatedKeypad=SimulatedKeypad,
+        SimulatedDisplaySource=SimulatedDisplaySource,
+    )
@@ -0,0 +1,95 @@
+"""Code space tests - constraints, candidate ordering and the tried-code bitmap"""
+import itertools
+
+import pytest
+
+CONSTRAINTS = ['', '1??7', '-05', '+1237', '=137', '=11', 'unique', '1??? unique -9', '=13 +1234 unique',
+               '??9? =99', '+12 =1112']
+
+
+def brute_force(zt, space, text):
+    constraints = zt.CodeConstraints(space, text)
+    return [code for code in space if constraints.matches(code)]
+
+
+@pytest.mark.parametrize('text', CONSTRAINTS)
+def test_enumerate_and_count_match_brute_force(zt, text):
+    space = zt.CodeSpace(4)
+    constraints = zt.CodeConstraints(space, text)
+    expected = brute_force(zt, space, text)
+
+    assert list(constraints.enumerate()) == expected
+    assert constraints.count() == len(expected)
+
+
+def test_constraints_on_a_letter_alphabet(zt):
+    space = zt.CodeSpace(3, 'ABCD')
+    constraints = zt.CodeConstraints(space, 'A?? =B unique')
+    expected = [''.join(p) for p in itertools.product('ABCD', repeat=3)
+                if p[0] == 'A' and 'B' in p and len(set(p)) == 3]
+
+    assert list(constraints.enumerate()) == expected
+    assert constraints.count() == len(expected)
+
+
+@pytest.mark.parametrize('text', ['12', '+X', 'sorted'])
+def test_bad_constraints_are_rejected(zt, text):
+    with pytest.raises(ValueError):
+        zt.CodeConstraints(zt.CodeSpace(4), text)
+
+
+def test_candidates_are_unique_and_cover_the_space(zt, tmp_path):
+    space = zt.CodeSpace(4)
+    engine = zt.CandidateEngine(zt.CandidateEngine.DEFAULT_SPEC, str(tmp_path), space)
+    codes = list(engine.candidates())
+
+    assert len(codes) == len(set(codes)) == space.size
+    assert codes[0] in [code for code in zt.CommonCodeStrategy(space).candidates()]
+
+
+def test_candidates_respect_constraints(zt, tmp_path):
+    space = zt.CodeSpace(4)
+    constraints = zt.CodeConstraints(space, '1??7')
+    engine = zt.CandidateEngine(zt.CandidateEngine.DEFAULT_SPEC, str(tmp_path), space, constraints)
+    codes = list(engine.candidates())
+
+    assert sorted(codes) == brute_force(zt, space, '1??7')
+    assert len(codes) == len(set(codes))
+
+
+def test_weighted_list_goes_first(zt, tmp_path):
+    (tmp_path / 'candidates.txt').write_text("4321\n9999\n")
+    engine = zt.CandidateEngine('weighted,numeric', str(tmp_path), zt.CodeSpace(4))
+    codes = list(engine.candidates())
+
+    assert codes[:2] == ['4321', '9999']
+    assert codes.count('4321') == 1
+
+
+def test_tried_index_dump_load_round_trip(zt):
+    space = zt.CodeSpace(5)
+    index = zt.TriedCodeIndex(space)
+    for code in ('00000', '12345', '99999', '54321'):
+        assert index.add(code)
+    assert not index.add('12345')
+    assert not index.add('123')  # Not in the space
+
+    restored = zt.TriedCodeIndex(space)
+    assert restored.load(index.dump())
+    assert len(restored) == 4
+    assert all(code in restored for code in ('00000', '12345', '99999', '54321'))
+    assert '11111' not in restored
+
+    legacy = zt.TriedCodeIndex(space)
+    assert legacy.load(bytes(index.bits).hex())
+    assert len(legacy) == 4
+
+
+def test_tried_index_rejects_another_space(zt):
+    index = zt.TriedCodeIndex(zt.CodeSpace(4))
+    index.add('1234')
+    other = zt.TriedCodeIndex(zt.CodeSpace(5))
+
+    assert not other.load(index.dump())
+    assert not other.load('znot base64!')
+    assert len(other) == 0
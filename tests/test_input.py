@@ -0,0 +1,49 @@
+"""Input backend tests against RecordingInputBackend - nothing is injected"""
+import threading
+
+POSITIONS = [(i * 10, 5) for i in range(12)]
+
+
+def test_recording_backend_records_a_code_in_order(zt):
+    plan = zt.ClickPlan(POSITIONS, 0.0, 0.0, 0.0, 0.0)
+    backend = zt.RecordingInputBackend()
+
+    assert backend.run(plan.compile('12'), lambda: True)
+
+    moves = [(x, y) for _, x, y, action in backend.events if action == zt.ClickPlan.MOVE]
+    assert moves == [POSITIONS[0], POSITIONS[1], POSITIONS[zt.ClickPlan.ENTER]]
+    assert [action for _, _, _, action in backend.events] == [0, 1, 2] * 3
+
+
+def test_recording_backend_stops_before_the_next_press(zt):
+    plan = zt.ClickPlan(POSITIONS, 0.0, 0.0, 0.0, 0.0)
+    backend = zt.RecordingInputBackend()
+    presses = []
+
+    def should_continue():
+        presses.append(1)
+        return len(presses) < 2
+
+    assert not backend.run(plan.compile('12'), should_continue)
+    assert [action for _, _, _, action in backend.events] == [0, 1, 2]
+
+
+def test_cancel_during_a_hold_releases_the_button(zt):
+    plan = zt.ClickPlan(POSITIONS, 0.0, 0.0, 0.0, 5.0)
+    cancel = threading.Event()
+    backend = zt.RecordingInputBackend(sleep=True)
+    backend.scheduler = zt.DeadlineScheduler(cancel=cancel)
+    threading.Timer(0.05, cancel.set).start()
+
+    assert not backend.run(plan.compile('1'), lambda: True)
+    assert [action for _, _, _, action in backend.events] == [0, 1, 2]
+
+
+def test_settings_never_select_the_recording_backend(zt):
+    assert not isinstance(zt.make_input_backend('recording'), zt.RecordingInputBackend)
+
+
+def test_benchmark_runs_without_sendinput(zt):
+    results = zt.benchmark_input_backends(POSITIONS, 0.0, 0.0, 0.0, 0.0, codes=3)
+    assert 'recording' in results
+    assert zt.pyautogui.PAUSE == 0.1
@@ -0,0 +1,140 @@
+"""Memory tests against FakeProcessMemory - scanner, value search, pointer chains and watches"""
+import struct
+import threading
+
+import pytest
+
+BASE = 0x10000000
+
+
+def fake_memory(fakes, size=0x3000, **kwargs):
+    return fakes.FakeProcessMemory({BASE: bytearray(size)}, **kwargs)
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_scanner_finds_matches_across_chunk_borders(zt, fakes, workers):
+    memory = fake_memory(fakes)
+    pattern = bytes([0xDE, 0xAD, 0xBE, 0xEF])
+    # One match straddling each border, one right at a border, one inside a chunk
+    spots = [0x100 - 2, 0x200, 0x2FF - 1, 0x450]
+    for spot in spots:
+        memory.write(BASE + spot, pattern)
+    scanner = zt.MemoryScanner(memory, workers=workers, chunk_size=0x100)
+
+    assert list(scanner.find(pattern)) == [BASE + spot for spot in spots]
+    assert list(scanner.find(zt.Signature("DE ?? BE EF"))) == [BASE + spot for spot in spots]
+    assert scanner.bytes_scanned == 0x3000
+
+
+def test_scanner_find_value_aligned_and_unaligned(zt, fakes):
+    memory = fake_memory(fakes)
+    memory.write(BASE + 0x10, struct.pack('<i', 1234))
+    memory.write(BASE + 0xFE, struct.pack('<i', 1234))
+    scanner = zt.MemoryScanner(memory, workers=1, chunk_size=0x100)
+
+    assert list(scanner.find_value(1234, 'int')) == [BASE + 0x10]
+    assert list(scanner.find_value(1234, 'int', aligned=False)) == [BASE + 0x10, BASE + 0xFE]
+
+
+def test_value_search_narrows_survivors(zt, fakes):
+    memory = fake_memory(fakes, size=0x200000)
+    spots = [0x40, 0x44, 0x1000, 0x100000, 0x1FFFF0]  # Spans on both sides of the 1 MB split
+    for spot in spots:
+        memory.write(BASE + spot, struct.pack('<i', 100))
+    search = zt.ValueSearch(memory, 'int')
+
+    assert search.first_scan(100) == len(spots)
+    assert search.next_scan('unchanged') == len(spots)
+    memory.write(BASE + 0x44, struct.pack('<i', 150))
+    memory.write(BASE + 0x100000, struct.pack('<i', 90))
+    assert search.next_scan('changed') == 2
+    assert search.results() == [(BASE + 0x44, 150), (BASE + 0x100000, 90)]
+    assert search.next_scan('increased') == 0
+
+
+def test_value_search_equals_and_decreased(zt, fakes):
+    memory = fake_memory(fakes)
+    for spot in (0x8, 0x20, 0x800):
+        memory.write(BASE + spot, struct.pack('<f', 2.5))
+    search = zt.ValueSearch(memory, 'float')
+    search.first_scan(2.5)
+    memory.write(BASE + 0x20, struct.pack('<f', 1.0))
+
+    assert search.next_scan('decreased') == 1
+    memory.write(BASE + 0x20, struct.pack('<f', 7.0))
+    assert search.next_scan('equals', 7.0) == 1
+    assert search.results() == [(BASE + 0x20, 7.0)]
+    with pytest.raises(ValueError):
+        search.next_scan('bigger')
+
+
+def chained_memory(fakes):
+    """Game.exe+0x10 -> object at BASE+0x100, whose +0x8 holds a pointer to BASE+0x200"""
+    memory = fake_memory(fakes, modules={'Game.exe': (BASE, 0x3000)})
+    memory.write(BASE + 0x10, struct.pack('<I', BASE + 0x100))
+    memory.write(BASE + 0x108, struct.pack('<I', BASE + 0x200))
+    return memory
+
+
+def test_pointer_chain_caches_the_resolved_address(zt, fakes):
+    memory = chained_memory(fakes)
+    chain = zt.PointerChain.parse("Game.exe+0x10,0x8,0x4")
+
+    assert chain.resolve(memory) == BASE + 0x204
+    memory.write(BASE + 0x10, struct.pack('<I', BASE + 0x300))  # Ignored until a refresh
+    assert chain.resolve(memory) == BASE + 0x204
+    assert chain.walks == 1
+    assert chain.resolve(memory, refresh=True) == 0x4  # BASE+0x308 holds a null pointer
+    assert chain.walks == 2
+
+
+def test_pointer_chain_rewalks_when_the_module_moves(zt, fakes):
+    memory = chained_memory(fakes)
+    chain = zt.PointerChain.parse("Game.exe+0x10,0x8")
+    chain.resolve(memory)
+    memory.modules['Game.exe'] = (BASE + 0x1000, 0x2000)
+    memory.write(BASE + 0x1010, struct.pack('<I', BASE + 0x100))
+
+    assert chain.resolve(memory) == BASE + 0x108
+    assert chain.walks == 2
+    assert str(chain) == "Game.exe+0x10,0x8"
+
+
+def test_watch_engine_publishes_changes_and_detector_flips(zt, fakes):
+    memory = chained_memory(fakes)
+    memory.write(BASE + 0x204, struct.pack('<i', 0))
+    engine = zt.WatchEngine(memory, [zt.Watch('door', "Game.exe+0x10,0x8,0x4", 'int', 0.001)])
+    events = []
+    changed = threading.Event()
+    flipped = threading.Event()
+
+    def on_change(name, old, new, timestamp):
+        events.append((name, old, new))
+        changed.set()
+
+    assert engine.subscribe(on_change) == {'door': 0}
+    detector = zt.MemoryWatchDetector(engine, 'door', on_flip=flipped.set)
+    detector.start()
+    engine.start()
+    try:
+        memory.write(BASE + 0x204, struct.pack('<i', 1))
+        assert flipped.wait(2.0) and changed.wait(2.0)
+    finally:
+        engine.stop()
+
+    assert events[0] == ('door', 0, 1)
+    assert detector.check() and detector.value == 1
+    assert on_change in [callback for callback, _ in engine.subscribers]
+    assert detector._on_change not in [callback for callback, _ in engine.subscribers]
+
+
+def test_watch_engine_reads_nearby_watches_in_one_span(zt, fakes):
+    memory = chained_memory(fakes)
+    memory.write(BASE + 0x200, struct.pack('<ih', 7, -3))
+    engine = zt.WatchEngine(memory, [zt.Watch('a', f"{BASE + 0x200:#x}", 'int'),
+                                     zt.Watch('b', f"{BASE + 0x204:#x}", 'short')])
+    reads = engine.reads
+
+    assert engine.sample(list(engine.watches.values())) == {'a': 7, 'b': -3}
+    assert engine.reads == reads + 1
+    assert engine.sample([zt.Watch('gone', "0x1234")]) == {'gone': None}
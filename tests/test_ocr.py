@@ -0,0 +1,41 @@
+"""KeypadOCR tests against rendered fake displays"""
+import pytest
+
+
+@pytest.fixture
+def ocr(zt, fakes):
+    ocr = zt.KeypadOCR(fakes.render_fake_display(''), region=(0, 0, 147, 27))
+    for digit in '0123456789':
+        ocr.learn(digit, fakes.render_fake_display(digit))
+    return ocr
+
+
+@pytest.mark.parametrize('text', ['', '7', '0451', '12345678', '9090'])
+def test_reads_what_the_display_shows(fakes, ocr, text):
+    assert ocr.read(fakes.render_fake_display(text)) == text
+
+
+def test_ignores_a_cursor_and_rejects_unknown_glyphs(fakes, ocr):
+    frame = fakes.render_fake_display('42')
+    frame[22:24, 40:52] = (40, 255, 80)  # Underscore cursor after the digits
+    assert ocr.read(frame) == '42'
+
+    frame = fakes.render_fake_display('42')
+    frame[3:24, 40:55] = (40, 255, 80)  # Solid block
+    assert ocr.read(frame) is None
+
+
+def test_unlearned_reader_and_wrong_frame_size(zt, fakes, ocr):
+    assert zt.KeypadOCR(fakes.render_fake_display('')).read(fakes.render_fake_display('1')) is None
+    with pytest.raises(ValueError):
+        ocr.read(fakes.render_fake_display('1', cells=4))
+
+
+def test_templates_round_trip_for_their_region_only(zt, fakes, ocr, tmp_path):
+    path = str(tmp_path / 'keypad_glyphs.npz')
+    ocr.save(path)
+
+    loaded = zt.KeypadOCR.load(path, (0, 0, 147, 27))
+    assert loaded.read(fakes.render_fake_display('8675')) == '8675'
+    assert zt.KeypadOCR.load(path, (1, 0, 148, 27)) is None
+    assert zt.KeypadOCR.load(str(tmp_path / 'missing.npz')) is None
@@ -0,0 +1,205 @@
+"""Solver tests against SimulatedKeypad"""
+import time
+
+import pytest
+
+POSITIONS = [(i * 10, 5) for i in range(12)]
+
+
+class FlipDetector:
+    """Memory-watch stand-in - flip_time is set when the door opens"""
+    flip_time = None
+
+    def check(self):
+        return self.flip_time is not None
+
+
+def door_keypad(fakes, trainer, detector, opens_on):
+    """SimulatedKeypad whose door opens on the opens_on-th ENTER, inside enter_delay"""
+    # Like the watch sampler's on_flip, the flip stops the sweep and cuts run() short
+    class DoorKeypad(fakes.SimulatedKeypad):
+        def run(self, events, should_continue):
+            submitted = len(self.submitted)
+            finished = super().run(events, should_continue)
+            if len(self.submitted) > submitted == opens_on - 1:
+                detector.flip_time = time.perf_counter()
+                trainer._stop_on_success()
+                return False
+            return finished
+
+    return DoorKeypad(positions=POSITIONS)
+
+
+@pytest.mark.parametrize('verify', [False, True])
+def test_flip_inside_enter_delay_credits_the_entered_code(zt, fakes, trainer, verify):
+    detector = FlipDetector()
+    keypad = door_keypad(fakes, trainer, detector, opens_on=3)
+    trainer.success_detectors.append(detector)
+    trainer.display_reader = keypad if verify else None
+    plan = zt.ClickPlan(POSITIONS, 0.001, 0.05, 0.0, 0.001)
+
+    trainer.auto_clicking = True
+    trainer._screen_clicker_thread(plan, keypad)
+
+    assert len(keypad.submitted) == 3
+    assert trainer.last_successful_code == keypad.submitted[2]
+    assert keypad.submitted[2] in trainer.tried_index
+
+
+def test_resent_enter_is_not_retried(zt, fakes, trainer):
+    detector = FlipDetector()
+    keypad = door_keypad(fakes, trainer, detector, opens_on=2)
+    press = keypad._press
+
+    def drop_first_enter(key, dropped=[]):
+        if key == 'enter' and not dropped:
+            dropped.append(key)
+            keypad.last_press = keypad.clock
+            return
+        press(key)
+
+    keypad._press = drop_first_enter
+    trainer.success_detectors.append(detector)
+    trainer.display_reader = keypad
+    plan = zt.ClickPlan(POSITIONS, 0.001, 0.05, 0.0, 0.001)
+
+    trainer.auto_clicking = True
+    trainer._screen_clicker_thread(plan, keypad)
+
+    first, second = keypad.submitted
+    assert first != second
+    assert first in trainer.tried_index
+    assert trainer.verify_stats['enter_dropped'] == 1
+    assert trainer.last_successful_code == second
+
+
+def test_suspect_code_stays_untried(zt, fakes, trainer):
+    keypad = fakes.SimulatedKeypad(positions=POSITIONS)
+    press = keypad._press
+    stuck = []
+
+    def drop_first_code(key):
+        if not stuck:
+            stuck.append(trainer.keypad_code)
+        if trainer.keypad_code == stuck[0] and key != 'clear':
+            keypad.last_press = keypad.clock
+            return  # The first code's digits never reach the display
+        press(key)
+        if len(keypad.submitted) == 2:
+            trainer.auto_clicking = False
+
+    keypad._press = drop_first_code
+    trainer.display_reader = keypad
+    plan = zt.ClickPlan(POSITIONS, 0.001, 0.05, 0.0, 0.001)
+
+    trainer.auto_clicking = True
+    trainer._screen_clicker_thread(plan, keypad)
+
+    assert trainer.suspect_codes == stuck
+    assert stuck[0] not in trainer.tried_index
+    assert all(code in trainer.tried_index for code in keypad.submitted)
+
+
+def test_keyboard_clear_never_submits_a_partial_entry(zt, fakes, trainer):
+    keypad = fakes.SimulatedKeypad(drop_rate=0.1, seed=7)
+    submit = keypad._press
+
+    def stop_after_twenty(key):
+        submit(key)
+        if len(keypad.submitted) >= 20:
+            trainer.auto_clicking = False
+
+    keypad._press = stop_after_twenty
+    trainer.display_reader = keypad
+    plan = zt.KeyPlan(0.001, 0.05, 0.001)
+
+    trainer.auto_clicking = True
+    trainer._screen_clicker_thread(plan, keypad)
+
+    assert trainer.verify_stats['dropped'] > 0
+    assert len(keypad.submitted) >= 20
+    assert all(len(entry) == 4 for entry in keypad.submitted)
+
+
+def test_time_between_runs_does_not_shorten_the_hold(zt):
+    backend = zt.RecordingInputBackend(sleep=True)
+    plan = zt.ClickPlan(POSITIONS, 0.0, 0.0, 0.0, 0.02)
+    backend.run(plan.compile_digits('1'), lambda: True)
+    time.sleep(0.03)  # Detector checks, pacing, readback...
+    backend.run(plan.compile_digits('2'), lambda: True)
+
+    (down, *_), (up, *_) = backend.events[-2:]
+    assert up - down >= 0.02
+
+
+def test_cached_keypad_offset_skips_scan_after_relaunch(zt, fakes, monkeypatch):
+    """A relaunch of the same build - ImageBase rewritten by ASLR - reads the code from the cached offset"""
+    memory, extractor = fakes.make_fake_keypad_image('0451')
+    image = memory.blocks[0x400000]
+    image[0x94:0x96] = (0xE0).to_bytes(2, 'little')  # SizeOfOptionalHeader
+    image[0x98 + 56:0x98 + 60] = (len(image)).to_bytes(4, 'little')  # SizeOfImage
+
+    def make_trainer():
+        trainer = zt.ZombiUTrainer()
+        trainer.process_name = extractor.module
+        trainer.keypad_signature = extractor.signature.text
+        trainer.keypad_signature_operand = extractor.operand_offset
+        trainer.keypad_code_chain = '0x10'
+        trainer.try_manual_code = lambda code: None
+        return trainer
+
+    first = make_trainer()
+    try:
+        first._attach_offset_cache(memory)
+        assert first.keypad_global_offset is None
+        assert first.extract_keypad_code(memory) == '0451'
+        first.persistence.flush()
+    finally:
+        first.stop()
+
+    image[0x98 + 28:0x98 + 32] = (0x01230000).to_bytes(4, 'little')  # ImageBase
+    monkeypatch.setattr(zt.KeypadCodeExtractor, 'find_global',
+                        lambda self, memory: pytest.fail("scanned despite a cached offset"))
+    second = make_trainer()
+    try:
+        second._attach_offset_cache(memory)
+        assert second.keypad_global_offset == 0x3000
+        assert second.extract_keypad_code(memory) == '0451'
+    finally:
+        second.stop()
+
+
+def test_switching_code_length_keeps_tried_codes(trainer):
+    """Each code space keeps its own TRIED: bitmap in keypad_resume.txt across a switch and back"""
+    for n in range(50):
+        trainer.add_found_code(f"{n:04d}", "Tried")
+    trainer.code_length = 5
+    trainer._sync_code_space()
+    trainer.add_found_code("12345", "Tried")
+    trainer.save_keypad_resume()
+    trainer.persistence.flush()
+    trainer.code_length = 4
+    trainer._sync_code_space()
+    assert len(trainer.tried_index) == 50
+    trainer.save_keypad_resume()
+    trainer.persistence.flush()
+    trainer.code_length = 5
+    trainer._sync_code_space()
+    assert len(trainer.tried_index) == 1
+
+
+def test_settings_reload_keeps_queued_writes(trainer):
+    """The GUI's load_settings poll must not undo a settings write still on the persistence queue"""
+    trainer.persistence.flush()
+    with trainer.persistence.cond:  # Hold the writer so the update stays queued
+        trainer.taskbar_visible = False
+        trainer.save_taskbar_state()
+        trainer.code_constraints = '1??7'
+        trainer.save_settings_values(code_constraints='1??7')
+    trainer.load_settings()
+    assert trainer.taskbar_visible is False
+    assert trainer.code_constraints == '1??7'
+    trainer.persistence.flush()
+    trainer.load_settings()
+    assert trainer.taskbar_visible is False
+    assert trainer.code_constraints == '1??7'
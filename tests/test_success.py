@@ -0,0 +1,49 @@
+"""ScreenSuccessDetector tests against SyntheticFrameSource"""
+import numpy as np
+
+REGION = (10, 10, 30, 30)
+
+
+def frame(value):
+    return np.full((40, 40, 3), value, dtype=np.uint8)
+
+
+def test_detector_flags_a_lasting_change(zt, fakes):
+    source = fakes.SyntheticFrameSource(frame(20))
+    detector = zt.ScreenSuccessDetector(source, REGION, confirm_delay=0)
+    assert not detector.check()  # No reference yet
+
+    detector.capture_reference()
+    assert not detector.check()
+    source.frame = frame(200)
+    assert detector.difference() == 1.0
+    assert detector.check()
+
+
+def test_detector_ignores_small_and_partial_changes(zt, fakes):
+    source = fakes.SyntheticFrameSource(frame(20))
+    detector = zt.ScreenSuccessDetector(source, REGION, changed_fraction=0.2, confirm_delay=0)
+    detector.capture_reference()
+
+    source.frame = frame(50)  # Below pixel_threshold
+    assert not detector.check()
+    changed = frame(20)
+    changed[10:13, 10:30] = 255  # 15% of the region
+    source.frame = changed
+    assert detector.difference() == 0.15
+    assert not detector.check()
+
+
+def test_detector_needs_the_change_to_survive_confirmation(zt, fakes):
+    class FlashSource(fakes.SyntheticFrameSource):
+        """One bright frame, then back to normal"""
+        def grab(self, region):
+            grabbed = super().grab(region)
+            self.frame = frame(20)
+            return grabbed
+
+    source = FlashSource(frame(20))
+    detector = zt.ScreenSuccessDetector(source, REGION, confirm_delay=0.001)
+    detector.capture_reference()
+    source.frame = frame(200)
+    assert not detector.check()
@@ -0,0 +1,42 @@
+"""TelemetryRing tests - wraparound, read_telemetry order and rotation"""
+import math
+
+
+def test_ring_wraps_and_reads_oldest_first(zt, tmp_path):
+    path = str(tmp_path / 'telemetry.ring')
+    ring = zt.TelemetryRing(path, ['hp', 'door'], capacity=8)
+    for n in range(20):
+        ring.record_values(float(n), {'hp': n * 10, 'door': None if n % 2 else 1})
+    ring.close()
+
+    samples = [row for chunk in zt.read_telemetry(path, chunk=3) for row in chunk]
+    assert zt.telemetry_fields(path) == ['hp', 'door']
+    assert [row[0] for row in samples] == [float(n) for n in range(12, 20)]
+    assert [row[1] for row in samples] == [n * 10.0 for n in range(12, 20)]
+    assert [math.isnan(row[2]) for row in samples] == [n % 2 == 1 for n in range(12, 20)]
+
+
+def test_ring_before_wrapping_and_write(zt, tmp_path):
+    path = str(tmp_path / 'telemetry.ring')
+    ring = zt.TelemetryRing(path, ['a'], capacity=8)
+    ring.write(1.0, 5)
+    ring.write(2.0, None)
+    ring.close()
+    ring.write(3.0, 7)  # Closed - ignored
+
+    (chunk,) = zt.read_telemetry(path)
+    assert chunk.shape == (2, 2)
+    assert chunk[0].tolist() == [1.0, 5.0]
+    assert math.isnan(chunk[1][1])
+
+
+def test_reopening_keeps_the_previous_ring(zt, tmp_path):
+    path = str(tmp_path / 'telemetry.ring')
+    ring = zt.TelemetryRing(path, ['a'], capacity=4)
+    ring.write(1.0, 1)
+    ring.close()
+    zt.TelemetryRing(path, ['a'], capacity=4).close()
+
+    (previous,) = zt.read_telemetry(str(tmp_path / 'telemetry.prev.ring'))
+    assert previous.tolist() == [[1.0, 1.0]]
+    assert list(zt.read_telemetry(path)) == []